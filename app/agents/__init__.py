@@ -9,11 +9,27 @@ This package contains specialized AI agents for content creation:
 - CreativeAgent: Generates creative content ideas
 """
 
-from .writer_agent import WriterAgent
-from .editor_agent import EditorAgent
-from .seo_agent import SEOAgent
-from .research_agent import ResearchAgent
-from .creative_agent import CreativeAgent
+import importlib
+
+# Agent modules pull in crewai and langchain, so each one is imported only
+# when its agent class is first accessed
+_AGENTS = {
+    "WriterAgent": "writer_agent",
+    "EditorAgent": "editor_agent",
+    "SEOAgent": "seo_agent",
+    "ResearchAgent": "research_agent",
+    "CreativeAgent": "creative_agent"
+}
+
+
+def __getattr__(name: str):
+    if name in _AGENTS:
+        module = importlib.import_module(f".{_AGENTS[name]}", __name__)
+        cls = getattr(module, name)
+        globals()[name] = cls
+        return cls
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "WriterAgent",
@@ -5,17 +5,76 @@ This module provides the foundation for all specialized agents in the content st
 It includes common functionality like logging, error handling, and agent configuration.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, Optional, List
+import os
+import re
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, AsyncIterator, Iterator, Mapping, Tuple
 from crewai import Agent
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from langchain_openai import ChatOpenAI
+from openai import RateLimitError
 from app.config import settings
+from .batch_dispatcher import dispatch_sync, get_dispatcher
+from .keyword_scanner import KeywordScanner
+from .rate_limiter import RateLimiter
+from .response_cache import ResponseCache
+from .semantic_cache import get_semantic_cache
+
+# Retry policy for provider rate limits (HTTP 429)
+RATE_LIMIT_RETRIES = 5
+RATE_LIMIT_BASE_DELAY = 1.0
+
+# LLM sampling temperature shared by all agents
+LLM_TEMPERATURE = 0.7
+
+# Section header that numbers the items of a batched prompt and its response
+BATCH_ITEM_HEADER = "### ITEM {index}"
+_BATCH_ITEM_RE = re.compile(r'^[ \t]*(?:#{1,6}|\*\*)[ \t]*ITEM[ \t]+(\d+)\b.*$', re.MULTILINE | re.IGNORECASE)
+
+# Agent loggers keyed by agent name
+_LOGGER_CACHE: Dict[str, logging.Logger] = {}
+
+
+def _get_logger(name: str) -> logging.Logger:
+    """Get the logger for an agent, building its name only once"""
+    logger = _LOGGER_CACHE.get(name)
+    if logger is None:
+        logger = _LOGGER_CACHE[name] = logging.getLogger(f"agent.{name.lower()}")
+    return logger
+
+
+@lru_cache(maxsize=8)
+def _get_llm(model: str, api_key: str, temperature: float) -> ChatOpenAI:
+    """Get a shared OpenAI chat client so agents reuse one connection pool"""
+    return ChatOpenAI(
+        model=model,
+        api_key=api_key,
+        temperature=temperature
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_response_cache(max_entries: int, ttl: int, path: Optional[str]) -> ResponseCache:
+    """Get the process-wide response cache; keys include the agent name, so agents can share it"""
+    return ResponseCache(max_entries=max_entries, ttl=ttl, path=path)
+
+
+@lru_cache(maxsize=1)
+def _get_rate_limiter(rate: int) -> RateLimiter:
+    """Get the process-wide LLM rate limiter; all agents share the provider's limit"""
+    return RateLimiter(rate, per=60.0)
 
 
 class BaseAgent:
     """Base class for all content creation agents"""
     
-    def __init__(self, name: str, role: str, goal: str, verbose: bool = True):
+    # Minimum similarity for semantic cache hits; None uses the configured threshold
+    SEMANTIC_CACHE_THRESHOLD: Optional[float] = None
+    
+    def __init__(self, name: str, role: str, goal: str, verbose: bool = True, stream: bool = False):
         """
         Initialize base agent
         
@@ -24,19 +83,17 @@ class BaseAgent:
             role: Agent role description
             goal: Agent's primary goal
             verbose: Whether to enable verbose logging
+            stream: Whether to stream responses and parse them line by line as they arrive
         """
         self.name = name
         self.role = role
         self.goal = goal
         self.verbose = verbose
-        self.logger = logging.getLogger(f"agent.{name.lower()}")
+        self.stream = stream
+        self.logger = _get_logger(name)
         
-        # Initialize OpenAI LLM
-        self.llm = ChatOpenAI(
-            model=settings.openai_model,
-            api_key=settings.openai_api_key,
-            temperature=0.7
-        )
+        # Shared OpenAI LLM client
+        self.llm = _get_llm(settings.openai_model, settings.openai_api_key, LLM_TEMPERATURE)
         
         # Create CrewAI agent
         self.agent = Agent(
@@ -46,49 +103,436 @@ class BaseAgent:
             llm=self.llm,
             allow_delegation=False
         )
+        
+        # Role and goal are fixed for the agent's lifetime, so the system
+        # message for direct LLM calls is built once
+        self._system = SystemMessage(content=f"Role: {role}\nGoal: {goal}")
+        
+        # Optional exact-match cache for repeated prompts
+        self.response_cache = None
+        if settings.response_cache_enabled:
+            self.response_cache = _get_response_cache(
+                settings.response_cache_size,
+                settings.response_cache_ttl,
+                settings.response_cache_path
+            )
+        
+        # Optional semantic cache for paraphrased prompts, shared by agents of
+        # the same class since responses depend on the agent's role
+        self.semantic_cache = None
+        if settings.semantic_cache_enabled:
+            namespace = type(self).__name__
+            cache_path = None
+            if settings.semantic_cache_dir:
+                cache_path = os.path.join(settings.semantic_cache_dir, namespace.lower())
+            self.semantic_cache = get_semantic_cache(
+                namespace,
+                threshold=self.SEMANTIC_CACHE_THRESHOLD or settings.semantic_cache_threshold,
+                max_entries=settings.semantic_cache_size,
+                path=cache_path,
+                ltm_entries=settings.semantic_cache_ltm_size
+            )
+        
+        # Optional client-side limit on LLM requests per minute
+        self.rate_limiter = None
+        if settings.llm_rate_limit > 0:
+            self.rate_limiter = _get_rate_limiter(settings.llm_rate_limit)
     
-    def execute_task(self, task_description: str, context: Optional[Dict[str, Any]] = None) -> str:
+    def execute_task(self,
+                     task_description: str,
+                     context: Optional[Dict[str, Any]] = None,
+                     semantic: bool = True,
+                     semantic_key: Optional[Tuple[str, str]] = None) -> str:
         """
         Execute a task with the agent
         
         Args:
             task_description: Description of the task to execute
             context: Additional context for the task
+            semantic: Whether a response to a paraphrased prompt may be reused
+            semantic_key: Semantic cache key from SemanticCache.key; the full prompt if None
             
         Returns:
             str: Task execution result
         """
         try:
-            self.logger.info(f"Executing task: {task_description}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Executing task: %s", task_description)
             
             # Prepare task input
             task_input = task_description
             if context:
                 task_input += f"\n\nContext: {context}"
             
+            # Serve repeated and paraphrased prompts from the caches
+            cached, embedding = self._cache_lookup(task_input, semantic, semantic_key)
+            if cached is not None:
+                return cached
+            
             # Execute task using CrewAI agent
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
             result = self.agent.execute_task(task_input)
+            self._cache_store(task_input, embedding, result)
             
-            self.logger.info(f"Task completed successfully")
+            if self.verbose:
+                self.logger.info("Task completed successfully")
             return result
             
         except Exception as e:
-            self.logger.error(f"Error executing task: {str(e)}")
+            self.logger.error("Error executing task: %s", e)
             raise
     
-    def get_agent_info(self) -> Dict[str, Any]:
+    def execute_task_fast(self,
+                          task_description: str,
+                          semantic: bool = True,
+                          semantic_key: Optional[Tuple[str, str]] = None) -> str:
         """
-        Get agent information
+        Execute a single-prompt task directly against the LLM
         
+        Skips the CrewAI task plumbing, which only adds overhead when the
+        task is one prompt and one response. Use execute_task for
+        multi-step CrewAI flows.
+        
+        Args:
+            task_description: Description of the task to execute
+            semantic: Whether a response to a paraphrased prompt may be reused
+            semantic_key: Semantic cache key from SemanticCache.key; the full prompt if None
+            
         Returns:
-            Dict containing agent details
+            str: Task execution result
+        """
+        cached, embedding = self._cache_lookup(task_description, semantic, semantic_key)
+        if cached is not None:
+            return cached
+        
+        messages = [self._system, HumanMessage(content=task_description)]
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        try:
+            if settings.batch_dispatch_enabled:
+                # Coalesce with concurrent calls from other threads
+                response = dispatch_sync(
+                    self.llm, messages, settings.batch_max_size, settings.batch_max_wait_ms / 1000
+                )
+            else:
+                response = self.llm.invoke(messages)
+            result = response.content
+        except Exception as e:
+            self.logger.error("Error executing task: %s", e)
+            raise
+        
+        self._cache_store(task_description, embedding, result)
+        return result
+    
+    async def aexecute_task(self,
+                            task_description: str,
+                            semantic: bool = True,
+                            semantic_key: Optional[Tuple[str, str]] = None) -> str:
+        """
+        Execute a task asynchronously, retrying on rate limit errors
+        
+        Args:
+            task_description: Description of the task to execute
+            semantic: Whether a response to a paraphrased prompt may be reused
+            semantic_key: Semantic cache key from SemanticCache.key; the full prompt if None
+            
+        Returns:
+            str: Task execution result
+        """
+        cached, embedding = self._cache_lookup(task_description, semantic, semantic_key)
+        if cached is not None:
+            return cached
+        
+        messages = self._build_messages(task_description)
+        
+        delay = RATE_LIMIT_BASE_DELAY
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            if self.rate_limiter is not None:
+                await self.rate_limiter.aacquire()
+            try:
+                if settings.batch_dispatch_enabled:
+                    dispatcher = get_dispatcher(self.llm, settings.batch_max_size, settings.batch_max_wait_ms / 1000)
+                    response = await dispatcher.submit(messages)
+                else:
+                    response = await self.llm.ainvoke(messages)
+                break
+            except RateLimitError:
+                if attempt == RATE_LIMIT_RETRIES:
+                    self.logger.error("Rate limit retries exhausted")
+                    raise
+                self.logger.warning("Rate limited, retrying in %.1fs", delay)
+                await asyncio.sleep(delay)
+                delay *= 2
+        
+        result = response.content
+        self._cache_store(task_description, embedding, result)
+        return result
+    
+    def stream_task(self,
+                    task_description: str,
+                    semantic: bool = True,
+                    semantic_key: Optional[Tuple[str, str]] = None) -> Iterator[str]:
+        """
+        Execute a task while streaming the response line by line
+        
+        Lines are yielded as soon as they are complete, so callers can parse
+        the response while the rest is still being generated. Joining the
+        yielded lines with newlines reproduces the full response.
+        
+        Args:
+            task_description: Description of the task to execute
+            semantic: Whether a response to a paraphrased prompt may be reused
+            semantic_key: Semantic cache key from SemanticCache.key; the full prompt if None
+            
+        Yields:
+            str: Each line of the response
+        """
+        cached, embedding = self._cache_lookup(task_description, semantic, semantic_key)
+        if cached is not None:
+            yield from cached.split('\n')
+            return
+        
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        
+        lines = []
+        buffer = ""
+        for chunk in self.llm.stream(self._build_messages(task_description)):
+            buffer += chunk.content
+            if "\n" in buffer:
+                *complete, buffer = buffer.split('\n')
+                for line in complete:
+                    lines.append(line)
+                    yield line
+        lines.append(buffer)
+        yield buffer
+        
+        self._cache_store(task_description, embedding, '\n'.join(lines))
+    
+    async def astream_task(self,
+                           task_description: str,
+                           semantic: bool = True,
+                           semantic_key: Optional[Tuple[str, str]] = None) -> AsyncIterator[str]:
+        """
+        Execute a task asynchronously while streaming the response line by line
+        
+        The async counterpart of stream_task: lines are yielded as soon as
+        they are complete, and joining them with newlines reproduces the full
+        response.
+        
+        Args:
+            task_description: Description of the task to execute
+            semantic: Whether a response to a paraphrased prompt may be reused
+            semantic_key: Semantic cache key from SemanticCache.key; the full prompt if None
+            
+        Yields:
+            str: Each line of the response
         """
-        return {
+        cached, embedding = self._cache_lookup(task_description, semantic, semantic_key)
+        if cached is not None:
+            for line in cached.split('\n'):
+                yield line
+            return
+        
+        if self.rate_limiter is not None:
+            await self.rate_limiter.aacquire()
+        
+        lines = []
+        buffer = ""
+        async for chunk in self.llm.astream(self._build_messages(task_description)):
+            buffer += chunk.content
+            if "\n" in buffer:
+                *complete, buffer = buffer.split('\n')
+                for line in complete:
+                    lines.append(line)
+                    yield line
+        lines.append(buffer)
+        yield buffer
+        
+        self._cache_store(task_description, embedding, '\n'.join(lines))
+    
+    def execute_task_scanned(self,
+                             task_description: str,
+                             scanner: KeywordScanner,
+                             buckets: Tuple[str, ...],
+                             semantic: bool = True,
+                             semantic_key: Optional[Tuple[str, str]] = None) -> Tuple[str, Optional[Dict[str, List[str]]]]:
+        """
+        Execute a task, classifying its lines as they stream in when streaming is enabled
+        
+        Args:
+            task_description: Description of the task to execute
+            scanner: Keyword scanner that classifies the response lines
+            buckets: Names of the buckets to collect while streaming
+            semantic: Whether a response to a paraphrased prompt may be reused
+            semantic_key: Semantic cache key from SemanticCache.key; the full prompt if None
+            
+        Returns:
+            Tuple of the raw result and its classified lines (None when not streaming)
+        """
+        if not self.stream:
+            return self.execute_task_fast(task_description, semantic, semantic_key), None
+        
+        lines = []
+        found = {name: [] for name in buckets}
+        for line in self.stream_task(task_description, semantic, semantic_key):
+            lines.append(line)
+            scanner.scan_line(line, buckets, found)
+        return '\n'.join(lines), found
+    
+    def _cache_lookup(self,
+                      task_description: str,
+                      semantic: bool = True,
+                      semantic_key: Optional[Tuple[str, str]] = None) -> Tuple[Optional[str], Any]:
+        """
+        Look up a cached response, trying the exact-match cache first
+        
+        The exact-match cache is always keyed by the full prompt.
+        
+        Args:
+            task_description: Full task prompt
+            semantic: Whether to fall back to the semantic cache
+            semantic_key: Semantic cache key from SemanticCache.key; the full prompt if None
+            
+        Returns:
+            Tuple of the cached response (None on a miss) and the semantic cache embedding
+        """
+        if self.response_cache is not None:
+            cached = self.response_cache.get(self._response_key(task_description))
+            if cached is not None:
+                self.logger.info("Task served from response cache")
+                return cached, None
+        
+        embedding = None
+        if semantic and self.semantic_cache is not None:
+            if semantic_key is None:
+                cached, embedding = self.semantic_cache.lookup(task_description)
+            else:
+                cached, embedding = self.semantic_cache.lookup(*semantic_key)
+            if cached is not None:
+                self.logger.info("Task served from semantic cache")
+                return cached, embedding
+        return None, embedding
+    
+    def _cache_store(self, task_description: str, embedding: Any, result: str):
+        """
+        Store a fresh LLM response in the enabled caches
+        
+        Args:
+            task_description: Full task prompt
+            embedding: Semantic cache embedding returned by _cache_lookup, if any
+            result: LLM response
+        """
+        if self.response_cache is not None:
+            self.response_cache.set(self._response_key(task_description), result)
+        if embedding is not None:
+            self.semantic_cache.add(embedding, result)
+    
+    def _response_key(self, task_description: str) -> str:
+        """Build the exact-match cache key for a task prompt"""
+        return ResponseCache.key(task_description, self.name, settings.openai_model, LLM_TEMPERATURE)
+    
+    def _format_batch_items(self, items: List[str]) -> str:
+        """
+        Number the items of a batched prompt with section headers
+        
+        Args:
+            items: Item texts
+            
+        Returns:
+            str: Items joined under their numbered headers
+        """
+        return "\n\n".join(
+            f"{BATCH_ITEM_HEADER.format(index=index)}\n{item}" for index, item in enumerate(items, 1)
+        )
+    
+    def _split_batch_result(self, result: str, count: int) -> List[Optional[str]]:
+        """
+        Split a batched response into its per-item sections
+        
+        Args:
+            result: Raw batched response
+            count: Number of items in the batch
+            
+        Returns:
+            List of section texts in item order, None for items the response skipped
+        """
+        sections: List[Optional[str]] = [None] * count
+        matches = list(_BATCH_ITEM_RE.finditer(result))
+        for match, following in zip(matches, matches[1:] + [None]):
+            index = int(match.group(1)) - 1
+            end = following.start() if following is not None else len(result)
+            if 0 <= index < count and sections[index] is None:
+                sections[index] = result[match.end():end].strip()
+        return sections
+    
+    def _build_messages(self, task_description: str) -> List[BaseMessage]:
+        """
+        Build chat messages for a direct LLM call
+        
+        Args:
+            task_description: Description of the task to execute
+            
+        Returns:
+            List of system and user messages
+        """
+        return [
+            self._system,
+            HumanMessage(content=task_description)
+        ]
+    
+    async def execute_tasks_batch(self,
+                                  task_descriptions: List[str],
+                                  max_concurrency: int = 10,
+                                  semantic: bool = True,
+                                  semantic_keys: Optional[List[Optional[Tuple[str, str]]]] = None) -> List[str]:
+        """
+        Execute several independent tasks concurrently
+        
+        Args:
+            task_descriptions: Descriptions of the tasks to execute
+            max_concurrency: Maximum number of in-flight LLM requests
+            semantic: Whether responses to paraphrased prompts may be reused
+            semantic_keys: Semantic cache keys, one per task; the full prompts if None
+            
+        Returns:
+            List of task results in input order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        if semantic_keys is None:
+            semantic_keys = [None] * len(task_descriptions)
+        
+        async def run(task_description: str, semantic_key: Optional[Tuple[str, str]]) -> str:
+            async with semaphore:
+                return await self.aexecute_task(task_description, semantic, semantic_key)
+        
+        self.logger.info("Executing batch of %d tasks", len(task_descriptions))
+        return await asyncio.gather(*(run(task, key) for task, key in zip(task_descriptions, semantic_keys)))
+    
+    @cached_property
+    def agent_info(self) -> Mapping[str, Any]:
+        """
+        Agent information, built once per agent
+        
+        Returns:
+            Read-only mapping of agent details
+        """
+        return MappingProxyType({
             "name": self.name,
             "role": self.role,
             "goal": self.goal,
             "verbose": self.verbose
-        }
+        })
+    
+    def get_agent_info(self) -> Dict[str, Any]:
+        """
+        Get agent information
+        
+        Returns:
+            Dict containing agent details
+        """
+        return dict(self.agent_info)
     
     def validate_input(self, input_data: Any) -> bool:
         """
@@ -105,6 +549,25 @@ class BaseAgent:
             return False
         return True
     
+    @staticmethod
+    def _split_lines(text: str) -> List[Tuple[str, str]]:
+        """
+        Split text into lines paired with their lowercased form
+        
+        The text is lowercased once, so extractors that share the lines do
+        not lowercase each line again.
+        
+        Args:
+            text: Raw text to split
+            
+        Returns:
+            List of (line, lowercased line) tuples
+        """
+        # Blank output has no lines worth classifying
+        if not text or text.isspace():
+            return []
+        return list(zip(text.split('\n'), text.lower().split('\n')))
+    
     def preprocess_input(self, input_data: str) -> str:
         """
         Preprocess input data before task execution
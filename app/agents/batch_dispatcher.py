@@ -0,0 +1,149 @@
+"""
+Batch Dispatcher for AI Content Studio
+
+This module coalesces LLM requests that arrive close together into batches.
+Requests are queued, and a worker drains up to max_batch of them (or whatever
+arrived within max_wait seconds) and sends them to the LLM as one batch call,
+so concurrent agent calls share the client's connection pool and concurrency
+limits instead of competing for them one by one.
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from langchain_core.messages import BaseMessage
+
+
+class BatchDispatcher:
+    """Coalesces concurrent LLM requests on one event loop into batch calls"""
+    
+    def __init__(self, llm: Any, max_batch: int = 16, max_wait: float = 0.05):
+        """
+        Initialize batch dispatcher
+        
+        Args:
+            llm: Chat model supporting abatch
+            max_batch: Maximum number of requests sent in one batch
+            max_wait: Seconds to wait for more requests before sending a batch
+        """
+        self.llm = llm
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: "asyncio.Queue[Tuple[List[BaseMessage], asyncio.Future]]" = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+        
+        # In-flight batch tasks, referenced so they are not garbage collected
+        self._pending: Set[asyncio.Task] = set()
+    
+    async def submit(self, messages: List[BaseMessage]) -> Any:
+        """
+        Queue a request and wait for its response
+        
+        Args:
+            messages: Chat messages for the request
+            
+        Returns:
+            The LLM response message
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((messages, future))
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._drain())
+        return await future
+    
+    async def _drain(self):
+        """Collect queued requests into batches until the queue is empty"""
+        loop = asyncio.get_running_loop()
+        while not self._queue.empty():
+            batch = [self._queue.get_nowait()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            # Send the batch without blocking collection of the next one
+            task = asyncio.create_task(self._dispatch(batch))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+    
+    async def _dispatch(self, batch: List[Tuple[List[BaseMessage], asyncio.Future]]):
+        """Send one batch and resolve the futures of its requests"""
+        try:
+            responses = await self.llm.abatch([messages for messages, _ in batch], return_exceptions=True)
+        except Exception as e:
+            responses = [e] * len(batch)
+        
+        for (_, future), response in zip(batch, responses):
+            if future.done():
+                continue
+            if isinstance(response, Exception):
+                future.set_exception(response)
+            else:
+                future.set_result(response)
+
+
+# Dispatchers per event loop, keyed by the id of the LLM client they batch for
+_DISPATCHERS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[int, BatchDispatcher]]" = weakref.WeakKeyDictionary()
+
+# Event loop thread that batches requests from synchronous callers
+_BACKGROUND_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_BACKGROUND_LOCK = threading.Lock()
+
+
+def get_dispatcher(llm: Any, max_batch: int = 16, max_wait: float = 0.05) -> BatchDispatcher:
+    """
+    Get the dispatcher for an LLM client on the running event loop
+    
+    Args:
+        llm: Chat model supporting abatch
+        max_batch: Maximum number of requests sent in one batch
+        max_wait: Seconds to wait for more requests before sending a batch
+    
+    Returns:
+        BatchDispatcher: Dispatcher shared by all callers on this loop
+    """
+    dispatchers = _DISPATCHERS.setdefault(asyncio.get_running_loop(), {})
+    dispatcher = dispatchers.get(id(llm))
+    if dispatcher is None:
+        dispatcher = dispatchers[id(llm)] = BatchDispatcher(llm, max_batch, max_wait)
+    return dispatcher
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Start the background event loop thread on first use"""
+    global _BACKGROUND_LOOP
+    with _BACKGROUND_LOCK:
+        if _BACKGROUND_LOOP is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="llm-batch-dispatcher", daemon=True).start()
+            _BACKGROUND_LOOP = loop
+        return _BACKGROUND_LOOP
+
+
+def dispatch_sync(llm: Any, messages: List[BaseMessage], max_batch: int = 16, max_wait: float = 0.05) -> Any:
+    """
+    Send a request from synchronous code through the background dispatcher
+    
+    Requests from different threads (e.g. concurrent web requests) are
+    batched together on the background event loop.
+    
+    Args:
+        llm: Chat model supporting abatch
+        messages: Chat messages for the request
+        max_batch: Maximum number of requests sent in one batch
+        max_wait: Seconds to wait for more requests before sending a batch
+    
+    Returns:
+        The LLM response message
+    """
+    async def submit():
+        return await get_dispatcher(llm, max_batch, max_wait).submit(messages)
+    
+    return asyncio.run_coroutine_threadsafe(submit(), _get_background_loop()).result()
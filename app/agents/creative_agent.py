@@ -5,50 +5,48 @@ This agent specializes in generating creative content ideas, brainstorming,
 and innovative approaches to content creation.
 """
 
-from typing import Dict, Any, Optional, List
+import asyncio
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Any, Optional, List, Tuple
 from .base_agent import BaseAgent
+from .keyword_scanner import KeywordScanner
+from .results import HeadlinesResult, HooksResult, IdeasResult, SeriesResult, ViralConceptsResult
+from .schemas import CreativeRequest, IdeasRequest
 
 
 class CreativeAgent(BaseAgent):
     """Agent specialized in creative content ideation"""
     
-    def __init__(self, verbose: bool = True):
-        """
-        Initialize Creative Agent
-        
-        Args:
-            verbose: Whether to enable verbose logging
-        """
-        super().__init__(
-            name="Creative Specialist",
-            role="Expert creative content strategist with extensive experience in brainstorming, ideation, and innovative content approaches. Specializes in generating unique, engaging, and viral-worthy content ideas.",
-            goal="Generate innovative, creative, and engaging content ideas that capture audience attention, drive engagement, and stand out in the digital landscape.",
-            verbose=verbose
-        )
+    # Role and goal are interned once at class load and shared by every instance
+    ROLE = sys.intern("Expert creative content strategist with extensive experience in brainstorming, ideation, and innovative content approaches. Specializes in generating unique, engaging, and viral-worthy content ideas.")
+    GOAL = sys.intern("Generate innovative, creative, and engaging content ideas that capture audience attention, drive engagement, and stand out in the digital landscape.")
     
-    def generate_content_ideas(self, 
-                              topic: str,
-                              content_type: str = "article",
-                              target_audience: str = "general",
-                              idea_count: int = 10,
-                              creativity_level: str = "high") -> Dict[str, Any]:
-        """
-        Generate creative content ideas for a topic
-        
-        Args:
-            topic: Main topic for content ideas
-            content_type: Type of content to generate ideas for
-            target_audience: Target audience
-            idea_count: Number of ideas to generate
-            creativity_level: Level of creativity (low, medium, high)
-            
-        Returns:
-            Dict containing creative content ideas
-        """
-        if not self.validate_input(topic):
-            raise ValueError("Topic cannot be empty")
-        
-        task_description = f"""
+    # Keywords used to classify lines of LLM output (matched against lowercased lines)
+    _KEYWORDS = {
+        "ideas": ("idea", "concept", "approach", "angle"),
+        "creative_angles": ("angle", "perspective", "viewpoint", "approach"),
+        "engagement": ("engagement", "viral", "shareable", "interactive"),
+        "headlines": ("headline", "title", "how to", "why", "what"),
+        "headline_styles": ("style", "type", "format", "category"),
+        "click_through": ("click", "ctr", "potential", "appeal"),
+        "hooks": ("hook", "opening", "intro", "start"),
+        "hook_types": ("story", "statistic", "question", "anecdote"),
+        "emotional_impact": ("emotional", "feeling", "impact", "response"),
+        "concepts": ("concept", "idea", "campaign", "challenge"),
+        "viral_scores": ("score", "viral", "potential", "rating"),
+        "emotional_triggers": ("joy", "anger", "surprise", "fear", "emotion"),
+        "series_concept": ("concept", "theme"),
+        "series_parts": ("part", "piece", "episode", "chapter"),
+        "series_flow": ("flow", "progression", "sequence", "order")
+    }
+    
+    # Compiled once at class load
+    _SCANNER = KeywordScanner(_KEYWORDS)
+    
+    # Static prompt bodies, formatted per call by the _*_task builders
+    _IDEAS_TEMPLATE = """
         Generate {idea_count} {creativity_level}-creativity content ideas for a {content_type} about "{topic}" targeting {target_audience} audience.
         
         Please provide:
@@ -71,28 +69,8 @@ class CreativeAgent(BaseAgent):
         - Implementation difficulty
         - Expected impact
         """
-        
-        result = self.execute_task(task_description)
-        return self._parse_ideas_result(result, topic)
     
-    def brainstorm_headlines(self, 
-                           topic: str,
-                           content_type: str = "article",
-                           headline_count: int = 15,
-                           headline_style: str = "clickbait") -> Dict[str, Any]:
-        """
-        Brainstorm creative headlines for content
-        
-        Args:
-            topic: Topic for headlines
-            content_type: Type of content
-            headline_count: Number of headlines to generate
-            headline_style: Style of headlines (clickbait, professional, creative, etc.)
-            
-        Returns:
-            Dict containing headline ideas
-        """
-        task_description = f"""
+    _HEADLINES_TEMPLATE = """
         Generate {headline_count} {headline_style} headlines for a {content_type} about "{topic}".
         
         Headline styles to consider:
@@ -115,26 +93,8 @@ class CreativeAgent(BaseAgent):
         - SEO friendliness
         - Brand safety
         """
-        
-        result = self.execute_task(task_description)
-        return self._parse_headlines_result(result)
     
-    def create_content_hooks(self, 
-                            topic: str,
-                            hook_count: int = 10,
-                            hook_type: str = "opening") -> Dict[str, Any]:
-        """
-        Create engaging content hooks
-        
-        Args:
-            topic: Topic for hooks
-            hook_count: Number of hooks to generate
-            hook_type: Type of hook (opening, social media, email, etc.)
-            
-        Returns:
-            Dict containing hook ideas
-        """
-        task_description = f"""
+    _HOOKS_TEMPLATE = """
         Create {hook_count} engaging {hook_type} hooks for content about "{topic}".
         
         Hook types to consider:
@@ -156,26 +116,8 @@ class CreativeAgent(BaseAgent):
         - Engagement potential
         - Relevance to topic
         """
-        
-        result = self.execute_task(task_description)
-        return self._parse_hooks_result(result)
     
-    def generate_viral_concepts(self, 
-                               topic: str,
-                               platform: str = "general",
-                               concept_count: int = 8) -> Dict[str, Any]:
-        """
-        Generate viral content concepts
-        
-        Args:
-            topic: Topic for viral concepts
-            platform: Target platform (social media, blog, video, etc.)
-            concept_count: Number of concepts to generate
-            
-        Returns:
-            Dict containing viral concept ideas
-        """
-        task_description = f"""
+    _VIRAL_CONCEPTS_TEMPLATE = """
         Generate {concept_count} viral content concepts for "{topic}" on {platform} platform.
         
         Viral elements to consider:
@@ -198,26 +140,8 @@ class CreativeAgent(BaseAgent):
         - Implementation strategy
         - Expected reach
         """
-        
-        result = self.execute_task(task_description)
-        return self._parse_viral_concepts_result(result)
     
-    def create_content_series(self, 
-                             topic: str,
-                             series_length: int = 5,
-                             content_type: str = "article") -> Dict[str, Any]:
-        """
-        Create content series concepts
-        
-        Args:
-            topic: Main topic for series
-            series_length: Number of pieces in series
-            content_type: Type of content
-            
-        Returns:
-            Dict containing series concept
-        """
-        task_description = f"""
+    _SERIES_TEMPLATE = """
         Create a {series_length}-part {content_type} series about "{topic}".
         
         Series structure to consider:
@@ -240,231 +164,496 @@ class CreativeAgent(BaseAgent):
         - Cross-promotion strategies
         - Series completion incentives
         """
+    
+    def __init__(self, verbose: bool = True, stream: bool = False):
+        """
+        Initialize Creative Agent
+        
+        Args:
+            verbose: Whether to enable verbose logging
+            stream: Whether to stream responses and parse them line by line as they arrive
+        """
+        super().__init__(
+            name="Creative Specialist",
+            role=self.ROLE,
+            goal=self.GOAL,
+            verbose=verbose,
+            stream=stream
+        )
+    
+    def generate_content_ideas(self, 
+                              topic: str,
+                              content_type: str = "article",
+                              target_audience: str = "general",
+                              idea_count: int = 10,
+                              creativity_level: str = "high") -> IdeasResult:
+        """
+        Generate creative content ideas for a topic
+        
+        Args:
+            topic: Main topic for content ideas
+            content_type: Type of content to generate ideas for
+            target_audience: Target audience
+            idea_count: Number of ideas to generate
+            creativity_level: Level of creativity (low, medium, high)
+            
+        Returns:
+            Result containing creative content ideas
+        """
+        return self.generate_ideas_from_request(IdeasRequest(
+            topic=topic,
+            content_type=content_type,
+            target_audience=target_audience,
+            idea_count=idea_count,
+            creativity_level=creativity_level
+        ))
+    
+    def generate_ideas_from_request(self, request: IdeasRequest) -> IdeasResult:
+        """
+        Generate creative content ideas for an already validated request
+        
+        Args:
+            request: Ideas request
+            
+        Returns:
+            Result containing creative content ideas
+        """
+        task_description = self._ideas_task(
+            request.topic,
+            request.content_type,
+            request.target_audience,
+            request.idea_count,
+            request.creativity_level
+        )
+        
+        result, found = self._run(task_description, "ideas", "creative_angles", "engagement")
+        return self._parse_ideas_result(result, request.topic, found)
+    
+    def generate_content_ideas_batch(self,
+                                     topics: List[str],
+                                     content_type: str = "article",
+                                     target_audience: str = "general",
+                                     idea_count: int = 10,
+                                     creativity_level: str = "high",
+                                     max_concurrency: int = 5) -> List[IdeasResult]:
+        """
+        Generate creative content ideas for several topics with concurrent LLM calls
+        
+        Uses asyncio.run, so it cannot be called while an event loop is
+        running; use agenerate_content_ideas_batch from async code.
+        
+        Args:
+            topics: Main topics for content ideas
+            content_type: Type of content to generate ideas for
+            target_audience: Target audience
+            idea_count: Number of ideas to generate per topic
+            creativity_level: Level of creativity (low, medium, high)
+            max_concurrency: Maximum number of in-flight LLM requests
+            
+        Returns:
+            List of content ideas results in input order
+        """
+        return asyncio.run(self.agenerate_content_ideas_batch(
+            topics, content_type, target_audience, idea_count, creativity_level, max_concurrency
+        ))
+    
+    async def agenerate_content_ideas_batch(self,
+                                            topics: List[str],
+                                            content_type: str = "article",
+                                            target_audience: str = "general",
+                                            idea_count: int = 10,
+                                            creativity_level: str = "high",
+                                            max_concurrency: int = 5) -> List[IdeasResult]:
+        """
+        Generate creative content ideas for several topics without blocking the event loop
+        
+        Args:
+            topics: Main topics for content ideas
+            content_type: Type of content to generate ideas for
+            target_audience: Target audience
+            idea_count: Number of ideas to generate per topic
+            creativity_level: Level of creativity (low, medium, high)
+            max_concurrency: Maximum number of in-flight LLM requests
+            
+        Returns:
+            List of content ideas results in input order
+        """
+        # Validate every request before any LLM call is made
+        requests = [
+            IdeasRequest(
+                topic=topic,
+                content_type=content_type,
+                target_audience=target_audience,
+                idea_count=idea_count,
+                creativity_level=creativity_level
+            )
+            for topic in topics
+        ]
+        prompts = [
+            self._ideas_task(
+                request.topic,
+                request.content_type,
+                request.target_audience,
+                request.idea_count,
+                request.creativity_level
+            )
+            for request in requests
+        ]
+        results = await self.execute_tasks_batch(prompts, max_concurrency=max_concurrency, semantic=False)
+        return [self._parse_ideas_result(result, request.topic) for request, result in zip(requests, results)]
+    
+    def brainstorm_headlines(self, 
+                           topic: str,
+                           content_type: str = "article",
+                           headline_count: int = 15,
+                           headline_style: str = "clickbait") -> HeadlinesResult:
+        """
+        Brainstorm creative headlines for content
+        
+        Args:
+            topic: Topic for headlines
+            content_type: Type of content
+            headline_count: Number of headlines to generate
+            headline_style: Style of headlines (clickbait, professional, creative, etc.)
+            
+        Returns:
+            Result containing headline ideas
+        """
+        task_description = self._headlines_task(topic, content_type, headline_count, headline_style)
+        
+        result, found = self._run(task_description, "headlines", "headline_styles", "click_through")
+        return self._parse_headlines_result(result, found)
+    
+    def create_content_hooks(self, 
+                            topic: str,
+                            hook_count: int = 10,
+                            hook_type: str = "opening") -> HooksResult:
+        """
+        Create engaging content hooks
+        
+        Args:
+            topic: Topic for hooks
+            hook_count: Number of hooks to generate
+            hook_type: Type of hook (opening, social media, email, etc.)
+            
+        Returns:
+            Result containing hook ideas
+        """
+        task_description = self._hooks_task(topic, hook_count, hook_type)
+        
+        result, found = self._run(task_description, "hooks", "hook_types", "emotional_impact")
+        return self._parse_hooks_result(result, found)
+    
+    def generate_viral_concepts(self, 
+                               topic: str,
+                               platform: str = "general",
+                               concept_count: int = 8) -> ViralConceptsResult:
+        """
+        Generate viral content concepts
+        
+        Args:
+            topic: Topic for viral concepts
+            platform: Target platform (social media, blog, video, etc.)
+            concept_count: Number of concepts to generate
+            
+        Returns:
+            Result containing viral concept ideas
+        """
+        task_description = self._viral_concepts_task(topic, platform, concept_count)
+        
+        result, found = self._run(task_description, "concepts", "viral_scores", "emotional_triggers")
+        return self._parse_viral_concepts_result(result, found)
+    
+    def create_content_series(self, 
+                             topic: str,
+                             series_length: int = 5,
+                             content_type: str = "article") -> SeriesResult:
+        """
+        Create content series concepts
+        
+        Args:
+            topic: Main topic for series
+            series_length: Number of pieces in series
+            content_type: Type of content
+            
+        Returns:
+            Result containing series concept
+        """
+        task_description = self._series_task(topic, series_length, content_type)
+        
+        result, found = self._run(task_description, "series_concept", "series_parts", "series_flow")
+        return self._parse_series_result(result, found)
+    
+    def generate_all(self, 
+                    topic: str,
+                    content_type: str = "article",
+                    max_concurrency: int = 5) -> Dict[str, Any]:
+        """
+        Run all five creative generators for a topic concurrently
+        
+        Uses asyncio.run, so it cannot be called while an event loop is
+        running; use agenerate_all from async code.
         
-        result = self.execute_task(task_description)
-        return self._parse_series_result(result)
+        Args:
+            topic: Main topic
+            content_type: Type of content
+            max_concurrency: Maximum number of in-flight LLM requests
+            
+        Returns:
+            Dict mapping each generator (ideas, headlines, hooks, viral_concepts, series) to its result
+        """
+        return asyncio.run(self.agenerate_all(topic, content_type, max_concurrency))
     
-    def _parse_ideas_result(self, ideas_text: str, topic: str) -> Dict[str, Any]:
+    async def agenerate_all(self, 
+                            topic: str,
+                            content_type: str = "article",
+                            max_concurrency: int = 5) -> Dict[str, Any]:
+        """
+        Run all five creative generators for a topic concurrently without blocking the event loop
+        
+        Args:
+            topic: Main topic
+            content_type: Type of content
+            max_concurrency: Maximum number of in-flight LLM requests
+            
+        Returns:
+            Dict mapping each generator (ideas, headlines, hooks, viral_concepts, series) to its result
+        """
+        # Raises a ValueError subclass for a blank topic
+        CreativeRequest(topic=topic, content_type=content_type)
+        
+        prompts = [
+            self._ideas_task(topic, content_type=content_type),
+            self._headlines_task(topic, content_type=content_type),
+            self._hooks_task(topic),
+            self._viral_concepts_task(topic),
+            self._series_task(topic, content_type=content_type)
+        ]
+        ideas, headlines, hooks, viral, series = await self.execute_tasks_batch(
+            prompts, max_concurrency=max_concurrency, semantic=False
+        )
+        
+        return {
+            "ideas": self._parse_ideas_result(ideas, topic),
+            "headlines": self._parse_headlines_result(headlines),
+            "hooks": self._parse_hooks_result(hooks),
+            "viral_concepts": self._parse_viral_concepts_result(viral),
+            "series": self._parse_series_result(series)
+        }
+    
+    def run_all(self, topic: str, content_type: str = "article") -> Dict[str, Any]:
+        """
+        Run all five creative generators for a topic on a thread pool
+        
+        For synchronous callers; the LLM calls overlap while threads wait on
+        I/O. The call blocks until every generator finishes, so from async code
+        use agenerate_all or asyncio.to_thread(run_all, ...).
+        
+        Args:
+            topic: Main topic
+            content_type: Type of content
+            
+        Returns:
+            Dict mapping each generator (ideas, headlines, hooks, viral_concepts, series) to its result
+        """
+        # Raises a ValueError subclass for a blank topic
+        CreativeRequest(topic=topic, content_type=content_type)
+        
+        generators = [
+            ("ideas", partial(self.generate_content_ideas, topic, content_type=content_type)),
+            ("headlines", partial(self.brainstorm_headlines, topic, content_type=content_type)),
+            ("hooks", partial(self.create_content_hooks, topic)),
+            ("viral_concepts", partial(self.generate_viral_concepts, topic)),
+            ("series", partial(self.create_content_series, topic, content_type=content_type))
+        ]
+        with ThreadPoolExecutor(max_workers=len(generators)) as executor:
+            futures = {name: executor.submit(generator) for name, generator in generators}
+            return {name: future.result() for name, future in futures.items()}
+    
+    def _ideas_task(self,
+                    topic: str,
+                    content_type: str = "article",
+                    target_audience: str = "general",
+                    idea_count: int = 10,
+                    creativity_level: str = "high") -> str:
+        """Build the content ideas task description"""
+        return self._IDEAS_TEMPLATE.format(
+            topic=topic,
+            content_type=content_type,
+            target_audience=target_audience,
+            idea_count=idea_count,
+            creativity_level=creativity_level
+        )
+    
+    def _headlines_task(self,
+                        topic: str,
+                        content_type: str = "article",
+                        headline_count: int = 15,
+                        headline_style: str = "clickbait") -> str:
+        """Build the headline task description"""
+        return self._HEADLINES_TEMPLATE.format(
+            topic=topic,
+            content_type=content_type,
+            headline_count=headline_count,
+            headline_style=headline_style
+        )
+    
+    def _hooks_task(self,
+                    topic: str,
+                    hook_count: int = 10,
+                    hook_type: str = "opening") -> str:
+        """Build the content hook task description"""
+        return self._HOOKS_TEMPLATE.format(topic=topic, hook_count=hook_count, hook_type=hook_type)
+    
+    def _viral_concepts_task(self,
+                             topic: str,
+                             platform: str = "general",
+                             concept_count: int = 8) -> str:
+        """Build the viral concept task description"""
+        return self._VIRAL_CONCEPTS_TEMPLATE.format(topic=topic, platform=platform, concept_count=concept_count)
+    
+    def _series_task(self,
+                     topic: str,
+                     series_length: int = 5,
+                     content_type: str = "article") -> str:
+        """Build the content series task description"""
+        return self._SERIES_TEMPLATE.format(topic=topic, series_length=series_length, content_type=content_type)
+    
+    def _parse_ideas_result(self, ideas_text: str, topic: str, found: Optional[Dict[str, List[str]]] = None) -> IdeasResult:
         """
         Parse content ideas result into structured format
         
         Args:
             ideas_text: Raw ideas text
             topic: Original topic
+            found: Lines already classified while streaming, if any
             
         Returns:
-            Dict containing structured ideas data
+            Result with structured ideas data
         """
-        return {
-            "topic": topic,
-            "ideas_text": ideas_text,
-            "idea_list": self._extract_ideas(ideas_text),
-            "creative_angles": self._extract_creative_angles(ideas_text),
-            "engagement_potential": self._extract_engagement_potential(ideas_text)
-        }
+        if found is None:
+            found = self._scan(ideas_text, "ideas", "creative_angles", "engagement")
+        return IdeasResult(
+            topic=topic,
+            ideas_text=ideas_text,
+            idea_list=found["ideas"],
+            creative_angles=found["creative_angles"],
+            engagement_potential=found["engagement"]
+        )
     
-    def _parse_headlines_result(self, headlines_text: str) -> Dict[str, Any]:
+    def _parse_headlines_result(self, headlines_text: str, found: Optional[Dict[str, List[str]]] = None) -> HeadlinesResult:
         """
         Parse headlines result into structured format
         
         Args:
             headlines_text: Raw headlines text
+            found: Lines already classified while streaming, if any
             
         Returns:
-            Dict containing structured headlines data
+            Result with structured headlines data
         """
-        return {
-            "headlines_text": headlines_text,
-            "headline_list": self._extract_headlines(headlines_text),
-            "headline_styles": self._extract_headline_styles(headlines_text),
-            "click_through_potential": self._extract_click_through_potential(headlines_text)
-        }
+        if found is None:
+            found = self._scan(headlines_text, "headlines", "headline_styles", "click_through")
+        return HeadlinesResult(
+            headlines_text=headlines_text,
+            headline_list=found["headlines"],
+            headline_styles=found["headline_styles"],
+            click_through_potential=found["click_through"]
+        )
     
-    def _parse_hooks_result(self, hooks_text: str) -> Dict[str, Any]:
+    def _parse_hooks_result(self, hooks_text: str, found: Optional[Dict[str, List[str]]] = None) -> HooksResult:
         """
         Parse hooks result into structured format
         
         Args:
             hooks_text: Raw hooks text
+            found: Lines already classified while streaming, if any
             
         Returns:
-            Dict containing structured hooks data
+            Result with structured hooks data
         """
-        return {
-            "hooks_text": hooks_text,
-            "hook_list": self._extract_hooks(hooks_text),
-            "hook_types": self._extract_hook_types(hooks_text),
-            "emotional_impact": self._extract_emotional_impact(hooks_text)
-        }
+        if found is None:
+            found = self._scan(hooks_text, "hooks", "hook_types", "emotional_impact")
+        return HooksResult(
+            hooks_text=hooks_text,
+            hook_list=found["hooks"],
+            hook_types=found["hook_types"],
+            emotional_impact=found["emotional_impact"]
+        )
     
-    def _parse_viral_concepts_result(self, viral_text: str) -> Dict[str, Any]:
+    def _parse_viral_concepts_result(self, viral_text: str, found: Optional[Dict[str, List[str]]] = None) -> ViralConceptsResult:
         """
         Parse viral concepts result into structured format
         
         Args:
             viral_text: Raw viral concepts text
+            found: Lines already classified while streaming, if any
             
         Returns:
-            Dict containing structured viral concepts data
+            Result with structured viral concepts data
         """
-        return {
-            "viral_concepts_text": viral_text,
-            "concept_list": self._extract_concepts(viral_text),
-            "viral_scores": self._extract_viral_scores(viral_text),
-            "emotional_triggers": self._extract_emotional_triggers(viral_text)
-        }
+        if found is None:
+            found = self._scan(viral_text, "concepts", "viral_scores", "emotional_triggers")
+        return ViralConceptsResult(
+            viral_concepts_text=viral_text,
+            concept_list=found["concepts"],
+            viral_scores=found["viral_scores"],
+            emotional_triggers=found["emotional_triggers"]
+        )
     
-    def _parse_series_result(self, series_text: str) -> Dict[str, Any]:
+    def _parse_series_result(self, series_text: str, found: Optional[Dict[str, List[str]]] = None) -> SeriesResult:
         """
         Parse series result into structured format
         
         Args:
             series_text: Raw series text
+            found: Lines already classified while streaming, if any
             
         Returns:
-            Dict containing structured series data
+            Result with structured series data
         """
-        return {
-            "series_text": series_text,
-            "series_concept": self._extract_series_concept(series_text),
-            "series_parts": self._extract_series_parts(series_text),
-            "series_flow": self._extract_series_flow(series_text)
-        }
+        if found is None:
+            found = self._scan(series_text, "series_concept", "series_parts", "series_flow")
+        return SeriesResult(
+            series_text=series_text,
+            series_concept=found["series_concept"][0] if found["series_concept"] else "",
+            series_parts=found["series_parts"],
+            series_flow=found["series_flow"]
+        )
     
-    # Helper methods for extracting specific information
-    def _extract_ideas(self, text: str) -> List[str]:
-        """Extract content ideas from text"""
-        ideas = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['idea', 'concept', 'approach', 'angle']):
-                ideas.append(line.strip())
-        return ideas
-    
-    def _extract_creative_angles(self, text: str) -> List[str]:
-        """Extract creative angles from ideas text"""
-        angles = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['angle', 'perspective', 'viewpoint', 'approach']):
-                angles.append(line.strip())
-        return angles
-    
-    def _extract_engagement_potential(self, text: str) -> List[str]:
-        """Extract engagement potential from ideas text"""
-        engagement = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['engagement', 'viral', 'shareable', 'interactive']):
-                engagement.append(line.strip())
-        return engagement
-    
-    def _extract_headlines(self, text: str) -> List[str]:
-        """Extract headlines from text"""
-        headlines = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['headline', 'title', 'how to', 'why', 'what']):
-                headlines.append(line.strip())
-        return headlines
-    
-    def _extract_headline_styles(self, text: str) -> List[str]:
-        """Extract headline styles from text"""
-        styles = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['style', 'type', 'format', 'category']):
-                styles.append(line.strip())
-        return styles
-    
-    def _extract_click_through_potential(self, text: str) -> List[str]:
-        """Extract click-through potential from headlines text"""
-        potential = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['click', 'ctr', 'potential', 'appeal']):
-                potential.append(line.strip())
-        return potential
-    
-    def _extract_hooks(self, text: str) -> List[str]:
-        """Extract hooks from text"""
-        hooks = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['hook', 'opening', 'intro', 'start']):
-                hooks.append(line.strip())
-        return hooks
-    
-    def _extract_hook_types(self, text: str) -> List[str]:
-        """Extract hook types from text"""
-        types = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['story', 'statistic', 'question', 'anecdote']):
-                types.append(line.strip())
-        return types
-    
-    def _extract_emotional_impact(self, text: str) -> List[str]:
-        """Extract emotional impact from hooks text"""
-        impact = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['emotional', 'feeling', 'impact', 'response']):
-                impact.append(line.strip())
-        return impact
-    
-    def _extract_concepts(self, text: str) -> List[str]:
-        """Extract viral concepts from text"""
-        concepts = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['concept', 'idea', 'campaign', 'challenge']):
-                concepts.append(line.strip())
-        return concepts
-    
-    def _extract_viral_scores(self, text: str) -> List[str]:
-        """Extract viral scores from text"""
-        scores = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['score', 'viral', 'potential', 'rating']):
-                scores.append(line.strip())
-        return scores
-    
-    def _extract_emotional_triggers(self, text: str) -> List[str]:
-        """Extract emotional triggers from viral concepts text"""
-        triggers = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['joy', 'anger', 'surprise', 'fear', 'emotion']):
-                triggers.append(line.strip())
-        return triggers
-    
-    def _extract_series_concept(self, text: str) -> str:
-        """Extract series concept from text"""
-        lines = text.split('\n')
-        for line in lines:
-            if 'concept' in line.lower() or 'theme' in line.lower():
-                return line.strip()
-        return ""
-    
-    def _extract_series_parts(self, text: str) -> List[str]:
-        """Extract series parts from text"""
-        parts = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['part', 'piece', 'episode', 'chapter']):
-                parts.append(line.strip())
-        return parts
-    
-    def _extract_series_flow(self, text: str) -> List[str]:
-        """Extract series flow from text"""
-        flow = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['flow', 'progression', 'sequence', 'order']):
-                flow.append(line.strip())
-        return flow
+    def _scan(self, text: str, *buckets: str) -> Dict[str, List[str]]:
+        """
+        Classify lines of text into keyword buckets in a single pass
+        
+        Args:
+            text: Raw text to scan
+            buckets: Names of the buckets in _KEYWORDS to collect
+            
+        Returns:
+            Dict mapping each bucket name to its distinct matching lines
+        """
+        return self._dedupe(self._SCANNER.scan(text, buckets))
+    
+    @staticmethod
+    def _dedupe(found: Dict[str, List[str]]) -> Dict[str, List[str]]:
+        """Drop repeated lines within each bucket, keeping first occurrences in order"""
+        return {name: list(dict.fromkeys(lines)) for name, lines in found.items()}
+    
+    def _run(self, task_description: str, *buckets: str) -> Tuple[str, Optional[Dict[str, List[str]]]]:
+        """
+        Execute a task, classifying its lines as they stream in when streaming is enabled
+        
+        Args:
+            task_description: Description of the task to execute
+            buckets: Names of the buckets to collect while streaming
+            
+        Returns:
+            Tuple of the raw result and its classified lines (None when not streaming)
+        """
+        # Prompts differing only in counts or styles embed almost identically,
+        # so only exact repeats are served from the caches
+        result, found = self.execute_task_scanned(task_description, self._SCANNER, buckets, semantic=False)
+        return result, (self._dedupe(found) if found is not None else None)
     
     def validate_input(self, input_data: Any) -> bool:
         """
@@ -477,5 +666,5 @@ class CreativeAgent(BaseAgent):
             bool: True if valid, False otherwise
         """
         if isinstance(input_data, str):
-            return len(input_data.strip()) > 0
+            return bool(input_data) and not input_data.isspace()
         return False 
\ No newline at end of file
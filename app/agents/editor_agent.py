@@ -5,32 +5,138 @@ This agent specializes in reviewing, editing, and improving content drafts.
 It focuses on grammar, style, clarity, and overall content quality.
 """
 
-from typing import Dict, Any, Optional, List
+import asyncio
+import re
+from typing import Dict, Any, Optional, List, AsyncIterator
 from .base_agent import BaseAgent
+from .keyword_scanner import KeywordScanner
+from .results import GrammarResult, ReviewResult
+
+# Keywords that classify a line of agent output, matched against the lowercased line
+_SCANNER = KeywordScanner({
+    "suggestions": ("suggest", "improve", "consider", "try"),
+    "positive_aspects": ("good", "excellent", "strong", "effective"),
+    "errors": ("error", "incorrect", "wrong", "fix")
+})
+
+# Buckets collected by each parser
+_REVIEW_BUCKETS = ("suggestions", "positive_aspects")
+_GRAMMAR_BUCKETS = ("errors", "suggestions")
+
+# Matched against the lowercased text: a case-sensitive literal search is far
+# faster than re.IGNORECASE, which cannot use the literal prefix
+_SCORE_RE = re.compile(r'score[:\s]*(\d+)')
 
 
 class EditorAgent(BaseAgent):
     """Agent specialized in reviewing and improving content"""
     
-    def __init__(self, verbose: bool = True):
+    # Review focus areas used when the caller does not name any
+    _DEFAULT_REVIEW_FOCUS = ("grammar", "style", "clarity", "structure", "engagement")
+    
+    # Static prompt bodies, formatted per call
+    _REVIEW_TEMPLATE = """
+        Review the following {content_type} content for {target_audience} audience:
+        
+        {content}
+        
+        Focus areas for review: {review_focus}
+        
+        Please provide a comprehensive review including:
+        1. Overall assessment and score (1-10)
+        2. Grammar and spelling issues
+        3. Style and tone consistency
+        4. Clarity and readability
+        5. Structure and flow
+        6. Engagement and impact
+        7. Specific suggestions for improvement
+        8. Positive aspects to maintain
+        """
+    
+    _REVIEW_BATCH_TEMPLATE = """
+        Review each of the following {count} {content_type} items for {target_audience} audience:
+        
+        {items}
+        
+        Focus areas for review: {review_focus}
+        
+        Start the review of each item with its "### ITEM <number>" header and include:
+        1. Overall assessment and score (1-10)
+        2. Grammar and spelling issues
+        3. Style and tone consistency
+        4. Clarity and readability
+        5. Structure and flow
+        6. Engagement and impact
+        7. Specific suggestions for improvement
+        8. Positive aspects to maintain
+        """
+    
+    _EDIT_TEMPLATE = """
+        Edit the following content according to these instructions:
+        
+        Content:
+        {content}
+        
+        Edit Instructions:
+        {edit_instructions}
+        
+        Requirements:
+        - Follow the edit instructions precisely
+        - Maintain the original message and key points
+        - Ensure grammatical correctness
+        - Improve clarity and flow
+        """
+    
+    _IMPROVE_TEMPLATE = """
+        Improve the following content by focusing on: {improvement_areas}
+        
+        Original Content:
+        {content}
+        
+        Please:
+        1. Maintain the core message and key points
+        2. Improve clarity and readability
+        3. Enhance engagement and impact
+        4. Ensure smooth flow and transitions
+        5. Fix any grammatical or style issues
+        6. Make the content more compelling
+        """
+    
+    _GRAMMAR_TEMPLATE = """
+        Perform a detailed grammar and style analysis of the following content:
+        
+        {content}
+        
+        Please provide:
+        1. Grammar errors and corrections
+        2. Style issues and suggestions
+        3. Punctuation and formatting issues
+        4. Word choice and vocabulary suggestions
+        5. Sentence structure improvements
+        6. Overall writing quality assessment
+        """
+    
+    def __init__(self, verbose: bool = True, stream: bool = False):
         """
         Initialize Editor Agent
         
         Args:
             verbose: Whether to enable verbose logging
+            stream: Whether to stream responses and parse them line by line as they arrive
         """
         super().__init__(
             name="Content Editor",
             role="Expert content editor with extensive experience in reviewing, editing, and improving articles, blog posts, and marketing content. Specializes in grammar, style, clarity, and ensuring content meets quality standards.",
             goal="Review and improve content to ensure it is grammatically correct, well-structured, engaging, and meets the highest quality standards while maintaining the original message and tone.",
-            verbose=verbose
+            verbose=verbose,
+            stream=stream
         )
     
     def review_content(self, 
                       content: str,
                       content_type: str = "article",
                       target_audience: str = "general",
-                      review_focus: Optional[List[str]] = None) -> Dict[str, Any]:
+                      review_focus: Optional[List[str]] = None) -> ReviewResult:
         """
         Review content and provide feedback
         
@@ -41,35 +147,169 @@ class EditorAgent(BaseAgent):
             review_focus: Specific areas to focus on (grammar, style, clarity, etc.)
             
         Returns:
-            Dict containing review results and suggestions
+            Result containing review results and suggestions
         """
-        if not self.validate_input(content):
-            raise ValueError("Content cannot be empty")
+        task_description = self._review_task(content, content_type, target_audience, review_focus)
+        result, found = self.execute_task_scanned(task_description, _SCANNER, _REVIEW_BUCKETS, semantic=False)
+        return self._parse_review_result(result, found)
+    
+    async def areview_content(self, 
+                              content: str,
+                              content_type: str = "article",
+                              target_audience: str = "general",
+                              review_focus: Optional[List[str]] = None) -> ReviewResult:
+        """
+        Review content without blocking the event loop
         
-        # Default review focus areas
+        Args:
+            content: Content to review
+            content_type: Type of content being reviewed
+            target_audience: Target audience for the content
+            review_focus: Specific areas to focus on (grammar, style, clarity, etc.)
+            
+        Returns:
+            Result containing review results and suggestions
+        """
+        task_description = self._review_task(content, content_type, target_audience, review_focus)
+        result = await self.aexecute_task(task_description, semantic=False)
+        return self._parse_review_result(result)
+    
+    async def areview_content_by_focus(self, 
+                                       content: str,
+                                       content_type: str = "article",
+                                       target_audience: str = "general",
+                                       review_focus: Optional[List[str]] = None) -> ReviewResult:
+        """
+        Review content with one concurrent LLM call per focus area
+        
+        The review takes about as long as the slowest focus area instead of
+        one call covering all of them, at the cost of sending the content
+        once per area. The reviews are merged into one result: texts under a
+        header per area, the mean of their scores, and their suggestions and
+        positive aspects in focus order.
+        
+        Args:
+            content: Content to review
+            content_type: Type of content being reviewed
+            target_audience: Target audience for the content
+            review_focus: Specific areas to focus on (grammar, style, clarity, etc.)
+            
+        Returns:
+            Result containing the merged review results and suggestions
+        """
         if review_focus is None:
-            review_focus = ["grammar", "style", "clarity", "structure", "engagement"]
+            review_focus = self._DEFAULT_REVIEW_FOCUS
+        if len(review_focus) <= 1:
+            return await self.areview_content(content, content_type, target_audience, review_focus)
         
-        task_description = f"""
-        Review the following {content_type} content for {target_audience} audience:
+        reviews = await asyncio.gather(*(
+            self.areview_content(content, content_type, target_audience, [focus])
+            for focus in review_focus
+        ))
         
-        {content}
+        scores = [review.overall_score for review in reviews if review.overall_score is not None]
+        return ReviewResult(
+            review_text="\n\n".join(
+                f"## {focus.title()}\n{review.review_text}" for focus, review in zip(review_focus, reviews)
+            ),
+            overall_score=round(sum(scores) / len(scores)) if scores else None,
+            suggestions=[line for review in reviews for line in review.suggestions],
+            positive_aspects=[line for review in reviews for line in review.positive_aspects]
+        )
+    
+    async def astream_review_content(self,
+                                     content: str,
+                                     content_type: str = "article",
+                                     target_audience: str = "general",
+                                     review_focus: Optional[List[str]] = None) -> AsyncIterator[str]:
+        """
+        Review content, streaming the review line by line as it is generated
         
-        Focus areas for review: {', '.join(review_focus)}
+        Args:
+            content: Content to review
+            content_type: Type of content being reviewed
+            target_audience: Target audience for the content
+            review_focus: Specific areas to focus on (grammar, style, clarity, etc.)
+            
+        Yields:
+            str: Each line of the review
+        """
+        task_description = self._review_task(content, content_type, target_audience, review_focus)
+        async for line in self.astream_task(task_description, semantic=False):
+            yield line
+    
+    def review_content_batch(self,
+                             contents: List[str],
+                             content_type: str = "article",
+                             target_audience: str = "general",
+                             review_focus: Optional[List[str]] = None) -> List[ReviewResult]:
+        """
+        Review several pieces of content with a single LLM call
         
-        Please provide a comprehensive review including:
-        1. Overall assessment and score (1-10)
-        2. Grammar and spelling issues
-        3. Style and tone consistency
-        4. Clarity and readability
-        5. Structure and flow
-        6. Engagement and impact
-        7. Specific suggestions for improvement
-        8. Positive aspects to maintain
+        Items missing from the batched response are reviewed individually.
+        
+        Args:
+            contents: Content items to review
+            content_type: Type of content being reviewed
+            target_audience: Target audience for the content
+            review_focus: Specific areas to focus on (grammar, style, clarity, etc.)
+            
+        Returns:
+            List of review results in input order
+        """
+        if not contents:
+            return []
+        if not all(self.validate_input(content) for content in contents):
+            raise ValueError("Content cannot be empty")
+        
+        if review_focus is None:
+            review_focus = self._DEFAULT_REVIEW_FOCUS
+        
+        task_description = self._REVIEW_BATCH_TEMPLATE.format(
+            count=len(contents),
+            content_type=content_type,
+            target_audience=target_audience,
+            items=self._format_batch_items(contents),
+            review_focus=', '.join(review_focus)
+        )
+        
+        result = self.execute_task_fast(task_description, semantic=False)
+        sections = self._split_batch_result(result, len(contents))
+        return [
+            self._parse_review_result(section) if section is not None
+            else self.review_content(content, content_type, target_audience, review_focus)
+            for content, section in zip(contents, sections)
+        ]
+    
+    def _review_task(self,
+                     content: str,
+                     content_type: str,
+                     target_audience: str,
+                     review_focus: Optional[List[str]]) -> str:
         """
+        Build the task description for reviewing content
         
-        result = self.execute_task(task_description)
-        return self._parse_review_result(result)
+        Args:
+            content: Content to review
+            content_type: Type of content being reviewed
+            target_audience: Target audience for the content
+            review_focus: Specific areas to focus on; the default areas if None
+            
+        Returns:
+            str: Task description
+        """
+        if not self.validate_input(content):
+            raise ValueError("Content cannot be empty")
+        
+        if review_focus is None:
+            review_focus = self._DEFAULT_REVIEW_FOCUS
+        
+        return self._REVIEW_TEMPLATE.format(
+            content_type=content_type,
+            target_audience=target_audience,
+            content=content,
+            review_focus=', '.join(review_focus)
+        )
     
     def edit_content(self, 
                     content: str,
@@ -86,26 +326,12 @@ class EditorAgent(BaseAgent):
         Returns:
             str: Edited content
         """
-        task_description = f"""
-        Edit the following content according to these instructions:
-        
-        Content:
-        {content}
-        
-        Edit Instructions:
-        {edit_instructions}
-        
-        Requirements:
-        - Follow the edit instructions precisely
-        - Maintain the original message and key points
-        - Ensure grammatical correctness
-        - Improve clarity and flow
-        """
+        task_description = self._EDIT_TEMPLATE.format(content=content, edit_instructions=edit_instructions)
         
         if preserve_style:
             task_description += "\n- Preserve the original writing style and tone"
         
-        result = self.execute_task(task_description)
+        result = self.execute_task_fast(task_description, semantic=False)
         return self.postprocess_output(result)
     
     def improve_content(self, 
@@ -124,25 +350,33 @@ class EditorAgent(BaseAgent):
         if improvement_areas is None:
             improvement_areas = ["clarity", "engagement", "flow", "impact"]
         
-        task_description = f"""
-        Improve the following content by focusing on: {', '.join(improvement_areas)}
+        task_description = self._IMPROVE_TEMPLATE.format(improvement_areas=', '.join(improvement_areas), content=content)
         
-        Original Content:
-        {content}
+        result = self.execute_task_fast(task_description, semantic=False)
+        return self.postprocess_output(result)
+    
+    async def astream_improve_content(self,
+                                      content: str,
+                                      improvement_areas: Optional[List[str]] = None) -> AsyncIterator[str]:
+        """
+        Improve content quality, streaming the improved content line by line
         
-        Please:
-        1. Maintain the core message and key points
-        2. Improve clarity and readability
-        3. Enhance engagement and impact
-        4. Ensure smooth flow and transitions
-        5. Fix any grammatical or style issues
-        6. Make the content more compelling
+        Args:
+            content: Content to improve
+            improvement_areas: Specific areas to improve (clarity, engagement, etc.)
+            
+        Yields:
+            str: Each line of the improved content
         """
+        if improvement_areas is None:
+            improvement_areas = ["clarity", "engagement", "flow", "impact"]
         
-        result = self.execute_task(task_description)
-        return self.postprocess_output(result)
+        task_description = self._IMPROVE_TEMPLATE.format(improvement_areas=', '.join(improvement_areas), content=content)
+        
+        async for line in self.astream_task(task_description, semantic=False):
+            yield line
     
-    def check_grammar_and_style(self, content: str) -> Dict[str, Any]:
+    def check_grammar_and_style(self, content: str) -> GrammarResult:
         """
         Perform detailed grammar and style check
         
@@ -150,106 +384,59 @@ class EditorAgent(BaseAgent):
             content: Content to check
             
         Returns:
-            Dict containing grammar and style analysis
+            Result containing grammar and style analysis
         """
-        task_description = f"""
-        Perform a detailed grammar and style analysis of the following content:
+        task_description = self._GRAMMAR_TEMPLATE.format(content=content)
         
-        {content}
-        
-        Please provide:
-        1. Grammar errors and corrections
-        2. Style issues and suggestions
-        3. Punctuation and formatting issues
-        4. Word choice and vocabulary suggestions
-        5. Sentence structure improvements
-        6. Overall writing quality assessment
-        """
-        
-        result = self.execute_task(task_description)
-        return self._parse_grammar_result(result)
+        result, found = self.execute_task_scanned(task_description, _SCANNER, _GRAMMAR_BUCKETS, semantic=False)
+        return self._parse_grammar_result(result, found)
     
-    def _parse_review_result(self, review_text: str) -> Dict[str, Any]:
+    def _parse_review_result(self, review_text: str, found: Optional[Dict[str, List[str]]] = None) -> ReviewResult:
         """
         Parse review result into structured format
         
         Args:
             review_text: Raw review text
+            found: Lines already classified while streaming, if any
             
         Returns:
-            Dict containing structured review data
+            Result containing structured review data
         """
         # Simple parsing - in a real implementation, this would be more sophisticated
-        return {
-            "review_text": review_text,
-            "overall_score": self._extract_score(review_text),
-            "suggestions": self._extract_suggestions(review_text),
-            "positive_aspects": self._extract_positive_aspects(review_text)
-        }
+        if found is None:
+            found = _SCANNER.scan(review_text, _REVIEW_BUCKETS)
+        return ReviewResult(
+            review_text=review_text,
+            overall_score=self._extract_score(review_text),
+            suggestions=found["suggestions"],
+            positive_aspects=found["positive_aspects"]
+        )
     
-    def _parse_grammar_result(self, grammar_text: str) -> Dict[str, Any]:
+    def _parse_grammar_result(self, grammar_text: str, found: Optional[Dict[str, List[str]]] = None) -> GrammarResult:
         """
         Parse grammar check result into structured format
         
         Args:
             grammar_text: Raw grammar analysis text
+            found: Lines already classified while streaming, if any
             
         Returns:
-            Dict containing structured grammar data
+            Result containing structured grammar data
         """
-        return {
-            "grammar_analysis": grammar_text,
-            "errors_found": self._extract_errors(grammar_text),
-            "suggestions": self._extract_grammar_suggestions(grammar_text)
-        }
+        if found is None:
+            found = _SCANNER.scan(grammar_text, _GRAMMAR_BUCKETS)
+        return GrammarResult(
+            grammar_analysis=grammar_text,
+            errors_found=found["errors"],
+            suggestions=found["suggestions"]
+        )
     
     def _extract_score(self, text: str) -> Optional[int]:
         """Extract numerical score from review text"""
         # Simple extraction - would be more sophisticated in real implementation
-        import re
-        score_match = re.search(r'score[:\s]*(\d+)', text.lower())
+        score_match = _SCORE_RE.search(text.lower())
         return int(score_match.group(1)) if score_match else None
     
-    def _extract_suggestions(self, text: str) -> List[str]:
-        """Extract improvement suggestions from review text"""
-        # Simple extraction - would be more sophisticated in real implementation
-        suggestions = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['suggest', 'improve', 'consider', 'try']):
-                suggestions.append(line.strip())
-        return suggestions
-    
-    def _extract_positive_aspects(self, text: str) -> List[str]:
-        """Extract positive aspects from review text"""
-        # Simple extraction - would be more sophisticated in real implementation
-        positives = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['good', 'excellent', 'strong', 'effective']):
-                positives.append(line.strip())
-        return positives
-    
-    def _extract_errors(self, text: str) -> List[str]:
-        """Extract grammar errors from analysis text"""
-        # Simple extraction - would be more sophisticated in real implementation
-        errors = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['error', 'incorrect', 'wrong', 'fix']):
-                errors.append(line.strip())
-        return errors
-    
-    def _extract_grammar_suggestions(self, text: str) -> List[str]:
-        """Extract grammar suggestions from analysis text"""
-        # Simple extraction - would be more sophisticated in real implementation
-        suggestions = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['suggest', 'consider', 'try', 'improve']):
-                suggestions.append(line.strip())
-        return suggestions
-    
     def validate_input(self, input_data: Any) -> bool:
         """
         Validate input for editor agent
@@ -261,5 +448,5 @@ class EditorAgent(BaseAgent):
             bool: True if valid, False otherwise
         """
         if isinstance(input_data, str):
-            return len(input_data.strip()) > 0
+            return bool(input_data) and not input_data.isspace()
         return False 
\ No newline at end of file
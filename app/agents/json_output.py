@@ -0,0 +1,71 @@
+"""
+JSON Output for AI Content Studio
+
+This module reads LLM responses that were asked to be a single JSON object.
+Models often wrap the object in a Markdown code fence, which is accepted.
+orjson is used for decoding when installed, otherwise the standard json module.
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# A whole response that is one JSON object, optionally inside a Markdown code fence
+_JSON_RESPONSE_RE = re.compile(r'\s*(?:```(?:json)?\s*)?(\{.*\})\s*(?:```)?\s*', re.DOTALL)
+
+
+def load_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse a response that consists of a single JSON object
+    
+    Args:
+        text: Raw response text
+        
+    Returns:
+        The parsed object, or None if the response is not a JSON object
+    """
+    match = _JSON_RESPONSE_RE.fullmatch(text)
+    if match is None:
+        return None
+    try:
+        data = _json_loads(match.group(1))
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def json_lists(data: Dict[str, Any], keys: Tuple[str, ...]) -> Dict[str, List[str]]:
+    """
+    Read string lists from a parsed JSON response
+    
+    Args:
+        data: Parsed JSON object
+        keys: Keys to read
+        
+    Returns:
+        Dict mapping each key to its non-empty string items
+    """
+    found = {}
+    for key in keys:
+        value = data.get(key)
+        if not isinstance(value, list):
+            value = [value] if isinstance(value, str) else []
+        found[key] = [item for item in (str(entry).strip() for entry in value) if item]
+    return found
+
+
+def json_score(value: Any) -> Optional[int]:
+    """Read an integer score from a parsed JSON response"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value)
+    return None
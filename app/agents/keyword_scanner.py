@@ -0,0 +1,332 @@
+"""
+Keyword Scanner for AI Content Studio
+
+This module classifies lines of LLM output into keyword buckets. All bucket
+keywords are compiled into a single multi-pattern matcher so a whole response
+is scanned in one native pass: a Numba-compiled byte kernel when numba is
+installed, otherwise a Hyperscan database or an Aho-Corasick automaton when
+hyperscan or pyahocorasick is. Without any of them, each bucket falls back to
+a compiled regex alternation.
+"""
+
+import re
+import threading
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def _keyword_owners(keywords: Dict[str, Iterable[str]]) -> Dict[str, FrozenSet[str]]:
+    """
+    Map each keyword to the names of the buckets it belongs to
+    
+    Args:
+        keywords: Mapping of bucket name to its keywords
+    
+    Returns:
+        Dict mapping each distinct keyword to its bucket names
+    """
+    owners: Dict[str, List[str]] = {}
+    for name, words in keywords.items():
+        for word in words:
+            owners.setdefault(word, []).append(name)
+    return {word: frozenset(names) for word, names in owners.items()}
+
+
+def _build_automaton(owners: Dict[str, FrozenSet[str]]):
+    """
+    Compile keywords into a single Aho-Corasick automaton
+    
+    Args:
+        owners: Mapping of keyword to its bucket names
+    
+    Returns:
+        Automaton whose values are the bucket names owning each keyword
+    """
+    automaton = ahocorasick.Automaton()
+    for word, names in owners.items():
+        automaton.add_word(word, names)
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_database(owners: Dict[str, FrozenSet[str]]):
+    """
+    Compile keywords into a single Hyperscan block-mode database
+    
+    Args:
+        owners: Mapping of keyword to its bucket names
+    
+    Returns:
+        Database whose expression ids index the keywords of owners in order
+    """
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    database.compile(
+        expressions=[re.escape(word).encode() for word in owners],
+        ids=list(range(len(owners))),
+        elements=len(owners)
+    )
+    return database
+
+
+def _scan_bytes(buf, fold, first_offsets, keyword_ids, keyword_starts, keyword_bytes, keyword_masks, line_count):
+    """
+    Match keywords in a UTF-8 buffer and OR their bucket masks per line
+    
+    Bytes are case-folded through a lookup table as they are read, and
+    keywords are bucketed by first byte, so each position only compares the
+    keywords that can start there.
+    
+    Args:
+        buf: uint8 array of the UTF-8 encoded text
+        fold: 256-entry uint8 table mapping each byte to its lowercase byte
+        first_offsets: Start of each first-byte bucket in keyword_ids (257 entries)
+        keyword_ids: Keyword ids ordered by first byte
+        keyword_starts: Offset of each keyword in keyword_bytes, plus the end offset
+        keyword_bytes: Concatenated UTF-8 encoded keywords
+        keyword_masks: Bitmask of the buckets owning each keyword
+        line_count: Number of lines in the text
+        
+    Returns:
+        int64 array with the OR of the bucket masks matched on each line
+    """
+    masks = np.zeros(line_count, dtype=np.int64)
+    size = buf.shape[0]
+    line = 0
+    for i in range(size):
+        byte = fold[buf[i]]
+        if byte == 10:
+            line += 1
+            continue
+        for j in range(first_offsets[byte], first_offsets[byte + 1]):
+            keyword = keyword_ids[j]
+            start = keyword_starts[keyword]
+            length = keyword_starts[keyword + 1] - start
+            if i + length > size:
+                continue
+            matched = True
+            for k in range(1, length):
+                if fold[buf[i + k]] != keyword_bytes[start + k]:
+                    matched = False
+                    break
+            if matched:
+                masks[line] |= keyword_masks[keyword]
+    return masks
+
+
+# Compiled lazily on first use and cached on disk, so only the first process pays the JIT cost
+_scan_kernel = None
+if njit is not None:
+    _scan_kernel = njit(cache=True, nogil=True)(_scan_bytes)
+    
+    # Byte lookup table folding ASCII A-Z to a-z
+    _ASCII_LOWER = np.arange(256, dtype=np.uint8)
+    _ASCII_LOWER[0x41:0x5B] += 0x20
+
+
+def _build_kernel_tables(owners: Dict[str, FrozenSet[str]], names: List[str]) -> Tuple:
+    """
+    Pack keywords into the flat arrays read by the scan kernel
+    
+    Args:
+        owners: Mapping of keyword to its bucket names
+        names: Bucket names, in bit order
+        
+    Returns:
+        Tuple of the kernel's table arguments
+    """
+    bits = {name: 1 << index for index, name in enumerate(names)}
+    words = [word.encode() for word in owners]
+    
+    keyword_starts = np.zeros(len(words) + 1, dtype=np.int64)
+    keyword_starts[1:] = np.cumsum([len(word) for word in words])
+    keyword_bytes = np.frombuffer(b"".join(words), dtype=np.uint8)
+    keyword_masks = np.array([sum(bits[name] for name in names_) for names_ in owners.values()], dtype=np.int64)
+    
+    order = sorted(range(len(words)), key=lambda keyword: words[keyword][0])
+    keyword_ids = np.array(order, dtype=np.int64)
+    first_offsets = np.zeros(257, dtype=np.int64)
+    first_offsets[1:] = np.cumsum(np.bincount([words[keyword][0] for keyword in order], minlength=256))
+    return first_offsets, keyword_ids, keyword_starts, keyword_bytes, keyword_masks
+
+
+class KeywordScanner:
+    """Classifies lines of text into keyword buckets"""
+    
+    def __init__(self, keywords: Dict[str, Iterable[str]]):
+        """
+        Compile the bucket keywords
+        
+        Args:
+            keywords: Mapping of bucket name to its lowercase keywords, matched as substrings
+        """
+        self.keywords = keywords
+        owners = _keyword_owners(keywords)
+        
+        self._tables = None
+        self._database = None
+        self._automaton = None
+        if _scan_kernel is not None and len(keywords) < 64:
+            # One bit per bucket in an int64 mask
+            self._names = list(keywords)
+            self._tables = _build_kernel_tables(owners, self._names)
+            self._mask_names: Dict[int, FrozenSet[str]] = {}
+        elif hyperscan is not None:
+            self._database = _build_database(owners)
+            self._owners = list(owners.values())
+            # Hyperscan scratch space cannot be shared by concurrent scans
+            self._local = threading.local()
+        elif ahocorasick is not None:
+            self._automaton = _build_automaton(owners)
+        self._native = self._tables is not None or self._database is not None or self._automaton is not None
+        self._patterns = {name: re.compile("|".join(map(re.escape, words))) for name, words in keywords.items()}
+    
+    def _scratch(self):
+        """Get this thread's Hyperscan scratch space"""
+        scratch = getattr(self._local, "scratch", None)
+        if scratch is None:
+            scratch = self._local.scratch = hyperscan.Scratch(self._database)
+        return scratch
+    
+    def _line_hits(self, lowered_text: str, lowered: List[str]) -> Dict[int, Set[str]]:
+        """
+        Match every keyword in one pass and group the hit buckets by line
+        
+        Args:
+            lowered_text: Lowercased text to scan
+            lowered: Lines of lowered_text
+            
+        Returns:
+            Dict mapping the index of each line with a hit to its bucket names
+        """
+        # Map each match offset back to its line; Hyperscan reports offsets into
+        # the UTF-8 encoding, so its lines are measured in bytes
+        if self._database is not None:
+            lengths = (len(low.encode()) for low in lowered)
+        else:
+            lengths = (len(low) for low in lowered)
+        line_starts = list(accumulate((length + 1 for length in lengths), initial=0))
+        
+        line_hits: Dict[int, Set[str]] = {}
+        if self._database is not None:
+            owners = self._owners
+            
+            def on_match(keyword_id, start, end, flags, context):
+                line_hits.setdefault(bisect_right(line_starts, end - 1) - 1, set()).update(owners[keyword_id])
+            
+            self._database.scan(lowered_text.encode(), match_event_handler=on_match, scratch=self._scratch())
+        else:
+            for end, names in self._automaton.iter(lowered_text):
+                line_hits.setdefault(bisect_right(line_starts, end) - 1, set()).update(names)
+        return line_hits
+    
+    def _kernel_hits(self, text: str, line_count: int) -> Dict[int, FrozenSet[str]]:
+        """
+        Match every keyword with the compiled kernel and group the hit buckets by line
+        
+        Args:
+            text: Raw text to scan
+            line_count: Number of lines in text
+            
+        Returns:
+            Dict mapping the index of each line with a hit to its bucket names
+        """
+        # The kernel folds ASCII case itself, so ASCII text (nearly all LLM
+        # output) skips str.lower; other text is lowercased first so non-ASCII
+        # letters keep their Unicode case mapping
+        data = text.encode() if text.isascii() else text.lower().encode()
+        masks = _scan_kernel(np.frombuffer(data, dtype=np.uint8), _ASCII_LOWER, *self._tables, line_count)
+        return {index: self._names_for_mask(masks[index]) for index in np.flatnonzero(masks).tolist()}
+    
+    def _names_for_mask(self, mask: int) -> FrozenSet[str]:
+        """Get the bucket names set in a kernel mask"""
+        mask = int(mask)
+        names = self._mask_names.get(mask)
+        if names is None:
+            names = self._mask_names[mask] = frozenset(
+                name for index, name in enumerate(self._names) if mask >> index & 1
+            )
+        return names
+    
+    def scan(self, text: str, buckets: Tuple[str, ...]) -> Dict[str, List[str]]:
+        """
+        Collect the stripped lines of text matching each bucket in a single pass
+        
+        Args:
+            text: Raw text to scan
+            buckets: Names of the buckets to collect
+            
+        Returns:
+            Dict mapping each bucket name to its matching lines, in text order
+        """
+        found = {name: [] for name in buckets}
+        
+        # Empty or blank output (failed or filtered LLM calls) cannot match any keyword
+        if not text or text.isspace():
+            return found
+        
+        lines = text.split('\n')
+        if self._tables is not None:
+            line_hits = self._kernel_hits(text, len(lines))
+        else:
+            # Lowercase the whole text once; lowercasing never adds or removes
+            # newlines, so the two line lists stay aligned
+            lowered_text = text.lower()
+            lowered = lowered_text.split('\n')
+            if not self._native:
+                patterns = [(name, self._patterns[name]) for name in buckets]
+                for line, low in zip(lines, lowered):
+                    for name, pattern in patterns:
+                        if pattern.search(low):
+                            found[name].append(line.strip())
+                return found
+            line_hits = self._line_hits(lowered_text, lowered)
+        
+        # Matching ran once over the whole text, so lines without any keyword
+        # cost no Python-level work
+        for index, hits in sorted(line_hits.items()):
+            stripped = lines[index].strip()
+            for name in buckets:
+                if name in hits:
+                    found[name].append(stripped)
+        return found
+    
+    def scan_line(self, line: str, buckets: Tuple[str, ...], found: Dict[str, List[str]]):
+        """
+        Classify a single line into keyword buckets
+        
+        Args:
+            line: Line of text
+            buckets: Names of the buckets to collect
+            found: Bucket lists to append the stripped line to
+        """
+        if self._tables is not None:
+            hits = self._kernel_hits(line, 1).get(0, set())
+        elif self._native:
+            low = line.lower()
+            hits = self._line_hits(low, [low]).get(0, set())
+        else:
+            low = line.lower()
+            hits = {name for name in buckets if self._patterns[name].search(low)}
+        
+        if hits:
+            stripped = line.strip()
+            for name in buckets:
+                if name in hits:
+                    found[name].append(stripped)
@@ -0,0 +1,66 @@
+"""
+Rate Limiter for AI Content Studio
+
+This module keeps LLM requests under the provider's request rate limit on the
+client side. Callers wait for a free slot before sending a request instead of
+being rejected with HTTP 429 and backing off, which wastes a round trip and
+delays every request queued behind it.
+
+The limiter is a leaky bucket (GCRA): up to `rate` requests may start at once,
+after which requests are spaced `per / rate` seconds apart. Slots are reserved
+under a lock, so one limiter can be shared by threads and event loops alike.
+"""
+
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """Allows at most `rate` requests in any `per` second window"""
+    
+    def __init__(self, rate: int, per: float = 60.0):
+        """
+        Initialize rate limiter
+        
+        Args:
+            rate: Maximum number of requests per window
+            per: Window length in seconds
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        
+        self.rate = rate
+        self.per = per
+        self._interval = per / rate
+        
+        # Theoretical arrival time of the next request; requests may run
+        # ahead of it by up to one window minus one interval
+        self._tat = 0.0
+        self._tolerance = per - self._interval
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """
+        Reserve the next request slot
+        
+        Returns:
+            float: Seconds to wait before the slot starts
+        """
+        with self._lock:
+            now = time.monotonic()
+            tat = max(self._tat, now)
+            self._tat = tat + self._interval
+            return max(0.0, tat - self._tolerance - now)
+    
+    def acquire(self):
+        """Block until a request may be sent"""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+    
+    async def aacquire(self):
+        """Wait without blocking the event loop until a request may be sent"""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
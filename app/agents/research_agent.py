@@ -5,32 +5,190 @@ This agent specializes in gathering information, facts, and data for content cre
 It focuses on finding accurate, relevant, and up-to-date information.
 """
 
-from typing import Dict, Any, Optional, List
+import asyncio
+import re
+from typing import Dict, Any, Optional, List, Tuple
+from app.config import settings
 from .base_agent import BaseAgent
+from .json_output import json_lists, json_score, load_json_object
+from .keyword_scanner import KeywordScanner
+from .semantic_cache import SemanticCache
+from .results import FactCheckResult, QuotesResult, ResearchResult, StatisticsResult, TrendsResult
+
+# Keywords that classify a line of agent output, matched against the lowercased line
+_SCANNER = KeywordScanner({
+    "key_facts": ("fact", "statistic", "data", "figure"),
+    "sources": ("source", "reference", "study", "report"),
+    "insights": ("insight", "finding", "discovery", "observation"),
+    "recommendations": ("recommend", "suggest", "advise", "propose"),
+    "verified_facts": ("verified", "confirmed", "accurate", "correct"),
+    "corrections_needed": ("correction", "error", "inaccurate", "wrong"),
+    "sources_verified": ("verified source", "credible", "reliable"),
+    "key_numbers": ("percent", "million", "billion", "thousand"),
+    "trends": ("trend", "growth", "increase", "decrease"),
+    "data_sources": ("source", "data from", "according to"),
+    "visualization_suggestions": ("chart", "graph", "visualization", "diagram"),
+    "quotes_list": ('"', "'"),
+    "expert_credentials": ("phd", "professor", "expert", "specialist"),
+    "quote_sources": ("source", "interview", "study", "report"),
+    "current_trends": ("current", "present", "now", "today"),
+    "emerging_trends": ("emerging", "new", "developing", "growing"),
+    "future_predictions": ("future", "prediction", "forecast", "will"),
+    "trend_implications": ("implication", "impact", "effect", "consequence")
+})
+
+# Buckets collected by each parser, scanned together in one pass over the text
+_RESEARCH_BUCKETS = ("key_facts", "sources", "insights", "recommendations")
+_FACT_CHECK_BUCKETS = ("verified_facts", "corrections_needed", "sources_verified")
+_STATISTICS_BUCKETS = ("key_numbers", "trends", "data_sources", "visualization_suggestions")
+_QUOTES_BUCKETS = ("quotes_list", "expert_credentials", "quote_sources")
+_TRENDS_BUCKETS = ("current_trends", "emerging_trends", "future_predictions", "trend_implications")
+
+# Matched against the lowercased fact-check text
+_ACCURACY_RE = re.compile(r'accuracy[:\s]*(\d+)')
+
+# Appended to prompts when JSON output is enabled; the keys are the parser's buckets
+_JSON_FORMAT = """
+        Return the response as a single JSON object and nothing else, with these keys:
+        {keys}
+        Each key holds a list of strings{extra}.
+        """
+
+# Value note for the fact-check score, the one non-list key
+_ACCURACY_SCORE_FORMAT = ", except accuracy_score, which holds an integer from 0 to 100"
 
 
 class ResearchAgent(BaseAgent):
     """Agent specialized in research and information gathering"""
     
-    def __init__(self, verbose: bool = True):
+    # Only the topic is embedded; a related but different topic needs
+    # different facts, so topics must be near-paraphrases to share research
+    SEMANTIC_CACHE_THRESHOLD = 0.93
+    
+    # Static prompt bodies, formatted per call
+    _RESEARCH_TEMPLATE = """
+        Conduct {research_depth} research on the topic: "{topic}"
+        
+        Content Type: {content_type}
+        Target Audience: {target_audience}
+        
+        Please provide:
+        1. Key facts and statistics
+        2. Current trends and developments
+        3. Expert opinions and quotes
+        4. Relevant case studies or examples
+        5. Historical context (if applicable)
+        6. Controversial aspects or debates
+        7. Future implications or predictions
+        8. Credible sources and references
+        9. Data visualization suggestions
+        10. Research gaps or areas for further study
+        """
+    
+    _FACT_CHECK_TEMPLATE = """
+        Fact-check the following content about "{topic}":
+        
+        {content}
+        
+        Please verify:
+        1. All factual claims and statements
+        2. Statistics and data accuracy
+        3. Quote authenticity and attribution
+        4. Date and timeline accuracy
+        5. Source credibility and reliability
+        6. Context accuracy and completeness
+        7. Potential biases or misinformation
+        8. Recommendations for corrections
+        """
+    
+    _FACT_CHECK_BATCH_TEMPLATE = """
+        Fact-check each of the following {count} content items about "{topic}":
+        
+        {items}
+        
+        Start the fact-check of each item with its "### ITEM <number>" header and verify:
+        1. All factual claims and statements
+        2. Statistics and data accuracy
+        3. Quote authenticity and attribution
+        4. Date and timeline accuracy
+        5. Source credibility and reliability
+        6. Context accuracy and completeness
+        7. Potential biases or misinformation
+        8. Recommendations for corrections
+        """
+    
+    _STATISTICS_TEMPLATE = """
+        Gather relevant statistics and data for: "{topic}"
+        {scope}
+        
+        Please provide:
+        1. Key statistics and numbers
+        2. Growth trends and patterns
+        3. Comparative data and benchmarks
+        4. Demographic breakdowns
+        5. Industry-specific metrics
+        6. Economic impact data
+        7. Social and cultural statistics
+        8. Data sources and reliability
+        9. Data visualization suggestions
+        10. Limitations and caveats
+        """
+    
+    _QUOTES_TEMPLATE = """
+        Find relevant {quote_type} expert quotes and insights for: "{topic}"
+        
+        Please provide:
+        1. Expert quotes with proper attribution
+        2. Industry leader insights
+        3. Academic expert opinions
+        4. Thought leader perspectives
+        5. Controversial or opposing viewpoints
+        6. Historical expert commentary
+        7. Future predictions from experts
+        8. Expert credentials and credibility
+        9. Quote context and relevance
+        10. Source verification and reliability
+        """
+    
+    _TRENDS_TEMPLATE = """
+        Analyze {trend_type} trends related to: "{topic}"
+        
+        Time Period: {time_period}
+        
+        Please provide:
+        1. Current trend analysis
+        2. Historical trend patterns
+        3. Emerging trends and developments
+        4. Trend drivers and factors
+        5. Industry-specific trends
+        6. Consumer behavior trends
+        7. Technology impact on trends
+        8. Future trend predictions
+        9. Trend implications and consequences
+        10. Data sources and methodology
+        """
+    
+    def __init__(self, verbose: bool = True, stream: bool = False):
         """
         Initialize Research Agent
         
         Args:
             verbose: Whether to enable verbose logging
+            stream: Whether to stream responses and parse them line by line as they arrive
         """
         super().__init__(
             name="Research Specialist",
             role="Expert researcher with extensive experience in gathering accurate, relevant, and up-to-date information from reliable sources. Specializes in fact-checking, data analysis, and providing comprehensive research insights.",
             goal="Gather comprehensive, accurate, and relevant information to support content creation, ensuring all facts are verified and sources are credible.",
-            verbose=verbose
+            verbose=verbose,
+            stream=stream
         )
     
     def research_topic(self, 
                       topic: str,
                       research_depth: str = "comprehensive",
                       content_type: str = "article",
-                      target_audience: str = "general") -> Dict[str, Any]:
+                      target_audience: str = "general") -> ResearchResult:
         """
         Research a topic comprehensively
         
@@ -41,36 +199,159 @@ class ResearchAgent(BaseAgent):
             target_audience: Target audience for the content
             
         Returns:
-            Dict containing research findings and insights
+            Result containing research findings and insights
+        """
+        task_description = self._research_task(topic, research_depth, content_type, target_audience)
+        semantic_key = self._research_key(topic, research_depth, content_type, target_audience)
+        result, found = self.execute_task_scanned(task_description, _SCANNER, _RESEARCH_BUCKETS, semantic_key=semantic_key)
+        return self._parse_research_result(result, topic, found)
+    
+    async def aresearch_topic(self, 
+                              topic: str,
+                              research_depth: str = "comprehensive",
+                              content_type: str = "article",
+                              target_audience: str = "general") -> ResearchResult:
+        """
+        Research a topic without blocking the event loop
+        
+        Args:
+            topic: Topic to research
+            research_depth: Level of research (basic, comprehensive, in-depth)
+            content_type: Type of content being created
+            target_audience: Target audience for the content
+            
+        Returns:
+            Result containing research findings and insights
+        """
+        task_description = self._research_task(topic, research_depth, content_type, target_audience)
+        semantic_key = self._research_key(topic, research_depth, content_type, target_audience)
+        result = await self.aexecute_task(task_description, semantic_key=semantic_key)
+        return self._parse_research_result(result, topic)
+    
+    def research_topic_batch(self,
+                             topics: List[str],
+                             research_depth: str = "comprehensive",
+                             content_type: str = "article",
+                             target_audience: str = "general",
+                             max_concurrency: int = 5) -> List[ResearchResult]:
+        """
+        Research several topics with concurrent LLM calls
+        
+        Each topic gets its own call, since a full research response per
+        topic would not fit one batched response. Uses asyncio.run, so it
+        cannot be called while an event loop is running; use
+        aresearch_topic_batch from async code.
+        
+        Args:
+            topics: Topics to research
+            research_depth: Level of research (basic, comprehensive, in-depth)
+            content_type: Type of content being created
+            target_audience: Target audience for the content
+            max_concurrency: Maximum number of in-flight LLM requests
+            
+        Returns:
+            List of research results in input order
+        """
+        return asyncio.run(self.aresearch_topic_batch(
+            topics, research_depth, content_type, target_audience, max_concurrency
+        ))
+    
+    async def aresearch_topic_batch(self,
+                                    topics: List[str],
+                                    research_depth: str = "comprehensive",
+                                    content_type: str = "article",
+                                    target_audience: str = "general",
+                                    max_concurrency: int = 5) -> List[ResearchResult]:
+        """
+        Research several topics without blocking the event loop
+        
+        Args:
+            topics: Topics to research
+            research_depth: Level of research (basic, comprehensive, in-depth)
+            content_type: Type of content being created
+            target_audience: Target audience for the content
+            max_concurrency: Maximum number of in-flight LLM requests
+            
+        Returns:
+            List of research results in input order
+        """
+        prompts = [self._research_task(topic, research_depth, content_type, target_audience) for topic in topics]
+        semantic_keys = [self._research_key(topic, research_depth, content_type, target_audience) for topic in topics]
+        results = await self.execute_tasks_batch(prompts, max_concurrency=max_concurrency, semantic_keys=semantic_keys)
+        return [self._parse_research_result(result, topic) for topic, result in zip(topics, results)]
+    
+    def _research_task(self, topic: str, research_depth: str, content_type: str, target_audience: str) -> str:
+        """
+        Build the task description for researching a topic
+        
+        Args:
+            topic: Topic to research
+            research_depth: Level of research (basic, comprehensive, in-depth)
+            content_type: Type of content being created
+            target_audience: Target audience for the content
+            
+        Returns:
+            str: Task description
         """
         if not self.validate_input(topic):
             raise ValueError("Topic cannot be empty")
         
-        task_description = f"""
-        Conduct {research_depth} research on the topic: "{topic}"
-        
-        Content Type: {content_type}
-        Target Audience: {target_audience}
+        task_description = self._RESEARCH_TEMPLATE.format(
+            research_depth=research_depth,
+            topic=topic,
+            content_type=content_type,
+            target_audience=target_audience
+        )
+        return self._json_task(task_description, _RESEARCH_BUCKETS)
+    
+    def _research_key(self,
+                      topic: str,
+                      research_depth: str,
+                      content_type: str,
+                      target_audience: str) -> Tuple[str, str]:
+        """
+        Build the semantic cache key for researching a topic
         
-        Please provide:
-        1. Key facts and statistics
-        2. Current trends and developments
-        3. Expert opinions and quotes
-        4. Relevant case studies or examples
-        5. Historical context (if applicable)
-        6. Controversial aspects or debates
-        7. Future implications or predictions
-        8. Credible sources and references
-        9. Data visualization suggestions
-        10. Research gaps or areas for further study
+        Args:
+            topic: Topic to research
+            research_depth: Level of research (basic, comprehensive, in-depth)
+            content_type: Type of content being created
+            target_audience: Target audience for the content
+            
+        Returns:
+            Tuple of the text to embed and the scope
+        """
+        return self._semantic_key(
+            "research",
+            topic,
+            research_depth=research_depth,
+            content_type=content_type,
+            target_audience=target_audience
+        )
+    
+    @staticmethod
+    def _semantic_key(task: str, topic: str, **fields: Any) -> Tuple[str, str]:
         """
+        Build the semantic cache key for a research task
         
-        result = self.execute_task(task_description)
-        return self._parse_research_result(result, topic)
+        Only the topic is compared by similarity. The task name and output
+        format are part of the exact scope, so a topic researched once is not
+        served as a trend analysis, and a plain-text response is not served
+        when JSON output is enabled.
+        
+        Args:
+            task: Name of the research task
+            topic: Topic of the task
+            **fields: Other variable prompt fields
+            
+        Returns:
+            Tuple of the text to embed and the scope
+        """
+        return SemanticCache.key(topic, task=task, json_output=settings.research_json_output, **fields)
     
     def fact_check_content(self, 
                           content: str,
-                          topic: str) -> Dict[str, Any]:
+                          topic: str) -> FactCheckResult:
         """
         Fact-check content for accuracy
         
@@ -79,31 +360,52 @@ class ResearchAgent(BaseAgent):
             topic: Main topic of the content
             
         Returns:
-            Dict containing fact-checking results
+            Result containing fact-checking results
         """
-        task_description = f"""
-        Fact-check the following content about "{topic}":
+        task_description = self._FACT_CHECK_TEMPLATE.format(topic=topic, content=content)
         
-        {content}
+        task_description = self._json_task(task_description, _FACT_CHECK_BUCKETS + ("accuracy_score",), _ACCURACY_SCORE_FORMAT)
+        result, found = self.execute_task_scanned(task_description, _SCANNER, _FACT_CHECK_BUCKETS, semantic=False)
+        return self._parse_fact_check_result(result, found)
+    
+    def fact_check_batch(self,
+                         contents: List[str],
+                         topic: str) -> List[FactCheckResult]:
+        """
+        Fact-check several pieces of content with a single LLM call
         
-        Please verify:
-        1. All factual claims and statements
-        2. Statistics and data accuracy
-        3. Quote authenticity and attribution
-        4. Date and timeline accuracy
-        5. Source credibility and reliability
-        6. Context accuracy and completeness
-        7. Potential biases or misinformation
-        8. Recommendations for corrections
+        Items missing from the batched response are fact-checked individually.
+        
+        Args:
+            contents: Content items to fact-check
+            topic: Main topic of the content
+            
+        Returns:
+            List of fact-checking results in input order
         """
+        if not contents:
+            return []
+        if not all(self.validate_input(content) for content in contents):
+            raise ValueError("Content cannot be empty")
+        
+        task_description = self._FACT_CHECK_BATCH_TEMPLATE.format(
+            count=len(contents),
+            topic=topic,
+            items=self._format_batch_items(contents)
+        )
         
-        result = self.execute_task(task_description)
-        return self._parse_fact_check_result(result)
+        result = self.execute_task_fast(task_description, semantic=False)
+        sections = self._split_batch_result(result, len(contents))
+        return [
+            self._parse_fact_check_result(section) if section is not None
+            else self.fact_check_content(content, topic)
+            for content, section in zip(contents, sections)
+        ]
     
     def gather_statistics(self, 
                          topic: str,
                          time_period: Optional[str] = None,
-                         geographic_scope: Optional[str] = None) -> Dict[str, Any]:
+                         geographic_scope: Optional[str] = None) -> StatisticsResult:
         """
         Gather relevant statistics for a topic
         
@@ -113,38 +415,23 @@ class ResearchAgent(BaseAgent):
             geographic_scope: Geographic scope for data
             
         Returns:
-            Dict containing statistics and data
+            Result containing statistics and data
         """
-        task_description = f"""
-        Gather relevant statistics and data for: "{topic}"
-        """
-        
+        scope = ""
         if time_period:
-            task_description += f"\nTime Period: {time_period}"
+            scope += f"\nTime Period: {time_period}"
         if geographic_scope:
-            task_description += f"\nGeographic Scope: {geographic_scope}"
+            scope += f"\nGeographic Scope: {geographic_scope}"
         
-        task_description += """
+        task_description = self._STATISTICS_TEMPLATE.format(topic=topic, scope=scope)
         
-        Please provide:
-        1. Key statistics and numbers
-        2. Growth trends and patterns
-        3. Comparative data and benchmarks
-        4. Demographic breakdowns
-        5. Industry-specific metrics
-        6. Economic impact data
-        7. Social and cultural statistics
-        8. Data sources and reliability
-        9. Data visualization suggestions
-        10. Limitations and caveats
-        """
-        
-        result = self.execute_task(task_description)
-        return self._parse_statistics_result(result)
+        task_description = self._json_task(task_description, _STATISTICS_BUCKETS)
+        result, found = self.execute_task_scanned(task_description, _SCANNER, _STATISTICS_BUCKETS, semantic=False)
+        return self._parse_statistics_result(result, found)
     
     def find_expert_quotes(self, 
                            topic: str,
-                           quote_type: str = "general") -> Dict[str, Any]:
+                           quote_type: str = "general") -> QuotesResult:
         """
         Find relevant expert quotes for a topic
         
@@ -153,31 +440,18 @@ class ResearchAgent(BaseAgent):
             quote_type: Type of quotes (general, industry, academic, etc.)
             
         Returns:
-            Dict containing expert quotes and insights
-        """
-        task_description = f"""
-        Find relevant {quote_type} expert quotes and insights for: "{topic}"
-        
-        Please provide:
-        1. Expert quotes with proper attribution
-        2. Industry leader insights
-        3. Academic expert opinions
-        4. Thought leader perspectives
-        5. Controversial or opposing viewpoints
-        6. Historical expert commentary
-        7. Future predictions from experts
-        8. Expert credentials and credibility
-        9. Quote context and relevance
-        10. Source verification and reliability
+            Result containing expert quotes and insights
         """
+        task_description = self._QUOTES_TEMPLATE.format(quote_type=quote_type, topic=topic)
         
-        result = self.execute_task(task_description)
-        return self._parse_quotes_result(result)
+        task_description = self._json_task(task_description, _QUOTES_BUCKETS)
+        result, found = self.execute_task_scanned(task_description, _SCANNER, _QUOTES_BUCKETS, semantic=False)
+        return self._parse_quotes_result(result, found)
     
     def analyze_trends(self, 
                        topic: str,
                        time_period: str = "recent",
-                       trend_type: str = "general") -> Dict[str, Any]:
+                       trend_type: str = "general") -> TrendsResult:
         """
         Analyze trends related to a topic
         
@@ -187,289 +461,161 @@ class ResearchAgent(BaseAgent):
             trend_type: Type of trends to analyze
             
         Returns:
-            Dict containing trend analysis
+            Result containing trend analysis
         """
-        task_description = f"""
-        Analyze {trend_type} trends related to: "{topic}"
-        
-        Time Period: {time_period}
+        task_description = self._TRENDS_TEMPLATE.format(trend_type=trend_type, topic=topic, time_period=time_period)
         
-        Please provide:
-        1. Current trend analysis
-        2. Historical trend patterns
-        3. Emerging trends and developments
-        4. Trend drivers and factors
-        5. Industry-specific trends
-        6. Consumer behavior trends
-        7. Technology impact on trends
-        8. Future trend predictions
-        9. Trend implications and consequences
-        10. Data sources and methodology
-        """
-        
-        result = self.execute_task(task_description)
-        return self._parse_trends_result(result)
+        task_description = self._json_task(task_description, _TRENDS_BUCKETS)
+        semantic_key = self._semantic_key("trends", topic, time_period=time_period, trend_type=trend_type)
+        result, found = self.execute_task_scanned(task_description, _SCANNER, _TRENDS_BUCKETS, semantic_key=semantic_key)
+        return self._parse_trends_result(result, found)
     
-    def _parse_research_result(self, research_text: str, topic: str) -> Dict[str, Any]:
+    def _parse_research_result(self, research_text: str, topic: str, found: Optional[Dict[str, List[str]]] = None) -> ResearchResult:
         """
         Parse research result into structured format
         
         Args:
             research_text: Raw research text
             topic: Original research topic
+            found: Lines already classified while streaming, if any
             
         Returns:
-            Dict containing structured research data
-        """
-        return {
-            "topic": topic,
-            "research_findings": research_text,
-            "key_facts": self._extract_key_facts(research_text),
-            "sources": self._extract_sources(research_text),
-            "insights": self._extract_insights(research_text),
-            "recommendations": self._extract_recommendations(research_text)
-        }
+            Result containing structured research data
+        """
+        data = load_json_object(research_text)
+        if data is not None:
+            found = json_lists(data, _RESEARCH_BUCKETS)
+        elif found is None:
+            found = _SCANNER.scan(research_text, _RESEARCH_BUCKETS)
+        return ResearchResult(
+            topic=topic,
+            research_findings=research_text,
+            key_facts=found["key_facts"],
+            sources=found["sources"],
+            insights=found["insights"],
+            recommendations=found["recommendations"]
+        )
     
-    def _parse_fact_check_result(self, fact_check_text: str) -> Dict[str, Any]:
+    def _parse_fact_check_result(self, fact_check_text: str, found: Optional[Dict[str, List[str]]] = None) -> FactCheckResult:
         """
         Parse fact-check result into structured format
         
         Args:
             fact_check_text: Raw fact-check text
+            found: Lines already classified while streaming, if any
             
         Returns:
-            Dict containing structured fact-check data
-        """
-        return {
-            "fact_check_results": fact_check_text,
-            "verified_facts": self._extract_verified_facts(fact_check_text),
-            "corrections_needed": self._extract_corrections(fact_check_text),
-            "accuracy_score": self._extract_accuracy_score(fact_check_text),
-            "sources_verified": self._extract_verified_sources(fact_check_text)
-        }
+            Result containing structured fact-check data
+        """
+        data = load_json_object(fact_check_text)
+        if data is not None:
+            found = json_lists(data, _FACT_CHECK_BUCKETS)
+        elif found is None:
+            found = _SCANNER.scan(fact_check_text, _FACT_CHECK_BUCKETS)
+        return FactCheckResult(
+            fact_check_results=fact_check_text,
+            verified_facts=found["verified_facts"],
+            corrections_needed=found["corrections_needed"],
+            accuracy_score=(
+                json_score(data.get("accuracy_score")) if data is not None
+                else self._extract_accuracy_score(fact_check_text)
+            ),
+            sources_verified=found["sources_verified"]
+        )
     
-    def _parse_statistics_result(self, stats_text: str) -> Dict[str, Any]:
+    def _parse_statistics_result(self, stats_text: str, found: Optional[Dict[str, List[str]]] = None) -> StatisticsResult:
         """
         Parse statistics result into structured format
         
         Args:
             stats_text: Raw statistics text
+            found: Lines already classified while streaming, if any
             
         Returns:
-            Dict containing structured statistics data
-        """
-        return {
-            "statistics_data": stats_text,
-            "key_numbers": self._extract_key_numbers(stats_text),
-            "trends": self._extract_trends(stats_text),
-            "data_sources": self._extract_data_sources(stats_text),
-            "visualization_suggestions": self._extract_viz_suggestions(stats_text)
-        }
+            Result containing structured statistics data
+        """
+        data = load_json_object(stats_text)
+        if data is not None:
+            found = json_lists(data, _STATISTICS_BUCKETS)
+        elif found is None:
+            found = _SCANNER.scan(stats_text, _STATISTICS_BUCKETS)
+        return StatisticsResult(
+            statistics_data=stats_text,
+            key_numbers=found["key_numbers"],
+            trends=found["trends"],
+            data_sources=found["data_sources"],
+            visualization_suggestions=found["visualization_suggestions"]
+        )
     
-    def _parse_quotes_result(self, quotes_text: str) -> Dict[str, Any]:
+    def _parse_quotes_result(self, quotes_text: str, found: Optional[Dict[str, List[str]]] = None) -> QuotesResult:
         """
         Parse quotes result into structured format
         
         Args:
             quotes_text: Raw quotes text
+            found: Lines already classified while streaming, if any
             
         Returns:
-            Dict containing structured quotes data
-        """
-        return {
-            "expert_quotes": quotes_text,
-            "quotes_list": self._extract_quotes(quotes_text),
-            "expert_credentials": self._extract_credentials(quotes_text),
-            "quote_sources": self._extract_quote_sources(quotes_text)
-        }
+            Result containing structured quotes data
+        """
+        data = load_json_object(quotes_text)
+        if data is not None:
+            found = json_lists(data, _QUOTES_BUCKETS)
+        elif found is None:
+            found = _SCANNER.scan(quotes_text, _QUOTES_BUCKETS)
+        return QuotesResult(
+            expert_quotes=quotes_text,
+            quotes_list=found["quotes_list"],
+            expert_credentials=found["expert_credentials"],
+            quote_sources=found["quote_sources"]
+        )
     
-    def _parse_trends_result(self, trends_text: str) -> Dict[str, Any]:
+    def _parse_trends_result(self, trends_text: str, found: Optional[Dict[str, List[str]]] = None) -> TrendsResult:
         """
         Parse trends result into structured format
         
         Args:
             trends_text: Raw trends text
+            found: Lines already classified while streaming, if any
             
         Returns:
-            Dict containing structured trends data
-        """
-        return {
-            "trend_analysis": trends_text,
-            "current_trends": self._extract_current_trends(trends_text),
-            "emerging_trends": self._extract_emerging_trends(trends_text),
-            "future_predictions": self._extract_future_predictions(trends_text),
-            "trend_implications": self._extract_trend_implications(trends_text)
-        }
-    
-    # Helper methods for extracting specific information
-    def _extract_key_facts(self, text: str) -> List[str]:
-        """Extract key facts from research text"""
-        facts = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['fact', 'statistic', 'data', 'figure']):
-                facts.append(line.strip())
-        return facts
-    
-    def _extract_sources(self, text: str) -> List[str]:
-        """Extract sources from research text"""
-        sources = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['source', 'reference', 'study', 'report']):
-                sources.append(line.strip())
-        return sources
-    
-    def _extract_insights(self, text: str) -> List[str]:
-        """Extract insights from research text"""
-        insights = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['insight', 'finding', 'discovery', 'observation']):
-                insights.append(line.strip())
-        return insights
-    
-    def _extract_recommendations(self, text: str) -> List[str]:
-        """Extract recommendations from research text"""
-        recommendations = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['recommend', 'suggest', 'advise', 'propose']):
-                recommendations.append(line.strip())
-        return recommendations
-    
-    def _extract_verified_facts(self, text: str) -> List[str]:
-        """Extract verified facts from fact-check text"""
-        facts = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['verified', 'confirmed', 'accurate', 'correct']):
-                facts.append(line.strip())
-        return facts
+            Result containing structured trends data
+        """
+        data = load_json_object(trends_text)
+        if data is not None:
+            found = json_lists(data, _TRENDS_BUCKETS)
+        elif found is None:
+            found = _SCANNER.scan(trends_text, _TRENDS_BUCKETS)
+        return TrendsResult(
+            trend_analysis=trends_text,
+            current_trends=found["current_trends"],
+            emerging_trends=found["emerging_trends"],
+            future_predictions=found["future_predictions"],
+            trend_implications=found["trend_implications"]
+        )
     
-    def _extract_corrections(self, text: str) -> List[str]:
-        """Extract corrections needed from fact-check text"""
-        corrections = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['correction', 'error', 'inaccurate', 'wrong']):
-                corrections.append(line.strip())
-        return corrections
+    def _json_task(self, task_description: str, keys: Tuple[str, ...], extra: str = "") -> str:
+        """
+        Ask for a JSON response when JSON output is enabled
+        
+        Args:
+            task_description: Task prompt
+            keys: Keys the JSON object must have
+            extra: Additional note on the value types
+            
+        Returns:
+            str: The prompt, with the JSON format instructions appended if enabled
+        """
+        if not settings.research_json_output:
+            return task_description
+        return task_description + _JSON_FORMAT.format(keys=", ".join(keys), extra=extra)
     
+    # Helper methods for extracting specific information
     def _extract_accuracy_score(self, text: str) -> Optional[int]:
         """Extract accuracy score from fact-check text"""
-        import re
-        score_match = re.search(r'accuracy[:\s]*(\d+)', text.lower())
+        score_match = _ACCURACY_RE.search(text.lower())
         return int(score_match.group(1)) if score_match else None
     
-    def _extract_verified_sources(self, text: str) -> List[str]:
-        """Extract verified sources from fact-check text"""
-        sources = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['verified source', 'credible', 'reliable']):
-                sources.append(line.strip())
-        return sources
-    
-    def _extract_key_numbers(self, text: str) -> List[str]:
-        """Extract key numbers from statistics text"""
-        numbers = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['percent', 'million', 'billion', 'thousand']):
-                numbers.append(line.strip())
-        return numbers
-    
-    def _extract_trends(self, text: str) -> List[str]:
-        """Extract trends from statistics text"""
-        trends = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['trend', 'growth', 'increase', 'decrease']):
-                trends.append(line.strip())
-        return trends
-    
-    def _extract_data_sources(self, text: str) -> List[str]:
-        """Extract data sources from statistics text"""
-        sources = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['source', 'data from', 'according to']):
-                sources.append(line.strip())
-        return sources
-    
-    def _extract_viz_suggestions(self, text: str) -> List[str]:
-        """Extract visualization suggestions from statistics text"""
-        suggestions = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['chart', 'graph', 'visualization', 'diagram']):
-                suggestions.append(line.strip())
-        return suggestions
-    
-    def _extract_quotes(self, text: str) -> List[str]:
-        """Extract quotes from quotes text"""
-        quotes = []
-        lines = text.split('\n')
-        for line in lines:
-            if '"' in line or "'" in line:
-                quotes.append(line.strip())
-        return quotes
-    
-    def _extract_credentials(self, text: str) -> List[str]:
-        """Extract expert credentials from quotes text"""
-        credentials = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['phd', 'professor', 'expert', 'specialist']):
-                credentials.append(line.strip())
-        return credentials
-    
-    def _extract_quote_sources(self, text: str) -> List[str]:
-        """Extract quote sources from quotes text"""
-        sources = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['source', 'interview', 'study', 'report']):
-                sources.append(line.strip())
-        return sources
-    
-    def _extract_current_trends(self, text: str) -> List[str]:
-        """Extract current trends from trends text"""
-        trends = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['current', 'present', 'now', 'today']):
-                trends.append(line.strip())
-        return trends
-    
-    def _extract_emerging_trends(self, text: str) -> List[str]:
-        """Extract emerging trends from trends text"""
-        trends = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['emerging', 'new', 'developing', 'growing']):
-                trends.append(line.strip())
-        return trends
-    
-    def _extract_future_predictions(self, text: str) -> List[str]:
-        """Extract future predictions from trends text"""
-        predictions = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['future', 'prediction', 'forecast', 'will']):
-                predictions.append(line.strip())
-        return predictions
-    
-    def _extract_trend_implications(self, text: str) -> List[str]:
-        """Extract trend implications from trends text"""
-        implications = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['implication', 'impact', 'effect', 'consequence']):
-                implications.append(line.strip())
-        return implications
-    
     def validate_input(self, input_data: Any) -> bool:
         """
         Validate input for research agent
@@ -481,5 +627,5 @@ class ResearchAgent(BaseAgent):
             bool: True if valid, False otherwise
         """
         if isinstance(input_data, str):
-            return len(input_data.strip()) > 0
+            return bool(input_data) and not input_data.isspace()
         return False 
\ No newline at end of file
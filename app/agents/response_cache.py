@@ -0,0 +1,131 @@
+"""
+Response Cache for AI Content Studio
+
+This module provides an exact-match response cache for agents. Responses are
+keyed by a SHA-256 hash of the full prompt together with the agent, model and
+temperature that produced them, and kept in an in-memory LRU with an optional
+SQLite layer so they survive restarts. Entries expire after a fixed TTL.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+
+class ResponseCache:
+    """Exact-match response cache with an in-memory LRU and optional SQLite layer"""
+    
+    def __init__(self, max_entries: int = 1024, ttl: int = 86400, path: Optional[str] = None):
+        """
+        Initialize response cache
+        
+        Args:
+            max_entries: Maximum number of responses kept in memory before LRU eviction
+            ttl: Seconds before a cached response expires
+            path: SQLite database file for the persistent layer; memory only if None
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        
+        # Key -> (response, expiry time), most recently used last
+        self._memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, response TEXT, expires_at REAL)"
+            )
+            self._db.commit()
+    
+    def __len__(self) -> int:
+        return len(self._memory)
+    
+    @staticmethod
+    def key(prompt: str, agent: str, model: str, temperature: float) -> str:
+        """
+        Build the cache key for a prompt
+        
+        Args:
+            prompt: Full prompt text
+            agent: Name of the agent handling the prompt
+            model: LLM model name
+            temperature: LLM sampling temperature
+            
+        Returns:
+            str: Hex SHA-256 digest identifying the request
+        """
+        return hashlib.sha256(f"{agent}\0{model}\0{temperature}\0{prompt}".encode()).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get a cached response, dropping it if it has expired
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            The cached response, or None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[1] > now:
+                    self._memory.move_to_end(key)
+                    return entry[0]
+                del self._memory[key]
+            
+            if self._db is None:
+                return None
+            
+            row = self._db.execute(
+                "SELECT response, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._db.commit()
+                return None
+            
+            self._remember(key, row[0], row[1])
+            return row[0]
+    
+    def set(self, key: str, response: str):
+        """
+        Store a response
+        
+        Args:
+            key: Cache key
+            response: Response to cache
+        """
+        expires_at = time.time() + self.ttl
+        with self._lock:
+            self._remember(key, response, expires_at)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, response, expires_at) VALUES (?, ?, ?)",
+                    (key, response, expires_at)
+                )
+                self._db.commit()
+    
+    def _remember(self, key: str, response: str, expires_at: float):
+        """Keep a response in memory, evicting the least recently used entry when full"""
+        self._memory[key] = (response, expires_at)
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+    
+    def clear(self):
+        """Remove all cached responses"""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
@@ -0,0 +1,150 @@
+"""
+Structured agent results for AI Content Studio
+
+This module defines the slotted dataclasses returned by agent parsers.
+Each result exposes its fields as attributes and provides to_dict() for
+callers that still expect the original dictionary shape.
+"""
+
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+
+
+class AgentResult:
+    """Base class for structured agent results"""
+    
+    __slots__ = ()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the result to a dictionary
+        
+        Returns:
+            Dict containing the result fields
+        """
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class IdeasResult(AgentResult):
+    """Creative content ideas for a topic"""
+    
+    topic: str
+    ideas_text: str
+    idea_list: List[str]
+    creative_angles: List[str]
+    engagement_potential: List[str]
+
+
+@dataclass(slots=True)
+class HeadlinesResult(AgentResult):
+    """Brainstormed headlines"""
+    
+    headlines_text: str
+    headline_list: List[str]
+    headline_styles: List[str]
+    click_through_potential: List[str]
+
+
+@dataclass(slots=True)
+class HooksResult(AgentResult):
+    """Content hooks"""
+    
+    hooks_text: str
+    hook_list: List[str]
+    hook_types: List[str]
+    emotional_impact: List[str]
+
+
+@dataclass(slots=True)
+class ViralConceptsResult(AgentResult):
+    """Viral content concepts"""
+    
+    viral_concepts_text: str
+    concept_list: List[str]
+    viral_scores: List[str]
+    emotional_triggers: List[str]
+
+
+@dataclass(slots=True)
+class SeriesResult(AgentResult):
+    """Content series concept"""
+    
+    series_text: str
+    series_concept: str
+    series_parts: List[str]
+    series_flow: List[str]
+
+
+@dataclass(slots=True)
+class ReviewResult(AgentResult):
+    """Content review with score and feedback"""
+    
+    review_text: str
+    overall_score: Optional[int]
+    suggestions: List[str]
+    positive_aspects: List[str]
+
+
+@dataclass(slots=True)
+class GrammarResult(AgentResult):
+    """Grammar and style analysis"""
+    
+    grammar_analysis: str
+    errors_found: List[str]
+    suggestions: List[str]
+
+
+@dataclass(slots=True)
+class ResearchResult(AgentResult):
+    """Research findings for a topic"""
+    
+    topic: str
+    research_findings: str
+    key_facts: List[str]
+    sources: List[str]
+    insights: List[str]
+    recommendations: List[str]
+
+
+@dataclass(slots=True)
+class FactCheckResult(AgentResult):
+    """Fact-check of a piece of content"""
+    
+    fact_check_results: str
+    verified_facts: List[str]
+    corrections_needed: List[str]
+    accuracy_score: Optional[int]
+    sources_verified: List[str]
+
+
+@dataclass(slots=True)
+class StatisticsResult(AgentResult):
+    """Statistics and data for a topic"""
+    
+    statistics_data: str
+    key_numbers: List[str]
+    trends: List[str]
+    data_sources: List[str]
+    visualization_suggestions: List[str]
+
+
+@dataclass(slots=True)
+class QuotesResult(AgentResult):
+    """Expert quotes for a topic"""
+    
+    expert_quotes: str
+    quotes_list: List[str]
+    expert_credentials: List[str]
+    quote_sources: List[str]
+
+
+@dataclass(slots=True)
+class TrendsResult(AgentResult):
+    """Trend analysis for a topic"""
+    
+    trend_analysis: str
+    current_trends: List[str]
+    emerging_trends: List[str]
+    future_predictions: List[str]
+    trend_implications: List[str]
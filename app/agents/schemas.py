@@ -0,0 +1,34 @@
+"""
+Agent request schemas for AI Content Studio
+
+This module defines the pydantic models that validate agent requests once at
+the method boundary. Validation errors are raised as pydantic ValidationError,
+which is a ValueError subclass.
+"""
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+class CreativeRequest(BaseModel):
+    """Topic and content type shared by all creative requests"""
+    
+    model_config = ConfigDict(frozen=True)
+    
+    topic: str
+    content_type: str = "article"
+    
+    @field_validator("topic")
+    @classmethod
+    def topic_not_blank(cls, topic: str) -> str:
+        """Reject empty or whitespace-only topics"""
+        if not topic.strip():
+            raise ValueError("Topic cannot be empty")
+        return topic
+
+
+class IdeasRequest(CreativeRequest):
+    """Request for creative content ideas"""
+    
+    target_audience: str = "general"
+    idea_count: int = Field(default=10, gt=0)
+    creativity_level: str = "high"
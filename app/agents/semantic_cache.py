@@ -0,0 +1,412 @@
+"""
+Semantic Cache for AI Content Studio
+
+This module provides an embedding-based response cache for agents. Prompts are
+embedded with a sentence-transformer model and a stored response is reused when
+a new prompt is close enough (cosine similarity) to one already answered.
+Agents with templated prompts embed a key built from the prompt's variable
+fields instead, where only the free text is compared by similarity and the
+other fields must match exactly.
+
+Entries live in an in-memory tier with LRU eviction. When a storage directory
+is configured, the most frequently hit entries are periodically promoted to an
+on-disk tier (a memory-mapped int8 embedding matrix plus SQLite metadata) so they
+survive restarts.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+EMBEDDING_DIM = 384
+
+# Embeddings are stored as int8 with a fixed scale; components of a normalized
+# vector lie in [-1, 1], so rounding error per component is at most 1/254
+QUANT_SCALE = 127
+
+# Semantic caches shared by all agents of the same class
+_REGISTRY: Dict[str, "SemanticCache"] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+# Number of lookups between promotions to the on-disk tier, and the maximum
+# number of entries promoted each time
+CONSOLIDATE_EVERY = 64
+CONSOLIDATE_TOP_K = 16
+
+
+@lru_cache(maxsize=1)
+def get_embedder():
+    """
+    Load the sentence-transformer model on first use
+    
+    The model is shared by the semantic caches of every agent class, so it is
+    loaded once per process.
+    
+    Returns:
+        SentenceTransformer: Shared embedding model
+    """
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError as e:
+        raise ImportError(
+            "sentence-transformers is required when the semantic cache is enabled"
+        ) from e
+    return SentenceTransformer(EMBEDDING_MODEL)
+
+
+@lru_cache(maxsize=256)
+def _scope_transform(scope: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get the signed permutation applied to embeddings of a scope
+    
+    Entries of different scopes share one embedding matrix. Each scope
+    permutes and sign-flips the embedding dimensions in its own fixed way,
+    which keeps similarities within a scope unchanged and makes embeddings
+    of different scopes close to orthogonal (cosine similarity around
+    1/sqrt(EMBEDDING_DIM)), far below any useful threshold. The transform is
+    derived from a hash of the scope, so it is stable across restarts.
+    
+    Args:
+        scope: Scope part of a semantic cache key
+        
+    Returns:
+        Tuple of the dimension permutation and the signs
+    """
+    seed = int.from_bytes(hashlib.sha256(scope.encode()).digest()[:8], "little")
+    rng = np.random.default_rng(seed)
+    signs = rng.choice(np.array([-1.0, 1.0], dtype=np.float32), EMBEDDING_DIM)
+    return rng.permutation(EMBEDDING_DIM), signs
+
+
+class LongTermCache:
+    """On-disk cache tier backed by a memory-mapped matrix and SQLite"""
+    
+    def __init__(self, path: str, max_entries: int = 16384):
+        """
+        Open or create an on-disk cache tier
+        
+        Args:
+            path: Directory holding the embedding matrix and metadata database
+            max_entries: Maximum number of stored responses before LFU eviction
+        """
+        os.makedirs(path, exist_ok=True)
+        self.max_entries = max_entries
+        
+        # Row i of the int8 embedding matrix belongs to the entry with id i
+        emb_path = os.path.join(path, "ltm.i8")
+        mode = "r+" if os.path.exists(emb_path) else "w+"
+        self._emb = np.memmap(emb_path, dtype=np.int8, mode=mode, shape=(max_entries, EMBEDDING_DIM))
+        
+        self._db = sqlite3.connect(os.path.join(path, "ltm.sqlite"), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "id INTEGER PRIMARY KEY, prompt_hash TEXT UNIQUE, response TEXT, freq INTEGER)"
+        )
+        self._db.commit()
+        self._size = self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def search(self, embedding: np.ndarray, threshold: float) -> Optional[str]:
+        """
+        Find the stored response closest to a prompt embedding
+        
+        Args:
+            embedding: Quantized prompt embedding
+            threshold: Minimum cosine similarity for a hit
+            
+        Returns:
+            The stored response, or None on a miss
+        """
+        if self._size == 0:
+            return None
+        
+        # int8 dot products accumulated in int32, rescaled to cosine similarity
+        sims = np.matmul(self._emb[:self._size], embedding, dtype=np.int32) / QUANT_SCALE ** 2
+        best = int(np.argmax(sims))
+        if sims[best] < threshold:
+            return None
+        
+        row = self._db.execute("SELECT response FROM entries WHERE id = ?", (best,)).fetchone()
+        self._db.execute("UPDATE entries SET freq = freq + 1 WHERE id = ?", (best,))
+        self._db.commit()
+        return row[0]
+    
+    def store(self, entries: List[Tuple[np.ndarray, str, int]]):
+        """
+        Store entries, replacing the least frequently used ones when full
+        
+        Args:
+            entries: Tuples of quantized prompt embedding, response and hit count
+        """
+        for embedding, response, freq in entries:
+            prompt_hash = hashlib.sha1(embedding.tobytes()).hexdigest()
+            existing = self._db.execute(
+                "SELECT id FROM entries WHERE prompt_hash = ?", (prompt_hash,)
+            ).fetchone()
+            if existing is not None:
+                self._db.execute("UPDATE entries SET freq = freq + ? WHERE id = ?", (freq, existing[0]))
+                continue
+            
+            if self._size < self.max_entries:
+                slot = self._size
+                self._size += 1
+            else:
+                slot = self._db.execute("SELECT id FROM entries ORDER BY freq LIMIT 1").fetchone()[0]
+                self._db.execute("DELETE FROM entries WHERE id = ?", (slot,))
+            
+            self._emb[slot] = embedding
+            self._db.execute(
+                "INSERT INTO entries (id, prompt_hash, response, freq) VALUES (?, ?, ?, ?)",
+                (slot, prompt_hash, response, freq)
+            )
+        
+        self._emb.flush()
+        self._db.commit()
+    
+    def close(self):
+        """Flush the embedding matrix and close the metadata database"""
+        self._emb.flush()
+        self._db.close()
+
+
+class SemanticCache:
+    """Semantic cache with an in-memory LRU tier and an optional on-disk tier"""
+    
+    def __init__(self,
+                 threshold: float = 0.87,
+                 max_entries: int = 1024,
+                 path: Optional[str] = None,
+                 ltm_entries: int = 16384):
+        """
+        Initialize semantic cache
+        
+        Args:
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries: Maximum number of cached responses before LRU eviction
+            path: Directory for the on-disk tier; responses are kept in memory only if None
+            ltm_entries: Maximum number of responses kept in the on-disk tier
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.logger = logging.getLogger("agent.semantic_cache")
+        
+        # Preallocated int8 embedding matrix, response values and LRU clock
+        self._cache_emb = np.zeros((max_entries, EMBEDDING_DIM), dtype=np.int8)
+        self._cache_val: List[str] = []
+        self._last_used = np.zeros(max_entries, dtype=np.int64)
+        self._clock = 0
+        
+        # Hits per in-memory entry since its last promotion to the on-disk tier
+        self._hits = np.zeros(max_entries, dtype=np.int64)
+        self._lookups = 0
+        self.ltm = LongTermCache(path, ltm_entries) if path else None
+        
+        # Agents may run tasks from several threads at once
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._cache_val)
+    
+    @staticmethod
+    def normalize(prompt: str) -> str:
+        """
+        Normalize a prompt so trivially different wordings embed identically
+        
+        Args:
+            prompt: Prompt text
+            
+        Returns:
+            str: Lowercased prompt with whitespace collapsed
+        """
+        return " ".join(prompt.lower().split())
+    
+    @staticmethod
+    def key(text: str, **fields: Any) -> Tuple[str, str]:
+        """
+        Build the semantic cache key for a prompt from its variable fields
+        
+        Embedding the whole prompt lets the shared template text dominate
+        the similarity, and the embedding model truncates long prompts, so
+        fields after the first few hundred tokens would not count at all.
+        Only the free text (e.g. the topic) is embedded; the other fields
+        form a scope that must match exactly, with list values sorted so
+        their order does not matter.
+        
+        Args:
+            text: Free text of the prompt, compared by similarity
+            **fields: Other variable prompt fields, compared exactly
+            
+        Returns:
+            Tuple of the text to embed and the scope
+        """
+        parts = []
+        for name, value in sorted(fields.items()):
+            if isinstance(value, (list, tuple)):
+                value = ", ".join(sorted(str(item).strip().lower() for item in value))
+            parts.append(f"{name}: {str(value).strip()}")
+        return text, SemanticCache.normalize("; ".join(parts))
+    
+    def embed(self, prompt: str) -> np.ndarray:
+        """
+        Embed a normalized prompt as a normalized vector
+        
+        Args:
+            prompt: Prompt text
+            
+        Returns:
+            np.ndarray: Normalized embedding
+        """
+        embedding = get_embedder().encode(self.normalize(prompt), normalize_embeddings=True)
+        return np.asarray(embedding, dtype=np.float32)
+    
+    @staticmethod
+    def quantize(embedding: np.ndarray) -> np.ndarray:
+        """
+        Quantize a normalized embedding to int8
+        
+        Args:
+            embedding: Normalized float embedding
+            
+        Returns:
+            np.ndarray: int8 embedding scaled by QUANT_SCALE
+        """
+        return np.round(embedding * QUANT_SCALE).astype(np.int8)
+    
+    def lookup(self, prompt: str, scope: str = "") -> Tuple[Optional[str], np.ndarray]:
+        """
+        Look up a cached response for a prompt
+        
+        Args:
+            prompt: Prompt text, or the text part of a key from key()
+            scope: Scope part of a key from key(); only entries with the same scope can match
+            
+        Returns:
+            Tuple of the cached response (None on a miss) and the quantized prompt embedding
+        """
+        embedding = self.embed(prompt)
+        if scope:
+            permutation, signs = _scope_transform(scope)
+            embedding = embedding[permutation] * signs
+        query = self.quantize(embedding)
+        with self._lock:
+            self._lookups += 1
+            if self.ltm is not None and self._lookups % CONSOLIDATE_EVERY == 0:
+                self._consolidate()
+            
+            size = len(self._cache_val)
+            if size:
+                # int8 dot products accumulated in int32, rescaled to cosine similarity
+                sims = np.matmul(self._cache_emb[:size], query, dtype=np.int32) / QUANT_SCALE ** 2
+                best = int(np.argmax(sims))
+                if sims[best] >= self.threshold:
+                    self._clock += 1
+                    self._last_used[best] = self._clock
+                    self._hits[best] += 1
+                    self.logger.debug("Semantic cache hit (similarity %.3f)", sims[best])
+                    return self._cache_val[best], query
+            
+            if self.ltm is None:
+                return None, query
+            
+            response = self.ltm.search(query, self.threshold)
+            if response is None:
+                return None, query
+        
+        # Keep the on-disk hit in memory for the next lookups
+        self.logger.debug("Semantic cache hit from on-disk tier")
+        self.add(query, response)
+        return response, query
+    
+    def add(self, embedding: np.ndarray, response: str):
+        """
+        Store a response under a prompt embedding
+        
+        Args:
+            embedding: Quantized prompt embedding returned by lookup
+            response: Response to cache
+        """
+        with self._lock:
+            self._clock += 1
+            size = len(self._cache_val)
+            if size < self.max_entries:
+                slot = size
+                self._cache_val.append(response)
+            else:
+                # Evict the least recently used entry
+                slot = int(np.argmin(self._last_used))
+                self._cache_val[slot] = response
+            
+            self._cache_emb[slot] = embedding
+            self._last_used[slot] = self._clock
+            self._hits[slot] = 0
+    
+    def _consolidate(self):
+        """Promote the most frequently hit in-memory entries to the on-disk tier"""
+        size = len(self._cache_val)
+        hot = [int(i) for i in np.argsort(self._hits[:size])[::-1][:CONSOLIDATE_TOP_K] if self._hits[i] > 0]
+        if not hot:
+            return
+        
+        self.ltm.store([(self._cache_emb[i], self._cache_val[i], int(self._hits[i])) for i in hot])
+        self._hits[hot] = 0
+        self.logger.debug("Promoted %d entries to the on-disk semantic cache", len(hot))
+    
+    def close(self):
+        """Promote hot in-memory entries and close the on-disk tier"""
+        if self.ltm is None:
+            return
+        with self._lock:
+            self._consolidate()
+            self.ltm.close()
+            self.ltm = None
+    
+    def clear(self):
+        """Remove all in-memory cached responses"""
+        with self._lock:
+            self._cache_val.clear()
+            self._last_used[:] = 0
+            self._hits[:] = 0
+            self._clock = 0
+
+
+def get_semantic_cache(namespace: str,
+                       threshold: float = 0.87,
+                       max_entries: int = 1024,
+                       path: Optional[str] = None,
+                       ltm_entries: int = 16384) -> SemanticCache:
+    """
+    Get the semantic cache for a namespace, creating it on first use
+    
+    Agents of the same class share one cache, so every instance benefits from
+    responses earned by the others. Settings only apply when the cache is created.
+    
+    Args:
+        namespace: Cache namespace, usually the agent class name
+        threshold: Minimum cosine similarity for a cache hit
+        max_entries: Maximum number of cached responses before LRU eviction
+        path: Directory for the on-disk tier; responses are kept in memory only if None
+        ltm_entries: Maximum number of responses kept in the on-disk tier
+        
+    Returns:
+        SemanticCache: Shared cache for the namespace
+    """
+    with _REGISTRY_LOCK:
+        cache = _REGISTRY.get(namespace)
+        if cache is None:
+            cache = _REGISTRY[namespace] = SemanticCache(
+                threshold=threshold,
+                max_entries=max_entries,
+                path=path,
+                ltm_entries=ltm_entries
+            )
+        return cache
@@ -5,13 +5,143 @@ This agent specializes in optimizing content for search engines.
 It focuses on keyword research, SEO best practices, and content optimization.
 """
 
-from typing import Dict, Any, Optional, List
+import re
+from typing import Dict, Any, Optional, List, Tuple
 from .base_agent import BaseAgent
+from .keyword_scanner import KeywordScanner
+
+# Keywords that classify a line of agent output, matched against the lowercased line
+_SEO_RECOMMENDATIONS_KEYWORDS = frozenset({'recommend', 'suggest', 'improve', 'optimize'})
+_SEO_IMPROVEMENTS_KEYWORDS = frozenset({'improve', 'fix', 'optimize', 'enhance'})
+_SEO_STRENGTHS_KEYWORDS = frozenset({'good', 'strong', 'excellent', 'well'})
+
+_SCANNER = KeywordScanner({
+    "recommendations": _SEO_RECOMMENDATIONS_KEYWORDS,
+    "improvements": _SEO_IMPROVEMENTS_KEYWORDS,
+    "strengths": _SEO_STRENGTHS_KEYWORDS
+})
+
+# Matched against the lowercased response
+_SEO_SCORE_RE = re.compile(r'seo score[:\s]*(\d+)')
+
+
+def _last_line_with(lowered_text: str, word: str, exclude: Optional[str] = None) -> Optional[int]:
+    """
+    Find the last line containing a word, searching backwards from the end
+    
+    Args:
+        lowered_text: Lowercased text to search
+        word: Lowercase word the line must contain
+        exclude: Lowercase word the line must not contain, if any
+        
+    Returns:
+        Index of the matching line, or None if no line matches
+    """
+    end = len(lowered_text)
+    while True:
+        position = lowered_text.rfind(word, 0, end)
+        if position < 0:
+            return None
+        start = lowered_text.rfind('\n', 0, position) + 1
+        stop = lowered_text.find('\n', position)
+        if exclude is None or exclude not in lowered_text[start:stop if stop >= 0 else len(lowered_text)]:
+            return lowered_text.count('\n', 0, position)
+        end = start
+
+
+def _lines_with(lowered_text: str, words: Tuple[str, ...]) -> List[int]:
+    """
+    Find the lines containing any of several words
+    
+    Args:
+        lowered_text: Lowercased text to search
+        words: Lowercase words to look for
+        
+    Returns:
+        Sorted indices of the matching lines
+    """
+    indices = set()
+    for word in words:
+        line = 0
+        counted = 0
+        position = lowered_text.find(word)
+        while position >= 0:
+            line += lowered_text.count('\n', counted, position)
+            counted = position
+            indices.add(line)
+            position = lowered_text.find(word, position + 1)
+    return sorted(indices)
 
 
 class SEOAgent(BaseAgent):
     """Agent specialized in SEO optimization"""
     
+    # Static prompt bodies, formatted per call
+    _OPTIMIZE_TEMPLATE = """
+        Optimize the following {content_type} content for SEO with target keywords: {target_keywords}
+        
+        Original Content:
+        {content}
+        
+        Target Audience: {target_audience}
+        
+        Please provide:
+        1. SEO-optimized version of the content
+        2. Keyword density analysis
+        3. Meta title and description suggestions
+        4. Header structure recommendations
+        5. Internal linking suggestions
+        6. SEO score and recommendations
+        7. Technical SEO improvements
+        """
+    
+    _META_TAGS_TEMPLATE = """
+        Generate SEO-optimized meta title and description for the following {content_type}:
+        
+        Content:
+        {content}
+        
+        Target Keywords: {target_keywords}
+        
+        Requirements:
+        - Meta title: 50-60 characters
+        - Meta description: 150-160 characters
+        - Include primary keywords naturally
+        - Compelling and click-worthy
+        - Accurate representation of content
+        """
+    
+    _KEYWORDS_TEMPLATE = """
+        Suggest relevant keywords for a {content_type} about "{topic}" targeting {target_audience} audience.
+        
+        Please provide:
+        1. Primary keywords (high search volume)
+        2. Long-tail keywords (specific phrases)
+        3. Related keywords and synonyms
+        4. Keyword difficulty assessment
+        5. Search intent analysis
+        6. Seasonal keyword opportunities
+        7. Local SEO keywords (if applicable)
+        """
+    
+    # The optional keywords section is formatted in, so the content is copied once
+    _ANALYSIS_TEMPLATE = """
+        Perform comprehensive SEO analysis of the following content:
+        
+        {content}
+        {keywords_section}
+        
+        Please analyze:
+        1. Keyword usage and density
+        2. Content structure and headers
+        3. Readability and user experience
+        4. Content length and depth
+        5. Internal linking opportunities
+        6. Technical SEO factors
+        7. Mobile-friendliness considerations
+        8. Overall SEO score and recommendations
+        """
+    
     def __init__(self, verbose: bool = True):
         """
         Initialize SEO Agent
@@ -46,25 +176,14 @@ class SEOAgent(BaseAgent):
         if not self.validate_input(content):
             raise ValueError("Content cannot be empty")
         
-        task_description = f"""
-        Optimize the following {content_type} content for SEO with target keywords: {', '.join(target_keywords)}
-        
-        Original Content:
-        {content}
-        
-        Target Audience: {target_audience}
-        
-        Please provide:
-        1. SEO-optimized version of the content
-        2. Keyword density analysis
-        3. Meta title and description suggestions
-        4. Header structure recommendations
-        5. Internal linking suggestions
-        6. SEO score and recommendations
-        7. Technical SEO improvements
-        """
+        task_description = self._OPTIMIZE_TEMPLATE.format(
+            content_type=content_type,
+            target_keywords=', '.join(target_keywords),
+            content=content,
+            target_audience=target_audience
+        )
         
-        result = self.execute_task(task_description)
+        result = self.execute_task(task_description, semantic=False)
         return self._parse_seo_result(result, target_keywords)
     
     def generate_meta_tags(self, 
@@ -82,23 +201,13 @@ class SEOAgent(BaseAgent):
         Returns:
             Dict containing meta title and description
         """
-        task_description = f"""
-        Generate SEO-optimized meta title and description for the following {content_type}:
-        
-        Content:
-        {content}
-        
-        Target Keywords: {', '.join(target_keywords)}
-        
-        Requirements:
-        - Meta title: 50-60 characters
-        - Meta description: 150-160 characters
-        - Include primary keywords naturally
-        - Compelling and click-worthy
-        - Accurate representation of content
-        """
+        task_description = self._META_TAGS_TEMPLATE.format(
+            content_type=content_type,
+            content=content,
+            target_keywords=', '.join(target_keywords)
+        )
         
-        result = self.execute_task(task_description)
+        result = self.execute_task(task_description, semantic=False)
         return self._parse_meta_tags(result)
     
     def suggest_keywords(self, 
@@ -116,20 +225,13 @@ class SEOAgent(BaseAgent):
         Returns:
             Dict containing keyword suggestions and analysis
         """
-        task_description = f"""
-        Suggest relevant keywords for a {content_type} about "{topic}" targeting {target_audience} audience.
-        
-        Please provide:
-        1. Primary keywords (high search volume)
-        2. Long-tail keywords (specific phrases)
-        3. Related keywords and synonyms
-        4. Keyword difficulty assessment
-        5. Search intent analysis
-        6. Seasonal keyword opportunities
-        7. Local SEO keywords (if applicable)
-        """
+        task_description = self._KEYWORDS_TEMPLATE.format(
+            content_type=content_type,
+            topic=topic,
+            target_audience=target_audience
+        )
         
-        result = self.execute_task(task_description)
+        result = self.execute_task(task_description, semantic=False)
         return self._parse_keyword_suggestions(result)
     
     def analyze_content_seo(self, 
@@ -145,29 +247,13 @@ class SEOAgent(BaseAgent):
         Returns:
             Dict containing SEO analysis results
         """
-        task_description = f"""
-        Perform comprehensive SEO analysis of the following content:
-        
-        {content}
-        """
-        
+        keywords_section = ""
         if target_keywords:
-            task_description += f"\n\nTarget Keywords: {', '.join(target_keywords)}"
-        
-        task_description += """
+            keywords_section = f"\n\nTarget Keywords: {', '.join(target_keywords)}"
         
-        Please analyze:
-        1. Keyword usage and density
-        2. Content structure and headers
-        3. Readability and user experience
-        4. Content length and depth
-        5. Internal linking opportunities
-        6. Technical SEO factors
-        7. Mobile-friendliness considerations
-        8. Overall SEO score and recommendations
-        """
+        task_description = self._ANALYSIS_TEMPLATE.format(content=content, keywords_section=keywords_section)
         
-        result = self.execute_task(task_description)
+        result = self.execute_task(task_description, semantic=False)
         return self._parse_seo_analysis(result)
     
     def _parse_seo_result(self, seo_text: str, target_keywords: List[str]) -> Dict[str, Any]:
@@ -181,12 +267,14 @@ class SEOAgent(BaseAgent):
         Returns:
             Dict containing structured SEO data
         """
+        # Lowercase once for both extractors
+        lowered_text = seo_text.lower()
         return {
-            "optimized_content": self._extract_optimized_content(seo_text),
+            "optimized_content": self._extract_optimized_content(seo_text, lowered_text),
             "seo_analysis": seo_text,
             "target_keywords": target_keywords,
-            "seo_score": self._extract_seo_score(seo_text),
-            "recommendations": self._extract_seo_recommendations(seo_text)
+            "seo_score": self._extract_seo_score(lowered_text),
+            "recommendations": _SCANNER.scan(seo_text, ("recommendations",))["recommendations"]
         }
     
     def _parse_meta_tags(self, meta_text: str) -> Dict[str, str]:
@@ -199,15 +287,17 @@ class SEOAgent(BaseAgent):
         Returns:
             Dict containing meta title and description
         """
+        # The last title line wins, and so does the last description line that
+        # is not also a title line; searching backwards finds both without
+        # visiting every line. Lowercasing never adds or removes newlines, so
+        # line indices in the lowered text match the original lines
         lines = meta_text.split('\n')
-        meta_title = ""
-        meta_description = ""
+        lowered_text = meta_text.lower()
+        title_index = _last_line_with(lowered_text, 'title')
+        description_index = _last_line_with(lowered_text, 'description', exclude='title')
         
-        for line in lines:
-            if 'title' in line.lower():
-                meta_title = line.split(':')[-1].strip()
-            elif 'description' in line.lower():
-                meta_description = line.split(':')[-1].strip()
+        meta_title = lines[title_index].split(':')[-1].strip() if title_index is not None else ""
+        meta_description = lines[description_index].split(':')[-1].strip() if description_index is not None else ""
         
         return {
             "meta_title": meta_title,
@@ -224,11 +314,14 @@ class SEOAgent(BaseAgent):
         Returns:
             Dict containing structured keyword data
         """
+        # Split and lowercase once, and count the extracted keywords instead of
+        # extracting them a second time for the analysis
+        primary_keywords, long_tail_keywords = self._extract_keywords(self._split_lines(keyword_text))
         return {
             "keyword_suggestions": keyword_text,
-            "primary_keywords": self._extract_primary_keywords(keyword_text),
-            "long_tail_keywords": self._extract_long_tail_keywords(keyword_text),
-            "keyword_analysis": self._extract_keyword_analysis(keyword_text)
+            "primary_keywords": primary_keywords,
+            "long_tail_keywords": long_tail_keywords,
+            "keyword_analysis": self._extract_keyword_analysis(keyword_text, primary_keywords, long_tail_keywords)
         }
     
     def _parse_seo_analysis(self, analysis_text: str) -> Dict[str, Any]:
@@ -241,89 +334,71 @@ class SEOAgent(BaseAgent):
         Returns:
             Dict containing structured analysis data
         """
+        found = _SCANNER.scan(analysis_text, ("improvements", "strengths"))
         return {
             "seo_analysis": analysis_text,
-            "seo_score": self._extract_seo_score(analysis_text),
-            "improvements": self._extract_seo_improvements(analysis_text),
-            "strengths": self._extract_seo_strengths(analysis_text)
+            "seo_score": self._extract_seo_score(analysis_text.lower()),
+            "improvements": found["improvements"],
+            "strengths": found["strengths"]
         }
     
-    def _extract_optimized_content(self, text: str) -> str:
-        """Extract optimized content from SEO result"""
+    def _extract_optimized_content(self, text: str, lowered_text: str) -> str:
+        """Extract optimized content from SEO result, given the result and its lowercased form"""
         # Simple extraction - would be more sophisticated in real implementation
-        lines = text.split('\n')
-        optimized_content = []
-        in_content = False
+        # Everything after the first marker line is content, except blank lines
+        # and further marker lines; the markers are found with str.find, so
+        # only the content lines are visited in Python
+        markers = _lines_with(lowered_text, ('optimized content', 'updated content'))
+        if not markers:
+            return text
         
-        for line in lines:
-            if 'optimized content' in line.lower() or 'updated content' in line.lower():
-                in_content = True
-                continue
-            if in_content and line.strip():
-                optimized_content.append(line)
+        start = markers[0] + 1
+        tail = text.split('\n')[start:]
+        for index in markers[1:]:
+            tail[index - start] = ''
+        optimized_content = [line for line in tail if line.strip()]
         
         return '\n'.join(optimized_content) if optimized_content else text
     
-    def _extract_seo_score(self, text: str) -> Optional[int]:
-        """Extract SEO score from analysis"""
-        import re
-        score_match = re.search(r'seo score[:\s]*(\d+)', text.lower())
+    def _extract_seo_score(self, lowered_text: str) -> Optional[int]:
+        """Extract SEO score from lowercased analysis"""
+        score_match = _SEO_SCORE_RE.search(lowered_text)
         return int(score_match.group(1)) if score_match else None
     
-    def _extract_seo_recommendations(self, text: str) -> List[str]:
-        """Extract SEO recommendations from analysis"""
-        recommendations = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['recommend', 'suggest', 'improve', 'optimize']):
-                recommendations.append(line.strip())
-        return recommendations
-    
-    def _extract_primary_keywords(self, text: str) -> List[str]:
-        """Extract primary keywords from suggestions"""
-        keywords = []
-        lines = text.split('\n')
-        for line in lines:
-            if 'primary' in line.lower() and 'keyword' in line.lower():
-                # Extract keywords from the line
-                keywords.extend([word.strip() for word in line.split(',') if word.strip()])
-        return keywords
-    
-    def _extract_long_tail_keywords(self, text: str) -> List[str]:
-        """Extract long-tail keywords from suggestions"""
-        keywords = []
-        lines = text.split('\n')
-        for line in lines:
-            if 'long-tail' in line.lower() or 'long tail' in line.lower():
+    def _extract_keywords(self, lines: List[Tuple[str, str]]) -> Tuple[List[str], List[str]]:
+        """
+        Extract primary and long-tail keywords from suggestions in one pass
+        
+        Args:
+            lines: Lines of the suggestions paired with their lowercased form
+            
+        Returns:
+            Tuple of the primary keywords and the long-tail keywords
+        """
+        primary_keywords = []
+        long_tail_keywords = []
+        for line, lower_line in lines:
+            is_primary = 'primary' in lower_line and 'keyword' in lower_line
+            is_long_tail = 'long-tail' in lower_line or 'long tail' in lower_line
+            if is_primary or is_long_tail:
                 # Extract keywords from the line
-                keywords.extend([word.strip() for word in line.split(',') if word.strip()])
-        return keywords
+                words = [word.strip() for word in line.split(',') if word.strip()]
+                if is_primary:
+                    primary_keywords.extend(words)
+                if is_long_tail:
+                    long_tail_keywords.extend(words)
+        return primary_keywords, long_tail_keywords
     
-    def _extract_keyword_analysis(self, text: str) -> Dict[str, Any]:
+    def _extract_keyword_analysis(self,
+                                  text: str,
+                                  primary_keywords: List[str],
+                                  long_tail_keywords: List[str]) -> Dict[str, Any]:
         """Extract keyword analysis from suggestions"""
         return {
             "analysis_text": text,
-            "keyword_count": len(self._extract_primary_keywords(text)) + len(self._extract_long_tail_keywords(text))
+            "keyword_count": len(primary_keywords) + len(long_tail_keywords)
         }
     
-    def _extract_seo_improvements(self, text: str) -> List[str]:
-        """Extract SEO improvements from analysis"""
-        improvements = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['improve', 'fix', 'optimize', 'enhance']):
-                improvements.append(line.strip())
-        return improvements
-    
-    def _extract_seo_strengths(self, text: str) -> List[str]:
-        """Extract SEO strengths from analysis"""
-        strengths = []
-        lines = text.split('\n')
-        for line in lines:
-            if any(keyword in line.lower() for keyword in ['good', 'strong', 'excellent', 'well']):
-                strengths.append(line.strip())
-        return strengths
-    
     def validate_input(self, input_data: Any) -> bool:
         """
         Validate input for SEO agent
@@ -335,5 +410,5 @@ class SEOAgent(BaseAgent):
             bool: True if valid, False otherwise
         """
         if isinstance(input_data, str):
-            return len(input_data.strip()) > 0
+            return bool(input_data) and not input_data.isspace()
         return False 
\ No newline at end of file
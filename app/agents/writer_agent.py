@@ -49,6 +49,67 @@ class WriterAgent(BaseAgent):
         Returns:
             str: Generated content draft
         """
+        task_description = self._draft_task(
+            topic, content_type, target_audience, word_count, tone, keywords, additional_requirements
+        )
+        
+        # Execute the task
+        result = self.execute_task(task_description, semantic=False)
+        return self.postprocess_output(result)
+    
+    async def acreate_content_draft(self, 
+                                    topic: str, 
+                                    content_type: str = "article",
+                                    target_audience: str = "general",
+                                    word_count: int = 1000,
+                                    tone: str = "professional",
+                                    keywords: Optional[List[str]] = None,
+                                    additional_requirements: Optional[str] = None) -> str:
+        """
+        Create a content draft without blocking the event loop
+        
+        Args:
+            topic: Main topic or subject of the content
+            content_type: Type of content (article, blog, social media, etc.)
+            target_audience: Target audience for the content
+            word_count: Approximate word count for the content
+            tone: Writing tone (professional, casual, friendly, etc.)
+            keywords: List of keywords to include naturally
+            additional_requirements: Any additional requirements or guidelines
+            
+        Returns:
+            str: Generated content draft
+        """
+        task_description = self._draft_task(
+            topic, content_type, target_audience, word_count, tone, keywords, additional_requirements
+        )
+        
+        result = await self.aexecute_task(task_description, semantic=False)
+        return self.postprocess_output(result)
+    
+    def _draft_task(self,
+                    topic: str,
+                    content_type: str,
+                    target_audience: str,
+                    word_count: int,
+                    tone: str,
+                    keywords: Optional[List[str]],
+                    additional_requirements: Optional[str]) -> str:
+        """
+        Build the task description for a content draft
+        
+        Args:
+            topic: Main topic or subject of the content
+            content_type: Type of content (article, blog, social media, etc.)
+            target_audience: Target audience for the content
+            word_count: Approximate word count for the content
+            tone: Writing tone (professional, casual, friendly, etc.)
+            keywords: List of keywords to include naturally
+            additional_requirements: Any additional requirements or guidelines
+            
+        Returns:
+            str: Task description
+        """
         # Validate inputs
         if not self.validate_input(topic):
             raise ValueError("Topic cannot be empty")
@@ -78,10 +139,7 @@ class WriterAgent(BaseAgent):
         4. Free of grammatical errors
         5. Original and plagiarism-free
         """
-        
-        # Execute the task
-        result = self.execute_task(task_description)
-        return self.postprocess_output(result)
+        return task_description
     
     def expand_section(self, 
                       section_content: str, 
@@ -111,7 +169,7 @@ class WriterAgent(BaseAgent):
         4. Keep the content relevant and valuable
         """
         
-        result = self.execute_task(task_description)
+        result = self.execute_task(task_description, semantic=False)
         return self.postprocess_output(result)
     
     def rewrite_content(self, 
@@ -154,7 +212,7 @@ class WriterAgent(BaseAgent):
         4. Is engaging and informative
         """
         
-        result = self.execute_task(task_description)
+        result = self.execute_task(task_description, semantic=False)
         return self.postprocess_output(result)
     
     def validate_input(self, input_data: Any) -> bool:
@@ -168,5 +226,5 @@ class WriterAgent(BaseAgent):
             bool: True if valid, False otherwise
         """
         if isinstance(input_data, str):
-            return len(input_data.strip()) > 0
+            return bool(input_data) and not input_data.isspace()
         return False 
\ No newline at end of file
@@ -2,7 +2,9 @@
 Content creation endpoints for AI Content Studio
 """
 
+from functools import lru_cache
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from typing import List, Optional
 from app.agents.writer_agent import WriterAgent
@@ -45,17 +47,26 @@ class ContentResponse(BaseModel):
 
 router = APIRouter(prefix="/content", tags=["Content"])
 
-# Instantiate agents and task (in production, use dependency injection or a factory)
-writer_agent = WriterAgent()
-research_agent = ResearchAgent()
-content_task = ContentCreationTask(writer_agent, research_agent)
+# Agents and task are created on the first request and shared by later ones,
+# so importing the app does not set up LLM clients
+@lru_cache(maxsize=1)
+def _get_content_task() -> ContentCreationTask:
+    writer_agent = WriterAgent()
+    research_agent = ResearchAgent()
+    return ContentCreationTask(writer_agent, research_agent)
 
 @router.post("/create", response_model=ContentResponse, dependencies=[Depends(get_api_key)])
-def create_content(request: ContentRequest):
+async def create_content(request: ContentRequest):
     """
     Create comprehensive content with research and writing
     """
-    if not content_task.validate_input(request.dict()):
+    content_task = _get_content_task()
+    # The request is already validated by pydantic; dump it once for the
+    # task-level checks and the call itself
+    data = request.model_dump()
+    if not content_task.validate_input(data):
         raise HTTPException(status_code=400, detail="Invalid input data")
-    result = content_task.create_content(**request.dict())
-    return result 
\ No newline at end of file
+    result = await content_task.acreate_content(**data)
+    # orjson serializes the result dataclasses natively, so the response is
+    # built without converting to dicts; response_model still documents the shape
+    return ORJSONResponse(result) 
\ No newline at end of file
@@ -4,13 +4,15 @@ FastAPI entrypoint for AI Content Studio
 
 from fastapi import FastAPI, Depends, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.config import settings
 from . import content
 
 app = FastAPI(
     title="AI Content Studio API",
     description="API for modular, secure, and extensible AI content workflows.",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware (adjust origins as needed)
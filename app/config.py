@@ -9,16 +9,19 @@ This module handles all configuration settings including:
 """
 
 import os
+from dataclasses import dataclass
 from typing import Optional
-from pydantic import BaseModel
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
 
-class Settings(BaseModel):
-    """Application settings with validation and defaults"""
+# Settings are read on every request and never change after startup, so they
+# are a frozen slotted dataclass; from_env does all parsing and type coercion
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Settings:
+    """Application settings with defaults"""
     
     # OpenAI Configuration
     openai_api_key: str
@@ -45,6 +48,30 @@ class Settings(BaseModel):
     max_content_length: int = 5000
     content_review_enabled: bool = True
     
+    # Request Batching Configuration
+    batch_dispatch_enabled: bool = False
+    batch_max_size: int = 16
+    batch_max_wait_ms: int = 50
+    
+    # Rate Limit Configuration (LLM requests per minute; 0 disables the limit)
+    llm_rate_limit: int = 0
+    
+    # Response Cache Configuration
+    response_cache_enabled: bool = False
+    response_cache_size: int = 1024
+    response_cache_ttl: int = 86400
+    response_cache_path: Optional[str] = None
+    
+    # Semantic Cache Configuration
+    semantic_cache_enabled: bool = False
+    semantic_cache_threshold: float = 0.87
+    semantic_cache_size: int = 1024
+    semantic_cache_dir: Optional[str] = None
+    semantic_cache_ltm_size: int = 16384
+    
+    # Structured Output Configuration
+    research_json_output: bool = False
+    
     @classmethod
     def from_env(cls) -> "Settings":
         """Create settings from environment variables"""
@@ -61,7 +88,21 @@ class Settings(BaseModel):
             max_workers=int(os.getenv("MAX_WORKERS", "4")),
             default_content_type=os.getenv("DEFAULT_CONTENT_TYPE", "article"),
             max_content_length=int(os.getenv("MAX_CONTENT_LENGTH", "5000")),
-            content_review_enabled=os.getenv("CONTENT_REVIEW_ENABLED", "True").lower() == "true"
+            content_review_enabled=os.getenv("CONTENT_REVIEW_ENABLED", "True").lower() == "true",
+            batch_dispatch_enabled=os.getenv("BATCH_DISPATCH_ENABLED", "False").lower() == "true",
+            batch_max_size=int(os.getenv("BATCH_MAX_SIZE", "16")),
+            batch_max_wait_ms=int(os.getenv("BATCH_MAX_WAIT_MS", "50")),
+            llm_rate_limit=int(os.getenv("LLM_RATE_LIMIT", "0")),
+            response_cache_enabled=os.getenv("RESPONSE_CACHE_ENABLED", "False").lower() == "true",
+            response_cache_size=int(os.getenv("RESPONSE_CACHE_SIZE", "1024")),
+            response_cache_ttl=int(os.getenv("RESPONSE_CACHE_TTL", "86400")),
+            response_cache_path=os.getenv("RESPONSE_CACHE_PATH") or None,
+            semantic_cache_enabled=os.getenv("SEMANTIC_CACHE_ENABLED", "False").lower() == "true",
+            semantic_cache_threshold=float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.87")),
+            semantic_cache_size=int(os.getenv("SEMANTIC_CACHE_SIZE", "1024")),
+            semantic_cache_dir=os.getenv("SEMANTIC_CACHE_DIR") or None,
+            semantic_cache_ltm_size=int(os.getenv("SEMANTIC_CACHE_LTM_SIZE", "16384")),
+            research_json_output=os.getenv("RESEARCH_JSON_OUTPUT", "False").lower() == "true"
         )
 
 
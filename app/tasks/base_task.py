@@ -6,10 +6,24 @@ It includes common functionality like task execution, validation, and result han
 """
 
 import logging
-from typing import Dict, Any, Optional, List
+from datetime import datetime
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Mapping
 from crewai import Task
 from app.agents.base_agent import BaseAgent
 
+# Task loggers keyed by task name
+_LOGGER_CACHE: Dict[str, logging.Logger] = {}
+
+
+def _get_logger(name: str) -> logging.Logger:
+    """Get the logger for a task, building its name only once"""
+    logger = _LOGGER_CACHE.get(name)
+    if logger is None:
+        logger = _LOGGER_CACHE[name] = logging.getLogger(f"task.{name.lower().replace(' ', '_')}")
+    return logger
+
 
 class BaseTask:
     """Base class for all content creation tasks"""
@@ -28,7 +42,7 @@ class BaseTask:
         self.description = description
         self.agent = agent
         self.expected_output = expected_output
-        self.logger = logging.getLogger(f"task.{name.lower().replace(' ', '_')}")
+        self.logger = _get_logger(name)
         
         # Create CrewAI task
         self.task = Task(
@@ -50,13 +64,9 @@ class BaseTask:
         try:
             self.logger.info(f"Executing task: {self.name}")
             
-            # Prepare task input
-            task_input = self.description
-            if context:
-                task_input += f"\n\nContext: {context}"
-            
-            # Execute task using CrewAI
-            result = self.task.execute()
+            # Execute the reused CrewAI task; per-call context goes through
+            # CrewAI's context argument instead of a rebuilt description
+            result = self.task.execute(context=f"{context}" if context else None)
             
             self.logger.info(f"Task completed successfully")
             return self._process_result(result)
@@ -82,6 +92,10 @@ class BaseTask:
             "agent_used": self.agent.name
         }
     
+    def _get_timestamp(self) -> str:
+        """Get current timestamp"""
+        return datetime.now().isoformat()
+    
     def validate_input(self, input_data: Any) -> bool:
         """
         Validate input data for the task
@@ -97,9 +111,19 @@ class BaseTask:
             return False
         return True
     
-    def get_task_info(self) -> Dict[str, Any]:
+    @cached_property
+    def task_info(self) -> Mapping[str, Any]:
         """
-        Get task information
+        Task information, built once per task and rebuilt after invalidate_info
+        
+        Returns:
+            Read-only mapping of task details
+        """
+        return MappingProxyType(self._build_task_info())
+    
+    def _build_task_info(self) -> Dict[str, Any]:
+        """
+        Build task information; subclasses extend this to add details
         
         Returns:
             Dict containing task details
@@ -111,6 +135,21 @@ class BaseTask:
             "expected_output": self.expected_output
         }
     
+    def get_task_info(self) -> Dict[str, Any]:
+        """
+        Get task information
+        
+        Nested values are shared with the cached task_info, so treat them as read-only.
+        
+        Returns:
+            Dict containing task details
+        """
+        return dict(self.task_info)
+    
+    def invalidate_info(self):
+        """Drop the cached task information after the task or its agents are reconfigured"""
+        self.__dict__.pop("task_info", None)
+    
     def update_description(self, new_description: str):
         """
         Update task description
@@ -120,6 +159,7 @@ class BaseTask:
         """
         self.description = new_description
         self.task.description = new_description
+        self.invalidate_info()
         self.logger.info(f"Updated task description: {new_description}")
     
     def update_expected_output(self, new_expected_output: str):
@@ -131,4 +171,5 @@ class BaseTask:
         """
         self.expected_output = new_expected_output
         self.task.expected_output = new_expected_output
+        self.invalidate_info()
         self.logger.info(f"Updated expected output: {new_expected_output}") 
\ No newline at end of file
@@ -7,13 +7,44 @@ different agents to create high-quality content.
 
 from typing import Dict, Any, Optional, List
 from .base_task import BaseTask
+from .results import ContentCreationResult, ContentDraft
+from app.agents.json_output import json_lists, load_json_object
+from app.agents.results import ResearchResult
 from app.agents.writer_agent import WriterAgent
 from app.agents.research_agent import ResearchAgent
 
+# Research fields returned alongside the draft by the fused prompt
+_FUSED_RESEARCH_KEYS = ("key_facts", "sources", "insights", "recommendations")
+
 
 class ContentCreationTask(BaseTask):
     """Task for creating comprehensive content"""
     
+    # Input fields that must be present and non-empty
+    REQUIRED_FIELDS = ("topic",)
+    
+    # Research and drafting in one prompt, answered as a single JSON object
+    _FUSED_TEMPLATE = """
+        Research the topic "{topic}" ({research_depth} research), then use your findings
+        to write a {content_type} about it with the following specifications:
+        
+        - Target Audience: {target_audience}
+        - Word Count: Approximately {word_count} words
+        - Tone: {tone}
+        - Content Type: {content_type}{keywords_line}
+        
+        Please ensure the content is:
+        1. Well-structured with clear headings and subheadings
+        2. Engaging and informative
+        3. Optimized for the target audience
+        4. Free of grammatical errors
+        5. Original and plagiarism-free
+        
+        Return the response as a single JSON object and nothing else, with these keys:
+        key_facts, sources, insights, recommendations, draft
+        The first four each hold a list of strings from your research; draft holds the complete content.
+        """
+    
     def __init__(self, writer_agent: WriterAgent, research_agent: ResearchAgent):
         """
         Initialize Content Creation Task
@@ -40,7 +71,7 @@ class ContentCreationTask(BaseTask):
                       word_count: int = 1000,
                       tone: str = "professional",
                       keywords: Optional[List[str]] = None,
-                      research_depth: str = "comprehensive") -> Dict[str, Any]:
+                      research_depth: str = "comprehensive") -> ContentCreationResult:
         """
         Create comprehensive content with research and writing
         
@@ -54,7 +85,7 @@ class ContentCreationTask(BaseTask):
             research_depth: Depth of research required
             
         Returns:
-            Dict containing created content and metadata
+            Result containing created content and metadata
         """
         try:
             self.logger.info(f"Starting content creation for topic: {topic}")
@@ -66,18 +97,9 @@ class ContentCreationTask(BaseTask):
             content_result = self._create_draft(topic, content_type, target_audience, word_count, tone, keywords, research_result)
             
             # Step 3: Compile final result
-            final_result = {
-                "topic": topic,
-                "content_type": content_type,
-                "target_audience": target_audience,
-                "word_count": word_count,
-                "tone": tone,
-                "keywords": keywords,
-                "research_data": research_result,
-                "content": content_result,
-                "creation_timestamp": self._get_timestamp(),
-                "status": "completed"
-            }
+            final_result = self._compile_result(
+                topic, content_type, target_audience, word_count, tone, keywords, research_result, content_result
+            )
             
             self.logger.info(f"Content creation completed successfully")
             return final_result
@@ -86,11 +108,165 @@ class ContentCreationTask(BaseTask):
             self.logger.error(f"Error in content creation: {str(e)}")
             raise
     
+    def create_content_fused(self, 
+                            topic: str,
+                            content_type: str = "article",
+                            target_audience: str = "general",
+                            word_count: int = 1000,
+                            tone: str = "professional",
+                            keywords: Optional[List[str]] = None,
+                            research_depth: str = "comprehensive") -> ContentCreationResult:
+        """
+        Create content with research and writing in a single LLM call
+        
+        The writer researches the topic and drafts the content in one JSON
+        response, saving the separate research round trip. When the response
+        is not the expected JSON object, the stepwise create_content is used.
+        
+        Args:
+            topic: Main topic for content
+            content_type: Type of content to create
+            target_audience: Target audience
+            word_count: Target word count
+            tone: Writing tone
+            keywords: Target keywords
+            research_depth: Depth of research required
+            
+        Returns:
+            Result containing created content and metadata
+        """
+        if not self.writer_agent.validate_input(topic):
+            raise ValueError("Topic cannot be empty")
+        
+        self.logger.info(f"Starting fused content creation for topic: {topic}")
+        
+        keywords_line = ""
+        if keywords:
+            keywords_line = f"\n        - Keywords to include naturally: {', '.join(keywords)}"
+        
+        task_description = self._FUSED_TEMPLATE.format(
+            topic=topic,
+            research_depth=research_depth,
+            content_type=content_type,
+            target_audience=target_audience,
+            word_count=word_count,
+            tone=tone,
+            keywords_line=keywords_line
+        )
+        
+        result = self.writer_agent.execute_task_fast(task_description, semantic=False)
+        data = load_json_object(result)
+        draft = data.get("draft") if data is not None else None
+        if not isinstance(draft, str) or not draft.strip():
+            self.logger.warning("Fused response was not a JSON draft, creating content step by step")
+            return self.create_content(topic, content_type, target_audience, word_count, tone, keywords, research_depth)
+        
+        found = json_lists(data, _FUSED_RESEARCH_KEYS)
+        research_result = ResearchResult(
+            topic=topic,
+            research_findings=result,
+            key_facts=found["key_facts"],
+            sources=found["sources"],
+            insights=found["insights"],
+            recommendations=found["recommendations"]
+        )
+        content_result = self._draft_result(self.writer_agent.postprocess_output(draft), keywords)
+        
+        self.logger.info("Content creation completed successfully")
+        return self._compile_result(
+            topic, content_type, target_audience, word_count, tone, keywords, research_result, content_result
+        )
+    
+    async def acreate_content(self, 
+                              topic: str,
+                              content_type: str = "article",
+                              target_audience: str = "general",
+                              word_count: int = 1000,
+                              tone: str = "professional",
+                              keywords: Optional[List[str]] = None,
+                              research_depth: str = "comprehensive") -> ContentCreationResult:
+        """
+        Create comprehensive content with research and writing, awaiting the LLM calls
+        
+        The draft is written from the research findings, so the two calls
+        run in sequence; awaiting them lets the event loop serve other
+        requests while they are in flight.
+        
+        Args:
+            topic: Main topic for content
+            content_type: Type of content to create
+            target_audience: Target audience
+            word_count: Target word count
+            tone: Writing tone
+            keywords: Target keywords
+            research_depth: Depth of research required
+            
+        Returns:
+            Result containing created content and metadata
+        """
+        try:
+            self.logger.info(f"Starting content creation for topic: {topic}")
+            
+            # Step 1: Research the topic
+            research_result = await self._aconduct_research(topic, content_type, target_audience, research_depth)
+            
+            # Step 2: Create content draft
+            content_result = await self._acreate_draft(topic, content_type, target_audience, word_count, tone, keywords, research_result)
+            
+            # Step 3: Compile final result
+            final_result = self._compile_result(
+                topic, content_type, target_audience, word_count, tone, keywords, research_result, content_result
+            )
+            
+            self.logger.info("Content creation completed successfully")
+            return final_result
+            
+        except Exception as e:
+            self.logger.error(f"Error in content creation: {str(e)}")
+            raise
+    
+    def _compile_result(self,
+                        topic: str,
+                        content_type: str,
+                        target_audience: str,
+                        word_count: int,
+                        tone: str,
+                        keywords: Optional[List[str]],
+                        research_result: ResearchResult,
+                        content_result: ContentDraft) -> ContentCreationResult:
+        """
+        Compile the final content creation result
+        
+        Args:
+            topic: Main topic for content
+            content_type: Type of content created
+            target_audience: Target audience
+            word_count: Target word count
+            tone: Writing tone
+            keywords: Target keywords
+            research_result: Research data
+            content_result: Content draft data
+            
+        Returns:
+            Result containing created content and metadata
+        """
+        return ContentCreationResult(
+            topic=topic,
+            content_type=content_type,
+            target_audience=target_audience,
+            word_count=word_count,
+            tone=tone,
+            keywords=keywords,
+            research_data=research_result,
+            content=content_result,
+            creation_timestamp=self._get_timestamp()
+        )
+    
     def _conduct_research(self, 
                          topic: str,
                          content_type: str,
                          target_audience: str,
-                         research_depth: str) -> Dict[str, Any]:
+                         research_depth: str) -> ResearchResult:
         """
         Conduct research for the topic
         
@@ -101,7 +277,7 @@ class ContentCreationTask(BaseTask):
             research_depth: Depth of research
             
         Returns:
-            Dict containing research results
+            Result containing research findings
         """
         self.logger.info(f"Conducting research for topic: {topic}")
         
@@ -114,6 +290,34 @@ class ContentCreationTask(BaseTask):
         
         return research_result
     
+    async def _aconduct_research(self, 
+                                 topic: str,
+                                 content_type: str,
+                                 target_audience: str,
+                                 research_depth: str) -> ResearchResult:
+        """
+        Conduct research for the topic, awaiting the LLM call
+        
+        Args:
+            topic: Topic to research
+            content_type: Type of content
+            target_audience: Target audience
+            research_depth: Depth of research
+            
+        Returns:
+            Result containing research findings
+        """
+        self.logger.info(f"Conducting research for topic: {topic}")
+        
+        research_result = await self.research_agent.aresearch_topic(
+            topic=topic,
+            research_depth=research_depth,
+            content_type=content_type,
+            target_audience=target_audience
+        )
+        
+        return research_result
+    
     def _create_draft(self, 
                      topic: str,
                      content_type: str,
@@ -121,7 +325,7 @@ class ContentCreationTask(BaseTask):
                      word_count: int,
                      tone: str,
                      keywords: Optional[List[str]],
-                     research_data: Dict[str, Any]) -> Dict[str, Any]:
+                     research_data: ResearchResult) -> ContentDraft:
         """
         Create content draft using research data
         
@@ -135,7 +339,7 @@ class ContentCreationTask(BaseTask):
             research_data: Research data to incorporate
             
         Returns:
-            Dict containing content draft
+            Result containing content draft
         """
         self.logger.info(f"Creating content draft for topic: {topic}")
         
@@ -152,40 +356,78 @@ class ContentCreationTask(BaseTask):
             additional_requirements=additional_requirements
         )
         
-        return {
-            "draft_content": content_draft,
-            "research_incorporated": True,
-            "word_count_actual": len(content_draft.split()),
-            "keywords_used": keywords or []
-        }
+        return self._draft_result(content_draft, keywords)
     
-    def _prepare_research_requirements(self, research_data: Dict[str, Any]) -> str:
+    async def _acreate_draft(self, 
+                             topic: str,
+                             content_type: str,
+                             target_audience: str,
+                             word_count: int,
+                             tone: str,
+                             keywords: Optional[List[str]],
+                             research_data: ResearchResult) -> ContentDraft:
         """
-        Prepare research requirements for content creation
+        Create content draft using research data, awaiting the LLM call
         
         Args:
-            research_data: Research data
+            topic: Topic for content
+            content_type: Type of content
+            target_audience: Target audience
+            word_count: Target word count
+            tone: Writing tone
+            keywords: Target keywords
+            research_data: Research data to incorporate
             
         Returns:
-            str: Formatted research requirements
+            Result containing content draft
         """
-        requirements = []
-        
-        if "key_facts" in research_data:
-            requirements.append(f"Key Facts: {', '.join(research_data['key_facts'][:5])}")
+        self.logger.info(f"Creating content draft for topic: {topic}")
         
-        if "sources" in research_data:
-            requirements.append(f"Credible Sources: {', '.join(research_data['sources'][:3])}")
+        content_draft = await self.writer_agent.acreate_content_draft(
+            topic=topic,
+            content_type=content_type,
+            target_audience=target_audience,
+            word_count=word_count,
+            tone=tone,
+            keywords=keywords,
+            additional_requirements=self._prepare_research_requirements(research_data)
+        )
         
-        if "insights" in research_data:
-            requirements.append(f"Key Insights: {', '.join(research_data['insights'][:3])}")
+        return self._draft_result(content_draft, keywords)
+    
+    def _draft_result(self, content_draft: str, keywords: Optional[List[str]]) -> ContentDraft:
+        """
+        Package a content draft with its metadata
         
-        return "\n".join(requirements) if requirements else ""
+        Args:
+            content_draft: Generated content draft
+            keywords: Target keywords
+            
+        Returns:
+            Result containing content draft
+        """
+        return ContentDraft(
+            draft_content=content_draft,
+            research_incorporated=True,
+            word_count_actual=len(content_draft.split()),
+            keywords_used=keywords or []
+        )
     
-    def _get_timestamp(self) -> str:
-        """Get current timestamp"""
-        from datetime import datetime
-        return datetime.now().isoformat()
+    def _prepare_research_requirements(self, research_data: ResearchResult) -> str:
+        """
+        Prepare research requirements for content creation
+        
+        Args:
+            research_data: Research data
+            
+        Returns:
+            str: Formatted research requirements
+        """
+        return "\n".join((
+            f"Key Facts: {', '.join(research_data.key_facts[:5])}",
+            f"Credible Sources: {', '.join(research_data.sources[:3])}",
+            f"Key Insights: {', '.join(research_data.insights[:3])}"
+        ))
     
     def validate_input(self, input_data: Dict[str, Any]) -> bool:
         """
@@ -197,25 +439,16 @@ class ContentCreationTask(BaseTask):
         Returns:
             bool: True if valid, False otherwise
         """
-        required_fields = ["topic"]
-        
-        if not isinstance(input_data, dict):
-            return False
-        
-        for field in required_fields:
-            if field not in input_data or not input_data[field]:
-                return False
-        
-        return True
+        return isinstance(input_data, dict) and all(input_data.get(field) for field in self.REQUIRED_FIELDS)
     
-    def get_task_info(self) -> Dict[str, Any]:
+    def _build_task_info(self) -> Dict[str, Any]:
         """
-        Get detailed task information
+        Build detailed task information
         
         Returns:
             Dict containing task details
         """
-        base_info = super().get_task_info()
+        base_info = super()._build_task_info()
         base_info.update({
             "agents_involved": [
                 self.writer_agent.get_agent_info(),
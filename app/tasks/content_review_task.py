@@ -4,8 +4,9 @@ Content Review Task for AI Content Studio
 This task handles content review, editing, and improvement workflows.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Optional, List, AsyncIterator
 from .base_task import BaseTask
+from .results import ContentImprovementResult, ContentReviewResult
 from app.agents.editor_agent import EditorAgent
 
 
@@ -32,7 +33,7 @@ class ContentReviewTask(BaseTask):
                       content: str,
                       content_type: str = "article",
                       target_audience: str = "general",
-                      review_focus: Optional[List[str]] = None) -> Dict[str, Any]:
+                      review_focus: Optional[List[str]] = None) -> ContentReviewResult:
         """
         Review content comprehensively
         
@@ -43,7 +44,7 @@ class ContentReviewTask(BaseTask):
             review_focus: Specific areas to focus on
             
         Returns:
-            Dict containing review results
+            Result containing review results
         """
         review_result = self.editor_agent.review_content(
             content=content,
@@ -52,16 +53,76 @@ class ContentReviewTask(BaseTask):
             review_focus=review_focus
         )
         
-        return {
-            "review_data": review_result,
-            "content_original": content,
-            "review_timestamp": self._get_timestamp(),
-            "status": "reviewed"
-        }
+        return ContentReviewResult(
+            review_data=review_result,
+            content_original=content,
+            review_timestamp=self._get_timestamp()
+        )
+    
+    async def areview_content(self,
+                              content: str,
+                              content_type: str = "article",
+                              target_audience: str = "general",
+                              review_focus: Optional[List[str]] = None,
+                              parallel_focus: bool = False) -> ContentReviewResult:
+        """
+        Review content comprehensively without blocking the event loop
+        
+        Args:
+            content: Content to review
+            content_type: Type of content
+            target_audience: Target audience
+            review_focus: Specific areas to focus on
+            parallel_focus: Whether to review each focus area with its own concurrent LLM call
+            
+        Returns:
+            Result containing review results
+        """
+        review = self.editor_agent.areview_content_by_focus if parallel_focus else self.editor_agent.areview_content
+        review_result = await review(
+            content=content,
+            content_type=content_type,
+            target_audience=target_audience,
+            review_focus=review_focus
+        )
+        
+        return ContentReviewResult(
+            review_data=review_result,
+            content_original=content,
+            review_timestamp=self._get_timestamp()
+        )
+    
+    async def astream_review_content(self,
+                                     content: str,
+                                     content_type: str = "article",
+                                     target_audience: str = "general",
+                                     review_focus: Optional[List[str]] = None) -> AsyncIterator[str]:
+        """
+        Review content, yielding the review line by line as it is generated
+        
+        Lets callers show progress on long documents instead of waiting for
+        the full review.
+        
+        Args:
+            content: Content to review
+            content_type: Type of content
+            target_audience: Target audience
+            review_focus: Specific areas to focus on
+            
+        Yields:
+            str: Each line of the review
+        """
+        async for line in self.editor_agent.astream_review_content(
+            content=content,
+            content_type=content_type,
+            target_audience=target_audience,
+            review_focus=review_focus
+        ):
+            yield line
     
     def improve_content(self, 
                        content: str,
-                       improvement_areas: Optional[List[str]] = None) -> Dict[str, Any]:
+                       improvement_areas: Optional[List[str]] = None) -> ContentImprovementResult:
         """
         Improve content quality
         
@@ -70,21 +131,34 @@ class ContentReviewTask(BaseTask):
             improvement_areas: Specific areas to improve
             
         Returns:
-            Dict containing improved content
+            Result containing improved content
         """
         improved_content = self.editor_agent.improve_content(
             content=content,
             improvement_areas=improvement_areas
         )
         
-        return {
-            "original_content": content,
-            "improved_content": improved_content,
-            "improvement_timestamp": self._get_timestamp(),
-            "status": "improved"
-        }
+        return ContentImprovementResult(
+            original_content=content,
+            improved_content=improved_content,
+            improvement_timestamp=self._get_timestamp()
+        )
     
-    def _get_timestamp(self) -> str:
-        """Get current timestamp"""
-        from datetime import datetime
-        return datetime.now().isoformat() 
\ No newline at end of file
+    async def astream_improve_content(self,
+                                      content: str,
+                                      improvement_areas: Optional[List[str]] = None) -> AsyncIterator[str]:
+        """
+        Improve content quality, yielding the improved content line by line
+        
+        Args:
+            content: Content to improve
+            improvement_areas: Specific areas to improve
+            
+        Yields:
+            str: Each line of the improved content
+        """
+        async for line in self.editor_agent.astream_improve_content(
+            content=content,
+            improvement_areas=improvement_areas
+        ):
+            yield line
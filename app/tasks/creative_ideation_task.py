@@ -4,8 +4,9 @@ Creative Ideation Task for AI Content Studio
 This task handles creative ideation workflows.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Optional, List
 from .base_task import BaseTask
+from .results import HeadlineIdeationResult, IdeationResult
 from app.agents.creative_agent import CreativeAgent
 
 
@@ -33,7 +34,7 @@ class CreativeIdeationTask(BaseTask):
                               content_type: str = "article",
                               target_audience: str = "general",
                               idea_count: int = 10,
-                              creativity_level: str = "high") -> Dict[str, Any]:
+                              creativity_level: str = "high") -> IdeationResult:
         """
         Generate creative content ideas for a topic
         
@@ -45,7 +46,7 @@ class CreativeIdeationTask(BaseTask):
             creativity_level: Level of creativity
             
         Returns:
-            Dict containing creative content ideas
+            Result containing creative content ideas
         """
         ideas_result = self.creative_agent.generate_content_ideas(
             topic=topic,
@@ -55,17 +56,82 @@ class CreativeIdeationTask(BaseTask):
             creativity_level=creativity_level
         )
         
-        return {
-            "ideas_data": ideas_result,
-            "ideation_timestamp": self._get_timestamp(),
-            "status": "ideas_generated"
-        }
+        return IdeationResult(
+            ideas_data=ideas_result,
+            ideation_timestamp=self._get_timestamp()
+        )
+    
+    def generate_content_ideas_batch(self,
+                                     topics: List[str],
+                                     content_type: str = "article",
+                                     target_audience: str = "general",
+                                     idea_count: int = 10,
+                                     creativity_level: str = "high") -> List[IdeationResult]:
+        """
+        Generate creative content ideas for several topics concurrently
+        
+        Args:
+            topics: Main topics for content ideas
+            content_type: Type of content to generate ideas for
+            target_audience: Target audience
+            idea_count: Number of ideas to generate per topic
+            creativity_level: Level of creativity
+            
+        Returns:
+            List of creative content ideas in input order
+        """
+        ideas_results = self.creative_agent.generate_content_ideas_batch(
+            topics=topics,
+            content_type=content_type,
+            target_audience=target_audience,
+            idea_count=idea_count,
+            creativity_level=creativity_level
+        )
+        
+        timestamp = self._get_timestamp()
+        return [
+            IdeationResult(ideas_data=ideas_result, ideation_timestamp=timestamp)
+            for ideas_result in ideas_results
+        ]
+    
+    async def agenerate_content_ideas_batch(self,
+                                            topics: List[str],
+                                            content_type: str = "article",
+                                            target_audience: str = "general",
+                                            idea_count: int = 10,
+                                            creativity_level: str = "high") -> List[IdeationResult]:
+        """
+        Generate creative content ideas for several topics concurrently without blocking the event loop
+        
+        Args:
+            topics: Main topics for content ideas
+            content_type: Type of content to generate ideas for
+            target_audience: Target audience
+            idea_count: Number of ideas to generate per topic
+            creativity_level: Level of creativity
+            
+        Returns:
+            List of creative content ideas in input order
+        """
+        ideas_results = await self.creative_agent.agenerate_content_ideas_batch(
+            topics=topics,
+            content_type=content_type,
+            target_audience=target_audience,
+            idea_count=idea_count,
+            creativity_level=creativity_level
+        )
+        
+        timestamp = self._get_timestamp()
+        return [
+            IdeationResult(ideas_data=ideas_result, ideation_timestamp=timestamp)
+            for ideas_result in ideas_results
+        ]
     
     def brainstorm_headlines(self, 
                            topic: str,
                            content_type: str = "article",
                            headline_count: int = 15,
-                           headline_style: str = "clickbait") -> Dict[str, Any]:
+                           headline_style: str = "clickbait") -> HeadlineIdeationResult:
         """
         Brainstorm creative headlines for content
         
@@ -76,7 +142,7 @@ class CreativeIdeationTask(BaseTask):
             headline_style: Style of headlines
             
         Returns:
-            Dict containing headline ideas
+            Result containing headline ideas
         """
         headlines_result = self.creative_agent.brainstorm_headlines(
             topic=topic,
@@ -85,13 +151,7 @@ class CreativeIdeationTask(BaseTask):
             headline_style=headline_style
         )
         
-        return {
-            "headlines_data": headlines_result,
-            "headlines_timestamp": self._get_timestamp(),
-            "status": "headlines_generated"
-        }
-    
-    def _get_timestamp(self) -> str:
-        """Get current timestamp"""
-        from datetime import datetime
-        return datetime.now().isoformat() 
\ No newline at end of file
+        return HeadlineIdeationResult(
+            headlines_data=headlines_result,
+            headlines_timestamp=self._get_timestamp()
+        )
\ No newline at end of file
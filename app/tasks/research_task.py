@@ -4,8 +4,9 @@ Research Task for AI Content Studio
 This task handles research workflows.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Optional, List
 from .base_task import BaseTask
+from .results import ContentFactCheckResult, TopicResearchResult
 from app.agents.research_agent import ResearchAgent
 
 
@@ -32,7 +33,7 @@ class ResearchTask(BaseTask):
                       topic: str,
                       research_depth: str = "comprehensive",
                       content_type: str = "article",
-                      target_audience: str = "general") -> Dict[str, Any]:
+                      target_audience: str = "general") -> TopicResearchResult:
         """
         Research a topic comprehensively
         
@@ -43,7 +44,7 @@ class ResearchTask(BaseTask):
             target_audience: Target audience
             
         Returns:
-            Dict containing research results
+            Result containing research findings
         """
         research_result = self.research_agent.research_topic(
             topic=topic,
@@ -52,15 +53,74 @@ class ResearchTask(BaseTask):
             target_audience=target_audience
         )
         
-        return {
-            "research_data": research_result,
-            "research_timestamp": self._get_timestamp(),
-            "status": "researched"
-        }
+        return TopicResearchResult(
+            research_data=research_result,
+            research_timestamp=self._get_timestamp()
+        )
+    
+    def research_topic_batch(self,
+                             topics: List[str],
+                             research_depth: str = "comprehensive",
+                             content_type: str = "article",
+                             target_audience: str = "general") -> List[TopicResearchResult]:
+        """
+        Research several topics concurrently
+        
+        Args:
+            topics: Topics to research
+            research_depth: Level of research
+            content_type: Type of content
+            target_audience: Target audience
+            
+        Returns:
+            List of research results in input order
+        """
+        research_results = self.research_agent.research_topic_batch(
+            topics=topics,
+            research_depth=research_depth,
+            content_type=content_type,
+            target_audience=target_audience
+        )
+        
+        timestamp = self._get_timestamp()
+        return [
+            TopicResearchResult(research_data=research_result, research_timestamp=timestamp)
+            for research_result in research_results
+        ]
+    
+    async def aresearch_topic_batch(self,
+                                    topics: List[str],
+                                    research_depth: str = "comprehensive",
+                                    content_type: str = "article",
+                                    target_audience: str = "general") -> List[TopicResearchResult]:
+        """
+        Research several topics concurrently without blocking the event loop
+        
+        Args:
+            topics: Topics to research
+            research_depth: Level of research
+            content_type: Type of content
+            target_audience: Target audience
+            
+        Returns:
+            List of research results in input order
+        """
+        research_results = await self.research_agent.aresearch_topic_batch(
+            topics=topics,
+            research_depth=research_depth,
+            content_type=content_type,
+            target_audience=target_audience
+        )
+        
+        timestamp = self._get_timestamp()
+        return [
+            TopicResearchResult(research_data=research_result, research_timestamp=timestamp)
+            for research_result in research_results
+        ]
     
     def fact_check_content(self, 
                           content: str,
-                          topic: str) -> Dict[str, Any]:
+                          topic: str) -> ContentFactCheckResult:
         """
         Fact-check content for accuracy
         
@@ -69,21 +129,15 @@ class ResearchTask(BaseTask):
             topic: Main topic of the content
             
         Returns:
-            Dict containing fact-checking results
+            Result containing fact-checking results
         """
         fact_check_result = self.research_agent.fact_check_content(
             content=content,
             topic=topic
         )
         
-        return {
-            "fact_check_data": fact_check_result,
-            "content": content,
-            "fact_check_timestamp": self._get_timestamp(),
-            "status": "fact_checked"
-        }
-    
-    def _get_timestamp(self) -> str:
-        """Get current timestamp"""
-        from datetime import datetime
-        return datetime.now().isoformat() 
\ No newline at end of file
+        return ContentFactCheckResult(
+            fact_check_data=fact_check_result,
+            content=content,
+            fact_check_timestamp=self._get_timestamp()
+        )
\ No newline at end of file
@@ -0,0 +1,121 @@
+"""
+Structured task results for AI Content Studio
+
+This module defines the slotted dataclasses returned by task workflows.
+Agent results are nested as-is rather than converted to dictionaries, so
+nothing is copied until a caller needs plain types: to_dict() converts the
+whole result recursively, and orjson serializes it directly.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+from app.agents.results import AgentResult, FactCheckResult, HeadlinesResult, IdeasResult, ResearchResult, ReviewResult
+
+
+class TaskResult(AgentResult):
+    """Base class for structured task results"""
+    
+    __slots__ = ()
+
+
+@dataclass(slots=True)
+class ContentDraft(TaskResult):
+    """Content draft with its metadata"""
+    
+    draft_content: str
+    research_incorporated: bool
+    word_count_actual: int
+    keywords_used: List[str]
+
+
+@dataclass(slots=True)
+class ContentCreationResult(TaskResult):
+    """Created content with its research and request parameters"""
+    
+    topic: str
+    content_type: str
+    target_audience: str
+    word_count: int
+    tone: str
+    keywords: Optional[List[str]]
+    research_data: ResearchResult
+    content: ContentDraft
+    creation_timestamp: str
+    status: str = "completed"
+
+
+@dataclass(slots=True)
+class ContentReviewResult(TaskResult):
+    """Review of a piece of content"""
+    
+    review_data: ReviewResult
+    content_original: str
+    review_timestamp: str
+    status: str = "reviewed"
+
+
+@dataclass(slots=True)
+class ContentImprovementResult(TaskResult):
+    """Improved version of a piece of content"""
+    
+    original_content: str
+    improved_content: str
+    improvement_timestamp: str
+    status: str = "improved"
+
+
+@dataclass(slots=True)
+class IdeationResult(TaskResult):
+    """Creative content ideas for a topic"""
+    
+    ideas_data: IdeasResult
+    ideation_timestamp: str
+    status: str = "ideas_generated"
+
+
+@dataclass(slots=True)
+class HeadlineIdeationResult(TaskResult):
+    """Brainstormed headlines for a topic"""
+    
+    headlines_data: HeadlinesResult
+    headlines_timestamp: str
+    status: str = "headlines_generated"
+
+
+@dataclass(slots=True)
+class TopicResearchResult(TaskResult):
+    """Research findings for a topic"""
+    
+    research_data: ResearchResult
+    research_timestamp: str
+    status: str = "researched"
+
+
+@dataclass(slots=True)
+class ContentFactCheckResult(TaskResult):
+    """Fact-check of a piece of content"""
+    
+    fact_check_data: FactCheckResult
+    content: str
+    fact_check_timestamp: str
+    status: str = "fact_checked"
+
+
+@dataclass(slots=True)
+class SEOOptimizationResult(TaskResult):
+    """SEO-optimized content with keyword analysis"""
+    
+    seo_data: Dict[str, Any]
+    original_content: str
+    optimization_timestamp: str
+    status: str = "optimized"
+
+
+@dataclass(slots=True)
+class MetaTagsResult(TaskResult):
+    """Meta tags generated for a piece of content"""
+    
+    meta_tags: Dict[str, str]
+    content: str
+    generation_timestamp: str
+    status: str = "meta_tags_generated"
@@ -0,0 +1,135 @@
+"""
+Task Scheduler for AI Content Studio
+
+This module runs queued task calls shortest-expected-latency first. When
+more task calls are waiting than may run at once (e.g. a pipeline run or
+several tenants sharing one worker), starting the quickest ones first lowers
+the average completion time compared with FIFO order, so short ideation or
+research calls do not wait behind long content creation runs.
+
+Expected latency is an exponentially weighted moving average of past
+durations per key, usually the task class and a word count bucket.
+"""
+
+import asyncio
+import itertools
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set, Tuple
+
+# Word counts are grouped into buckets of this size for latency estimates
+WORD_COUNT_BUCKET = 500
+
+
+class TaskScheduler:
+    """Runs queued task calls shortest-expected-latency first"""
+    
+    def __init__(self, max_concurrency: int = 10, alpha: float = 0.2, default_latency: float = 10.0):
+        """
+        Initialize task scheduler
+        
+        Args:
+            max_concurrency: Maximum number of task calls running at once
+            alpha: Weight of the latest duration in the moving average
+            default_latency: Expected seconds for keys with no recorded duration
+        """
+        self.max_concurrency = max_concurrency
+        self.alpha = alpha
+        self.default_latency = default_latency
+        self._estimates: Dict[Hashable, float] = {}
+        
+        # Entries are (expected latency, submission order, key, call, future);
+        # the submission order keeps equal estimates FIFO
+        self._queue: "asyncio.PriorityQueue[Tuple[float, int, Hashable, Callable[[], Awaitable[Any]], asyncio.Future]]" = asyncio.PriorityQueue()
+        self._order = itertools.count()
+        
+        # Running workers, referenced so they are not garbage collected; a
+        # worker removes itself once it finds the queue empty
+        self._workers: Set[asyncio.Task] = set()
+    
+    @staticmethod
+    def task_key(task: Any, word_count: int = 0) -> Tuple[str, int]:
+        """
+        Build the latency key for a task call
+        
+        Args:
+            task: Task whose method is called
+            word_count: Target word count of the call, if any
+            
+        Returns:
+            Tuple of the task class name and word count bucket
+        """
+        return type(task).__name__, word_count // WORD_COUNT_BUCKET
+    
+    def expected_latency(self, key: Hashable) -> float:
+        """
+        Get the expected duration for a key
+        
+        Args:
+            key: Latency key of the task call
+            
+        Returns:
+            float: Expected seconds
+        """
+        return self._estimates.get(key, self.default_latency)
+    
+    async def submit(self,
+                     call: Callable[[], Awaitable[Any]],
+                     key: Hashable,
+                     expected_latency: Optional[float] = None) -> Any:
+        """
+        Queue a task call and wait for its result
+        
+        Sync task methods can be queued with asyncio.to_thread, e.g.
+        lambda: asyncio.to_thread(task.review_content, content).
+        
+        Args:
+            call: Function returning the awaitable to run
+            key: Latency key of the task call, usually from task_key
+            expected_latency: Expected seconds; the moving average for the key if None
+            
+        Returns:
+            The result of the task call
+        """
+        if expected_latency is None:
+            expected_latency = self.expected_latency(key)
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((expected_latency, next(self._order), key, call, future))
+        
+        if len(self._workers) < self.max_concurrency:
+            self._workers.add(asyncio.create_task(self._drain()))
+        return await future
+    
+    async def _drain(self):
+        """Run queued task calls, shortest expected latency first, until the queue is empty"""
+        loop = asyncio.get_running_loop()
+        try:
+            while not self._queue.empty():
+                _, _, key, call, future = self._queue.get_nowait()
+                if future.cancelled():
+                    continue
+                
+                start = loop.time()
+                try:
+                    result = await call()
+                except BaseException as e:
+                    if not future.done():
+                        future.set_exception(e)
+                    # A cancelled call only fails its own submission; keep
+                    # draining unless this worker itself was cancelled
+                    if asyncio.current_task().cancelling():
+                        raise
+                    continue
+                
+                self._record(key, loop.time() - start)
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self._workers.discard(asyncio.current_task())
+    
+    def _record(self, key: Hashable, duration: float):
+        """Fold a measured duration into the moving average for a key"""
+        estimate = self._estimates.get(key)
+        if estimate is None:
+            self._estimates[key] = duration
+        else:
+            self._estimates[key] = estimate + self.alpha * (duration - estimate)
@@ -4,8 +4,9 @@ SEO Optimization Task for AI Content Studio
 This task handles SEO optimization workflows.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Optional, List
 from .base_task import BaseTask
+from .results import MetaTagsResult, SEOOptimizationResult
 from app.agents.seo_agent import SEOAgent
 
 
@@ -32,7 +33,7 @@ class SEOOptimizationTask(BaseTask):
                         content: str,
                         target_keywords: List[str],
                         content_type: str = "article",
-                        target_audience: str = "general") -> Dict[str, Any]:
+                        target_audience: str = "general") -> SEOOptimizationResult:
         """
         Optimize content for SEO
         
@@ -43,7 +44,7 @@ class SEOOptimizationTask(BaseTask):
             target_audience: Target audience
             
         Returns:
-            Dict containing SEO optimization results
+            Result containing SEO optimization results
         """
         seo_result = self.seo_agent.optimize_content(
             content=content,
@@ -52,17 +53,16 @@ class SEOOptimizationTask(BaseTask):
             target_audience=target_audience
         )
         
-        return {
-            "seo_data": seo_result,
-            "original_content": content,
-            "optimization_timestamp": self._get_timestamp(),
-            "status": "optimized"
-        }
+        return SEOOptimizationResult(
+            seo_data=seo_result,
+            original_content=content,
+            optimization_timestamp=self._get_timestamp()
+        )
     
     def generate_meta_tags(self, 
                           content: str,
                           target_keywords: List[str],
-                          content_type: str = "article") -> Dict[str, Any]:
+                          content_type: str = "article") -> MetaTagsResult:
         """
         Generate meta tags for content
         
@@ -72,7 +72,7 @@ class SEOOptimizationTask(BaseTask):
             content_type: Type of content
             
         Returns:
-            Dict containing meta tags
+            Result containing meta tags
         """
         meta_tags = self.seo_agent.generate_meta_tags(
             content=content,
@@ -80,14 +80,8 @@ class SEOOptimizationTask(BaseTask):
             content_type=content_type
         )
         
-        return {
-            "meta_tags": meta_tags,
-            "content": content,
-            "generation_timestamp": self._get_timestamp(),
-            "status": "meta_tags_generated"
-        }
-    
-    def _get_timestamp(self) -> str:
-        """Get current timestamp"""
-        from datetime import datetime
-        return datetime.now().isoformat() 
\ No newline at end of file
+        return MetaTagsResult(
+            meta_tags=meta_tags,
+            content=content,
+            generation_timestamp=self._get_timestamp()
+        )
\ No newline at end of file
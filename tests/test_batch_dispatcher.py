@@ -0,0 +1,53 @@
+"""
+Tests for the LLM batch dispatcher
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("langchain_core")
+
+from app.agents.batch_dispatcher import BatchDispatcher, dispatch_sync  # noqa: E402
+
+
+class FakeLLM:
+    """Chat model stub that records its batches and echoes each request"""
+    
+    def __init__(self, fail_on=None):
+        self.batches = []
+        self.fail_on = fail_on
+    
+    async def abatch(self, inputs, return_exceptions=False):
+        self.batches.append(list(inputs))
+        await asyncio.sleep(0)
+        return [ValueError(item) if item == self.fail_on else f"echo {item}" for item in inputs]
+
+
+def test_coalesces_concurrent_requests():
+    llm = FakeLLM()
+    
+    async def main():
+        dispatcher = BatchDispatcher(llm, max_batch=3, max_wait=0.05)
+        return await asyncio.gather(*(dispatcher.submit(str(i)) for i in range(5)))
+    
+    assert asyncio.run(main()) == [f"echo {i}" for i in range(5)]
+    assert [len(batch) for batch in llm.batches] == [3, 2]
+
+
+def test_errors_reach_only_their_request():
+    llm = FakeLLM(fail_on="bad")
+    
+    async def main():
+        dispatcher = BatchDispatcher(llm, max_wait=0.01)
+        return await asyncio.gather(dispatcher.submit("good"), dispatcher.submit("bad"), return_exceptions=True)
+    
+    good, bad = asyncio.run(main())
+    assert good == "echo good"
+    assert isinstance(bad, ValueError)
+    assert len(llm.batches) == 1
+
+
+def test_dispatch_sync():
+    llm = FakeLLM()
+    assert dispatch_sync(llm, "hello", max_wait=0.0) == "echo hello"
@@ -0,0 +1,105 @@
+"""
+Tests for the keyword scanner backends
+
+Every backend must classify lines exactly like the regex fallback, which is
+always available and serves as the reference.
+"""
+
+import pytest
+
+from app.agents import keyword_scanner
+from app.agents.keyword_scanner import KeywordScanner
+
+KEYWORDS = {
+    "suggestions": ("suggest", "improve", "consider", "try"),
+    "positive_aspects": ("good", "excellent", "strong", "effective"),
+    # "improve" and "fix" belong to two buckets each
+    "errors": ("error", "incorrect", "wrong", "fix", "improve"),
+    "fixes": ("fix", "fixed")
+}
+BUCKETS = tuple(KEYWORDS)
+
+TEXTS = [
+    "",
+    "   \n\t\n",
+    "No keywords here",
+    "GOOD work overall\nPlease FIX the Incorrect date\n\nConsider a stronger TITLE",
+    "  You should Try to Improve the intro  \nthe outro is fine",
+    "Excellent!\r\nWRONG tense in line 3\r\n",
+    "Ärger über den Error\nÜberall: sehr Effective\nnaïve suggestion",
+    "keyword at the very end: fix",
+    "fixed\nfix\nprefix and suffix"
+]
+
+
+def _backends():
+    """Backends available in this environment, fastest first"""
+    names = []
+    if keyword_scanner._scan_kernel is not None:
+        names.append("kernel")
+    if keyword_scanner.hyperscan is not None:
+        names.append("hyperscan")
+    if keyword_scanner.ahocorasick is not None:
+        names.append("ahocorasick")
+    return names
+
+
+def _scanner(monkeypatch, backend: str) -> KeywordScanner:
+    """Build a scanner that uses the given backend"""
+    if backend != "kernel":
+        monkeypatch.setattr(keyword_scanner, "_scan_kernel", None)
+    if backend not in ("kernel", "hyperscan"):
+        monkeypatch.setattr(keyword_scanner, "hyperscan", None)
+    if backend not in ("kernel", "hyperscan", "ahocorasick"):
+        monkeypatch.setattr(keyword_scanner, "ahocorasick", None)
+    return KeywordScanner(KEYWORDS)
+
+
+def test_backend_selection(monkeypatch):
+    assert not _scanner(monkeypatch, "regex")._native
+    monkeypatch.undo()
+    for backend in _backends():
+        scanner = _scanner(monkeypatch, backend)
+        assert scanner._native
+        assert (scanner._tables is not None) == (backend == "kernel")
+        assert (scanner._database is not None) == (backend == "hyperscan")
+        assert (scanner._automaton is not None) == (backend == "ahocorasick")
+        monkeypatch.undo()
+
+
+def test_regex_reference():
+    found = _regex_scan(TEXTS[3])
+    assert found["positive_aspects"] == ["GOOD work overall", "Consider a stronger TITLE"]
+    assert found["errors"] == ["Please FIX the Incorrect date"]
+    assert found["fixes"] == ["Please FIX the Incorrect date"]
+    assert found["suggestions"] == ["Consider a stronger TITLE"]
+
+
+def _regex_scan(text: str):
+    """Scan with the regex fallback"""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        return _scanner(monkeypatch, "regex").scan(text, BUCKETS)
+
+
+@pytest.mark.parametrize("backend", _backends())
+@pytest.mark.parametrize("text", TEXTS)
+def test_scan_matches_regex(monkeypatch, backend, text):
+    expected = _regex_scan(text)
+    assert _scanner(monkeypatch, backend).scan(text, BUCKETS) == expected
+
+
+@pytest.mark.parametrize("backend", _backends() + ["regex"])
+def test_scan_line_matches_scan(monkeypatch, backend):
+    scanner = _scanner(monkeypatch, backend)
+    for text in TEXTS:
+        found = {name: [] for name in BUCKETS}
+        for line in text.split('\n'):
+            scanner.scan_line(line, BUCKETS, found)
+        assert found == scanner.scan(text, BUCKETS)
+
+
+@pytest.mark.parametrize("backend", _backends() + ["regex"])
+def test_scan_subset_of_buckets(monkeypatch, backend):
+    scanner = _scanner(monkeypatch, backend)
+    found = scanner.scan("Try to improve\nthis is wrong", ("errors",))
+    assert found == {"errors": ["Try to improve", "this is wrong"]}
@@ -0,0 +1,69 @@
+"""
+Tests for the LLM rate limiter
+"""
+
+import asyncio
+import types
+
+import pytest
+
+from app.agents import rate_limiter
+from app.agents.rate_limiter import RateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake clock whose sleeps advance time instantly and are recorded"""
+    fake = types.SimpleNamespace(now=100.0, sleeps=[])
+    
+    def sleep(seconds):
+        fake.sleeps.append(seconds)
+        fake.now += seconds
+    
+    async def asleep(seconds):
+        sleep(seconds)
+    
+    monkeypatch.setattr(rate_limiter, "time", types.SimpleNamespace(monotonic=lambda: fake.now, sleep=sleep))
+    monkeypatch.setattr(rate_limiter.asyncio, "sleep", asleep)
+    return fake
+
+
+def test_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        RateLimiter(0)
+
+
+def test_burst_then_spaced(clock):
+    limiter = RateLimiter(rate=3, per=6.0)
+    for _ in range(3):
+        limiter.acquire()
+    assert clock.sleeps == []
+    
+    # Once the burst is used up, requests are spaced per / rate seconds apart
+    limiter.acquire()
+    limiter.acquire()
+    assert clock.sleeps == [pytest.approx(2.0), pytest.approx(2.0)]
+
+
+def test_idle_time_refills_burst(clock):
+    limiter = RateLimiter(rate=2, per=4.0)
+    for _ in range(3):
+        limiter.acquire()
+    assert len(clock.sleeps) == 1
+    
+    clock.now += 4.0
+    limiter.acquire()
+    limiter.acquire()
+    assert len(clock.sleeps) == 1
+
+
+def test_async_acquire_shares_slots(clock):
+    limiter = RateLimiter(rate=2, per=2.0)
+    limiter.acquire()
+    
+    async def main():
+        await limiter.aacquire()
+        await limiter.aacquire()
+    
+    asyncio.run(main())
+    assert clock.sleeps == [pytest.approx(1.0)]
@@ -0,0 +1,101 @@
+"""
+Tests for the task scheduler
+"""
+
+import asyncio
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+# Loaded by path: importing the app.tasks package pulls in CrewAI through the tasks
+_spec = importlib.util.spec_from_file_location(
+    "scheduler", Path(__file__).resolve().parent.parent / "app" / "tasks" / "scheduler.py"
+)
+scheduler = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(scheduler)
+TaskScheduler = scheduler.TaskScheduler
+
+
+def _call(order, name, result=None, error=None, gate=None):
+    """Build a task call that records when it runs"""
+    async def call():
+        order.append(name)
+        if gate is not None:
+            await gate.wait()
+        if error is not None:
+            raise error
+        return result if result is not None else name
+    return call
+
+
+def test_runs_shortest_expected_latency_first():
+    async def main():
+        task_scheduler = TaskScheduler(max_concurrency=1)
+        order = []
+        gate = asyncio.Event()
+        
+        # Occupy the only worker so the remaining calls queue up behind it
+        blocker = asyncio.create_task(task_scheduler.submit(_call(order, "blocker", gate=gate), "blocker"))
+        await asyncio.sleep(0)
+        pending = [
+            asyncio.create_task(task_scheduler.submit(_call(order, name), name, expected_latency=latency))
+            for name, latency in (("long", 30.0), ("short", 1.0), ("medium", 5.0), ("short_2", 1.0))
+        ]
+        await asyncio.sleep(0)
+        gate.set()
+        
+        results = await asyncio.wait_for(asyncio.gather(blocker, *pending), 1)
+        return order, results
+    
+    order, results = asyncio.run(main())
+    assert order == ["blocker", "short", "short_2", "medium", "long"]
+    assert results == ["blocker", "long", "short", "medium", "short_2"]
+
+
+def test_uses_recorded_latency():
+    async def main():
+        task_scheduler = TaskScheduler(max_concurrency=1, default_latency=10.0)
+        await task_scheduler.submit(_call([], "fast"), "fast")
+        return task_scheduler
+    
+    task_scheduler = asyncio.run(main())
+    assert task_scheduler.expected_latency("fast") < 1.0
+    assert task_scheduler.expected_latency("unknown") == 10.0
+
+
+@pytest.mark.parametrize("error", [ValueError("bad input"), asyncio.CancelledError()])
+def test_errors_reach_only_their_submitter(error):
+    async def main():
+        task_scheduler = TaskScheduler(max_concurrency=1)
+        order = []
+        failing = asyncio.create_task(task_scheduler.submit(_call(order, "failing", error=error), "failing", 1.0))
+        following = asyncio.create_task(task_scheduler.submit(_call(order, "following"), "following", 2.0))
+        
+        await asyncio.wait([failing, following], timeout=1)
+        return order, failing, following
+    
+    order, failing, following = asyncio.run(main())
+    assert order == ["failing", "following"]
+    with pytest.raises(type(error)):
+        failing.result()
+    assert following.result() == "following"
+
+
+def test_cancelled_worker_stops():
+    async def main():
+        task_scheduler = TaskScheduler(max_concurrency=1)
+        gate = asyncio.Event()
+        submission = asyncio.create_task(task_scheduler.submit(_call([], "slow", gate=gate), "slow"))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        
+        (worker,) = task_scheduler._workers
+        worker.cancel()
+        await asyncio.wait([worker, submission], timeout=1)
+        return task_scheduler, worker, submission
+    
+    task_scheduler, worker, submission = asyncio.run(main())
+    assert worker.cancelled()
+    assert submission.cancelled()
+    assert not task_scheduler._workers
@@ -0,0 +1,159 @@
+"""
+Tests for the semantic cache tiers
+
+Prompts are embedded with fixed vectors instead of the sentence-transformer
+model, so similarities are known exactly.
+"""
+
+import hashlib
+import zlib
+
+import numpy as np
+import pytest
+
+from app.agents.semantic_cache import EMBEDDING_DIM, SemanticCache
+
+
+def _vector(*components: float) -> np.ndarray:
+    """Normalized embedding with the given leading components"""
+    vector = np.zeros(EMBEDDING_DIM, dtype=np.float32)
+    vector[:len(components)] = components
+    return vector / np.linalg.norm(vector)
+
+
+def _truncating_embed(self, prompt: str) -> np.ndarray:
+    """Bag-of-words embedding that, like the model, ignores words after its input limit"""
+    vector = np.zeros(EMBEDDING_DIM, dtype=np.float32)
+    for word in self.normalize(prompt).split()[:MODEL_MAX_TOKENS]:
+        vector[zlib.crc32(word.encode()) % EMBEDDING_DIM] += 1.0
+    return vector / np.linalg.norm(vector)
+
+
+# Input limit of the embedding model, in tokens
+MODEL_MAX_TOKENS = 256
+
+ARTICLE = " ".join(f"sentence{i}" for i in range(300))
+REVISED_ARTICLE = ARTICLE + " with a rewritten ending"
+
+EMBEDDINGS = {
+    "write about cats": _vector(1.0),
+    "write an article about cats": _vector(1.0, 0.2),
+    "write about dogs": _vector(0.0, 1.0),
+    "write about birds": _vector(0.0, 0.0, 1.0)
+}
+
+
+@pytest.fixture(autouse=True)
+def fixed_embeddings(monkeypatch):
+    monkeypatch.setattr(SemanticCache, "embed", lambda self, prompt: EMBEDDINGS[self.normalize(prompt)])
+
+
+def _store(cache: SemanticCache, prompt: str, *args: str):
+    *scope, response = args
+    response_found, embedding = cache.lookup(prompt, *scope)
+    assert response_found is None
+    cache.add(embedding, response)
+
+
+def test_hit_on_similar_prompt():
+    cache = SemanticCache(threshold=0.9)
+    _store(cache, "write about cats", "cats")
+    
+    assert cache.lookup("  Write about   CATS ")[0] == "cats"
+    assert cache.lookup("write an article about cats")[0] == "cats"
+    assert cache.lookup("write about dogs")[0] is None
+
+
+def test_evicts_least_recently_used():
+    cache = SemanticCache(threshold=0.9, max_entries=2)
+    _store(cache, "write about cats", "cats")
+    _store(cache, "write about dogs", "dogs")
+    assert cache.lookup("write about cats")[0] == "cats"
+    
+    _store(cache, "write about birds", "birds")
+    assert len(cache) == 2
+    assert cache.lookup("write about dogs")[0] is None
+    assert cache.lookup("write about cats")[0] == "cats"
+
+
+def test_hot_entries_survive_restart(tmp_path):
+    cache = SemanticCache(threshold=0.9, path=str(tmp_path))
+    _store(cache, "write about cats", "cats")
+    _store(cache, "write about dogs", "dogs")
+    assert cache.lookup("write about cats")[0] == "cats"
+    cache.close()
+    
+    # Only entries hit since they were added are promoted to the on-disk tier
+    reopened = SemanticCache(threshold=0.9, path=str(tmp_path))
+    assert len(reopened.ltm) == 1
+    assert reopened.lookup("write an article about cats")[0] == "cats"
+    assert len(reopened) == 1
+    assert reopened.lookup("write about dogs")[0] is None
+    reopened.close()
+
+
+def test_on_disk_tier_evicts_least_frequently_used(tmp_path):
+    cache = SemanticCache(threshold=0.9, path=str(tmp_path), ltm_entries=2)
+    ltm = cache.ltm
+    quantized = {prompt: cache.quantize(embedding) for prompt, embedding in EMBEDDINGS.items()}
+    
+    ltm.store([(quantized["write about cats"], "cats", 5), (quantized["write about dogs"], "dogs", 1)])
+    ltm.store([(quantized["write about birds"], "birds", 2)])
+    
+    assert len(ltm) == 2
+    assert ltm.search(quantized["write about cats"], 0.9) == "cats"
+    assert ltm.search(quantized["write about birds"], 0.9) == "birds"
+    assert ltm.search(quantized["write about dogs"], 0.9) is None
+    cache.close()
+
+
+def _review_prompt(article: str, review_focus: list) -> str:
+    return f"Review the following article:\n{article}\n\nFocus areas for review: {', '.join(review_focus)}"
+
+
+def _review_key(article: str, review_focus: list):
+    content_hash = hashlib.sha256(article.encode()).hexdigest()
+    return SemanticCache.key("article", content=content_hash, review_focus=review_focus)
+
+
+def test_key_ignores_order_and_spacing():
+    assert SemanticCache.key("AI tools", audience=" General ", focus=["Style", "grammar"]) == \
+        SemanticCache.key("AI tools", focus=["grammar", "style"], audience="general")
+
+
+def test_whole_prompts_differing_late_collide(monkeypatch):
+    monkeypatch.setattr(SemanticCache, "embed", _truncating_embed)
+    cache = SemanticCache(threshold=0.93)
+    _store(cache, _review_prompt(ARTICLE, ["grammar"]), "grammar review")
+    
+    # Everything after the model's input limit is invisible to the embedding
+    assert cache.lookup(_review_prompt(ARTICLE, ["style"]))[0] == "grammar review"
+    assert cache.lookup(_review_prompt(REVISED_ARTICLE, ["grammar"]))[0] == "grammar review"
+
+
+def test_keys_differing_in_any_field_do_not_share_entries(monkeypatch):
+    monkeypatch.setattr(SemanticCache, "embed", _truncating_embed)
+    cache = SemanticCache(threshold=0.87)
+    response, embedding = cache.lookup(*_review_key(ARTICLE, ["grammar", "style"]))
+    cache.add(embedding, "grammar and style review")
+    
+    assert cache.lookup(*_review_key(ARTICLE, ["style", "grammar"]))[0] == "grammar and style review"
+    assert cache.lookup(*_review_key(ARTICLE, ["grammar"]))[0] is None
+    assert cache.lookup(*_review_key(REVISED_ARTICLE, ["grammar", "style"]))[0] is None
+
+
+def test_scopes_separate_identical_text(monkeypatch):
+    monkeypatch.setattr(SemanticCache, "embed", _truncating_embed)
+    cache = SemanticCache(threshold=0.87)
+    basic = SemanticCache.key("AI writing tools", research_depth="basic")
+    in_depth = SemanticCache.key("AI writing tools", research_depth="in-depth")
+    _store(cache, *basic, "basic research")
+    
+    assert cache.lookup("ai  writing TOOLS", basic[1])[0] == "basic research"
+    assert cache.lookup(*in_depth)[0] is None
+    
+    # Scoped embeddings of the same text are close to orthogonal
+    basic_query = cache.lookup(*basic)[1].astype(np.int32)
+    in_depth_query = cache.lookup(*in_depth)[1].astype(np.int32)
+    similarity = basic_query @ in_depth_query / np.linalg.norm(basic_query) / np.linalg.norm(in_depth_query)
+    assert abs(similarity) < 0.3